@@ -0,0 +1,99 @@
+"""
+Compares schema-aware `DynamicValue` decoding with `msgpack.loads` followed by `deepcopy` done by handlers
+of the example provider, and schema-driven encoding with completing a copy of the state by hand before `packb`.
+
+    $ python -m benchmarks.codec [--items 5000] [--runs 20]
+"""
+import argparse
+import json
+import timeit
+from copy import deepcopy
+
+import msgpack
+
+from terraform_plugin import codec
+from terraform_plugin.proto.tfplugin54_pb2 import Schema
+
+BLOCK = Schema.Block(
+    attributes=[
+        Schema.Attribute(name='id', type=b'"string"', computed=True),
+        Schema.Attribute(name='name', type=b'"string"', required=True),
+        Schema.Attribute(name='tags', type=json.dumps(['map', 'string']).encode(), optional=True),
+    ],
+    block_types=[
+        Schema.NestedBlock(
+            type_name='rule',
+            nesting=Schema.NestedBlock.LIST,
+            block=Schema.Block(attributes=[
+                Schema.Attribute(name='description', type=b'"string"', optional=True),
+                Schema.Attribute(name='port', type=b'"number"', required=True),
+                Schema.Attribute(name='weight', type=b'"number"', optional=True),
+                Schema.Attribute(name='enabled', type=b'"bool"', optional=True),
+                Schema.Attribute(name='cidrs', type=json.dumps(['set', 'string']).encode(), optional=True),
+                Schema.Attribute(name='labels', type=json.dumps(['map', 'string']).encode(), optional=True),
+            ]),
+        ),
+    ],
+)
+
+
+def make_state(items: int) -> bytes:
+    rules = [
+        dict(
+            description=f'rule number {i}',
+            port=i,
+            weight=i / 7,
+            enabled=bool(i % 2),
+            cidrs=[f'10.{i % 256}.0.0/16', f'10.{i % 256}.1.0/24'],
+            labels=dict(team='platform', index=str(i)),
+        )
+        for i in range(items)
+    ]
+    # the last rule is planned, its values are unknown
+    rules[-1].update(port=codec.Unknown, weight=codec.Unknown)
+    state = dict(id='example', name='example', tags=dict(env='benchmark'), rule=rules)
+    return codec.packb(state)
+
+
+def naive(data: bytes):
+    return deepcopy(msgpack.unpackb(data, raw=False))
+
+
+def naive_encode(state: dict) -> bytes:
+    # every attribute and block has to be present, Terraform rejects incomplete objects
+    rules = [
+        {**dict.fromkeys(('description', 'port', 'weight', 'enabled', 'cidrs', 'labels')), **rule}
+        for rule in state['rule']
+    ]
+    return codec.packb({**dict.fromkeys(('id', 'name', 'tags')), **state, 'rule': rules})
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.codec')
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    data = make_state(args.items)
+    block_codec = codec.BlockCodec(BLOCK)
+    assert block_codec.decode_msgpack(data)['rule'][-1]['port'] is codec.Unknown
+
+    state = block_codec.decode_msgpack(data)
+    for rule in state['rule']:
+        del rule['description']
+    assert codec.unpackb(block_codec.encode_msgpack(state)) == codec.unpackb(naive_encode(state))
+
+    results = dict(
+        decode_naive=timeit.timeit(lambda: naive(data), number=args.runs),
+        decode=timeit.timeit(lambda: block_codec.decode_msgpack(data), number=args.runs),
+        encode_naive=timeit.timeit(lambda: naive_encode(state), number=args.runs),
+        encode=timeit.timeit(lambda: block_codec.encode_msgpack(state), number=args.runs),
+    )
+    print(f'{len(data) / 1024:.0f} KiB state with {args.items} nested blocks')
+    for name, total in results.items():
+        baseline = results[name.replace('_naive', '') + '_naive']
+        print(f'{name:<14} {total / args.runs * 1000:>8.2f} ms {baseline / total:>6.1f}x')
+
+
+if __name__ == '__main__':
+    main()
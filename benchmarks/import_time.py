@@ -0,0 +1,82 @@
+"""
+Enforces import time budget of `terraform_plugin.server`, the module every provider process loads on startup.
+
+    $ python -m benchmarks.import_time [--budget-ms 250] [--runs 10]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+repo_dir = Path(__file__).absolute().parent.parent
+src_dir = repo_dir / 'src'
+
+MODULE = 'terraform_plugin.server'
+# imported only on code paths which need them
+LAZY_MODULES = ('cryptography',)
+DEFAULT_BUDGET_MS = 250
+
+_importtime = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$')
+
+probe = f'''
+import sys
+import {MODULE}
+print(','.join(name for name in {LAZY_MODULES!r} if name in sys.modules))
+'''
+
+
+def measure(module: str = MODULE):
+    """
+    :return: cumulative import time in microseconds and eagerly imported lazy modules
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (str(src_dir), env.get('PYTHONPATH'))))
+    env.pop('PLUGIN_CLIENT_CERT', None)
+    proc = subprocess.run(
+        (sys.executable, '-X', 'importtime', '-c', probe),
+        env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, universal_newlines=True,
+    )
+    cumulative = None
+    for line in proc.stderr.splitlines():
+        match = _importtime.match(line)
+        if match and match.group(4) == module:
+            cumulative = int(match.group(2))
+    eager = [name for name in proc.stdout.strip().split(',') if name]
+    return cumulative, eager
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.import_time')
+    parser.add_argument('--budget-ms', type=float,
+                        default=float(os.getenv('IMPORT_TIME_BUDGET_MS', DEFAULT_BUDGET_MS)))
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    # first run warms up bytecode and filesystem caches
+    measure()
+    samples = []
+    eager = set()
+    for _ in range(args.runs):
+        cumulative, imported = measure()
+        samples.append(cumulative / 1000)
+        eager.update(imported)
+
+    median = statistics.median(samples)
+    print(f'import {MODULE}: median {median:.1f} ms, min {min(samples):.1f} ms, max {max(samples):.1f} ms'
+          f' over {args.runs} runs, budget {args.budget_ms:.1f} ms')
+
+    failed = False
+    if eager:
+        print(f'FAIL: eagerly imported {", ".join(sorted(eager))}')
+        failed = True
+    if median > args.budget_ms:
+        print(f'FAIL: over budget by {median - args.budget_ms:.1f} ms')
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Compares per-algorithm cost of TLS identity generation done on every secure provider start.
+
+    $ python -m benchmarks.keygen [--runs 50]
+"""
+import argparse
+import timeit
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from terraform_plugin import crypto
+
+BASELINE = 'P521'
+PAYLOAD = b'x' * 256
+
+
+def sign(key, data: bytes = PAYLOAD):
+    return key.sign(data, ec.ECDSA(hashes.SHA256()))
+
+
+def measure(algorithm: str, runs: int):
+    """
+    :return: milliseconds per key generation, signature and full identity (key and certificate)
+    """
+    key, _ = crypto.generate_private_key(algorithm)
+    keygen = timeit.timeit(lambda: crypto.generate_private_key(algorithm), number=runs)
+    signing = timeit.timeit(lambda: sign(key), number=runs)
+    identity = timeit.timeit(lambda: crypto.generate_identity(algorithm), number=runs)
+    return tuple(total / runs * 1000 for total in (keygen, signing, identity))
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.keygen')
+    parser.add_argument('--runs', type=int, default=50)
+    args = parser.parse_args()
+
+    results = {
+        algorithm: measure(algorithm, args.runs)
+        for algorithm in crypto.KeyAlgorithms
+    }
+    baseline = results[BASELINE][2]
+    print(f'{"algorithm":<10} {"keygen ms":>10} {"sign ms":>10} {"identity ms":>12} {"vs " + BASELINE:>8}')
+    for algorithm, (keygen, signing, identity) in results.items():
+        print(f'{algorithm:<10} {keygen:>10.3f} {signing:>10.3f} {identity:>12.3f} {baseline / identity:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Compares decoding the whole state with `BlockCodec` and reading a few values of a `lazy.LazyMap` view,
+as a `read` handler checking a couple of attributes does, followed by encoding the unmodified state.
+
+    $ python -m benchmarks.lazy [--items 5000] [--runs 20]
+"""
+import argparse
+import timeit
+
+from benchmarks.codec import BLOCK, make_state
+from terraform_plugin import codec, lazy
+from terraform_plugin.proto.tfplugin54_pb2 import DynamicValue
+
+
+def read(state) -> tuple:
+    return state['name'], state['tags'].get('env'), state['rule'][3]['port']
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.lazy')
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    block_codec = codec.BlockCodec(BLOCK)
+    lazy_codec = lazy.LazyCodec(BLOCK, block_codec)
+    # canonical encoding, as Terraform sends it
+    value = block_codec.encode(block_codec.decode_msgpack(make_state(args.items)))
+    assert read(block_codec.decode(value)) == read(lazy_codec.decode(value))
+    assert lazy_codec.decode(value) == block_codec.decode(value)
+
+    def eager():
+        state = block_codec.decode(value)
+        read(state)
+        return block_codec.encode(state)
+
+    def view():
+        state = lazy_codec.decode(value)
+        read(state)
+        assert not state.modified
+        return DynamicValue(msgpack=bytes(state.raw()))
+
+    assert eager() == view()
+    print(f'{len(value.msgpack) / 1024:.0f} KiB state with {args.items} nested blocks')
+    baseline = None
+    for function in (eager, view):
+        total = timeit.timeit(function, number=args.runs)
+        baseline = baseline or total
+        print(f'{function.__name__:<6} {total / args.runs * 1000:>8.3f} ms {baseline / total:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Compares decoding and encoding numeric lists and maps element by element with checking all elements at once
+(falling back to the former only when some of them aren't int64/float64).
+
+    $ python -m benchmarks.numbers [--items 100000] [--runs 20]
+"""
+import argparse
+import json
+import timeit
+
+from terraform_plugin import codec
+from terraform_plugin.proto.tfplugin54_pb2 import Schema
+
+BLOCK = Schema.Block(attributes=[
+    Schema.Attribute(name='samples', type=json.dumps(['list', 'number']).encode(), optional=True),
+    Schema.Attribute(name='weights', type=json.dumps(['map', 'number']).encode(), optional=True),
+])
+
+
+def make_state(items: int) -> dict:
+    return dict(
+        samples=[i if i % 2 else i + 0.5 for i in range(items)],
+        weights={f'key{i}': i / 8 for i in range(items // 10)},
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.numbers')
+    parser.add_argument('--items', type=int, default=100000)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    block_codec = codec.BlockCodec(BLOCK)
+    state = make_state(args.items)
+    data = block_codec.encode_msgpack(state)
+    elementwise = dict(samples=codec._sequence(codec._number), weights=codec._mapping(codec._number))
+    elementwise_encoders = dict(
+        samples=codec._pack_sequence(codec._pack_number), weights=codec._pack_mapping(codec._pack_number))
+    decode_elementwise = codec._known(codec._attributes(elementwise))
+    encode_elementwise = codec._pack_attributes(elementwise_encoders)
+
+    def decode_naive():
+        return decode_elementwise(codec.unpackb(data))
+
+    def encode_naive():
+        packer = codec._packer()
+        encode_elementwise(packer, state)
+        return packer.bytes()
+
+    assert decode_naive() == block_codec.decode_msgpack(data) == state
+    assert encode_naive() == data
+
+    results = dict(
+        decode_naive=timeit.timeit(decode_naive, number=args.runs),
+        decode=timeit.timeit(lambda: block_codec.decode_msgpack(data), number=args.runs),
+        encode_naive=timeit.timeit(encode_naive, number=args.runs),
+        encode=timeit.timeit(lambda: block_codec.encode_msgpack(state), number=args.runs),
+    )
+    print(f'{len(data) / 1024:.0f} KiB state with {args.items} numbers in a list and {args.items // 10} in a map')
+    for name, total in results.items():
+        baseline = results[name.replace('_naive', '') + '_naive']
+        print(f'{name:<14} {total / args.runs * 1000:>8.2f} ms {baseline / total:>6.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Compares encoding states with a new `msgpack.Packer` per call and with one packer reused between calls,
+by throughput at several state sizes.
+
+    $ python -m benchmarks.packer [--runs 20]
+"""
+import argparse
+import timeit
+
+from benchmarks.codec import BLOCK, make_state
+from terraform_plugin import codec
+
+SIZES = {'1 KB': 2 ** 10, '100 KB': 100 * 2 ** 10, '10 MB': 10 * 2 ** 20}
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.packer')
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    block_codec = codec.BlockCodec(BLOCK)
+    encode = block_codec._encode
+    rule_size = len(make_state(101)) - len(make_state(100))
+    packer = codec._packer()
+
+    def fresh(state) -> bytes:
+        return codec._encode(encode, state)
+
+    def reused(state) -> bytes:
+        encode(packer, state)
+        data = packer.bytes()
+        packer.reset()
+        return data
+
+    for name, size in SIZES.items():
+        state = block_codec.decode_msgpack(make_state(max(1, size // rule_size)))
+        assert fresh(state) == reused(state)
+        encoded = len(fresh(state))
+        runs = max(1, args.runs * 2 ** 20 // max(encoded, 2 ** 20))
+        print(f'{name} state, {encoded / 1024:.0f} KiB')
+        baseline = None
+        for function in (fresh, reused):
+            total = min(timeit.repeat(lambda: function(state), number=runs, repeat=5))
+            baseline = baseline or total
+            print(f'  {function.__name__:<6} {total / runs * 1000:>10.3f} ms '
+                  f'{encoded * runs / total / 2 ** 20:>8.1f} MiB/s {baseline / total:>6.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Compares merging prior and proposed state with `deepcopy` and `state.merge`, changing a single nested attribute
+of the result, by time and memory allocated.
+
+    $ python -m benchmarks.state [--items 5000] [--runs 20]
+"""
+import argparse
+import timeit
+import tracemalloc
+from copy import deepcopy
+
+from benchmarks.codec import BLOCK, make_state
+from terraform_plugin import codec, state
+
+
+def naive(prior: dict, proposed: dict) -> dict:
+    planned = deepcopy(prior)
+    planned.update(deepcopy(proposed))
+    planned['rule'][3]['port'] = 443
+    return planned
+
+
+def cow(prior: dict, proposed: dict) -> dict:
+    planned = state.merge(prior, proposed)
+    planned['rule'][3]['port'] = 443
+    return planned
+
+
+def allocated(function, *args) -> int:
+    tracemalloc.start()
+    try:
+        function(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.state')
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    block_codec = codec.BlockCodec(BLOCK)
+    data = make_state(args.items)
+    prior = block_codec.decode_msgpack(data)
+    proposed = block_codec.decode_msgpack(data)
+    proposed['tags'] = {'env': 'changed'}
+    assert block_codec.encode_msgpack(naive(prior, proposed)) == block_codec.encode_msgpack(cow(prior, proposed))
+    assert prior['rule'][3]['port'] == 3
+
+    print(f'{len(data) / 1024:.0f} KiB state with {args.items} nested blocks')
+    baseline = None
+    for function in (naive, cow):
+        total = timeit.timeit(lambda: function(prior, proposed), number=args.runs)
+        baseline = baseline or total
+        print(f'{function.__name__:<6} {total / args.runs * 1000:>8.3f} ms {baseline / total:>8.1f}x '
+              f'{allocated(function, prior, proposed) / 1024:>10.1f} KiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -87,9 +87,9 @@ def ensure_packages():
     exec_shell(pip_install_command, self_command)
 
 
-def ensure_protobuf(filename='tfplugin5.1.proto'):
+def ensure_protobuf(filename='tfplugin5.4.proto', ref='v1.6.0'):
     import requests
-    url = f'https://raw.githubusercontent.com/hashicorp/terraform/master/docs/plugin-protocol/{filename}'
+    url = f'https://raw.githubusercontent.com/hashicorp/terraform/{ref}/docs/plugin-protocol/{filename}'
     response = requests.get(url)
     response.raise_for_status()
 
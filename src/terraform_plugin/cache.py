@@ -0,0 +1,74 @@
+"""
+User-private on-disk cache shared by concurrently starting provider processes.
+"""
+import contextlib
+import logging
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from terraform_plugin import constants
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover, Windows
+    fcntl = None  # type: ignore[assignment]
+
+log = logging.getLogger(__name__)
+
+
+def get_cache_dir(*parts: str) -> Optional[Path]:
+    """
+    :return: directory readable only by current user or `None` when it can't be used safely
+    """
+    base = os.getenv(constants.CacheDirKey)
+    if base:
+        path = Path(base)
+    else:
+        path = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'terraform-plugin-python'
+    path = path.joinpath(*parts)
+
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = path.stat()
+    except OSError as e:
+        log.warning(f'cache directory {path} is not available: {e}')
+        return None
+
+    if hasattr(os, 'getuid') and (info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) & 0o077):
+        log.warning(f'cache directory {path} must be owned and accessible only by current user, not using it')
+        return None
+    return path
+
+
+@contextlib.contextmanager
+def locked(path: Path):
+    """
+    Exclusive lock over `path` held across processes, the file itself is left untouched.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    fd = os.open(str(path.with_name(path.name + '.lock')), os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path: Path, data: bytes):
+    """
+    Readers see either the previous or the new content, never a partial write.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f'.{path.name}.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
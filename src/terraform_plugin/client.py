@@ -3,11 +3,10 @@ import subprocess
 from pathlib import Path
 
 import grpc
-from cryptography.hazmat.primitives import serialization
 
-from terraform_plugin.proto.tfplugin51_pb2 import GetProviderSchema
-from terraform_plugin.proto.tfplugin51_pb2_grpc import ProviderStub
-from terraform_plugin import constants, crypto
+from terraform_plugin.proto.tfplugin54_pb2 import GetProviderSchema
+from terraform_plugin.proto.tfplugin54_pb2_grpc import ProviderStub
+from terraform_plugin import constants
 
 
 def start_plugin(path: Path, secure=False):
@@ -20,8 +19,10 @@ def start_plugin(path: Path, secure=False):
     }
 
     if secure:
-        private_key, private_key_bytes = crypto.generate_private_key()
-        certificate = crypto.generate_certificate(private_key)
+        from cryptography.hazmat.primitives import serialization
+        from terraform_plugin import crypto
+
+        private_key, private_key_bytes, certificate = crypto.get_identity('client')
         certificate_bytes: bytes = certificate.public_bytes(serialization.Encoding.PEM)
         env[constants.PluginCertKey] = certificate_bytes.decode()
 
@@ -44,7 +45,10 @@ def start_plugin(path: Path, secure=False):
 
     assert int(protocol_version) == constants.DefaultProtocolVersion
     assert protocol_type == 'grpc'
-    channel_address = f'{network_type}:{network_address}'
+    if network_type == 'unix':
+        channel_address = f'unix:{network_address}'
+    else:
+        channel_address = network_address
 
     if secure:
         server_certificate_base64, *_ = remainder
@@ -61,7 +65,10 @@ def start_plugin(path: Path, secure=False):
             private_key=private_key_bytes,
             certificate_chain=certificate_bytes,
         )
-        channel = grpc.secure_channel(channel_address, credentials=credentials)
+        channel = grpc.secure_channel(channel_address, credentials=credentials, options=(
+            # server certificate is issued for `localhost`, not for the IP address or socket path
+            ('grpc.ssl_target_name_override', 'localhost'),
+        ))
     else:
         channel = grpc.insecure_channel(channel_address)
 
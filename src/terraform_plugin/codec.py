@@ -0,0 +1,608 @@
+"""
+Decoding and encoding of `DynamicValue` against schema, following go-cty encodings:
+https://github.com/zclconf/go-cty/blob/v1.8.0/cty/msgpack/unmarshal.go
+https://github.com/zclconf/go-cty/blob/v1.8.0/cty/msgpack/marshal.go
+https://github.com/zclconf/go-cty/blob/v1.8.0/cty/json/unmarshal.go
+
+Decoders are compiled once per schema block, parts of values that come out of msgpack/json already typed
+(strings, bools and collections of them) are not visited at all, objects are converted in place.
+
+Encoders write msgpack straight from mappings or objects holding the values, attributes missing
+from them are written as null. Encoding is canonical, equal values are always written as the same bytes:
+attributes and map keys sorted, elements of primitive sets ordered and numbers in go-cty representation.
+"""
+import json
+import operator
+import types
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import msgpack
+
+from terraform_plugin import cty
+from terraform_plugin.proto.tfplugin54_pb2 import DynamicValue, Schema
+
+Converter = Callable[[Any], Any]
+Encoder = Callable[[msgpack.Packer, Any], None]
+
+# https://github.com/zclconf/go-cty/blob/v1.8.0/cty/msgpack/unknown.go
+UnknownExtCode = 0
+RefinedUnknownExtCode = 12
+UnknownBytes = b'\xd4\x00\x00'
+NullBytes = b'\xc0'
+
+
+class UnknownType:
+    """
+    Value not known until apply, `Unknown` is the only instance.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __repr__(self):
+        return 'Unknown'
+
+    def __reduce__(self):
+        return 'Unknown'
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+Unknown = UnknownType()
+
+
+def _ext_hook(code: int, data: bytes):
+    if code in (UnknownExtCode, RefinedUnknownExtCode):
+        # refinements (known prefix, nullness, ranges) are not tracked
+        return Unknown
+    return msgpack.ExtType(code, data)
+
+
+def _default(value):
+    if value is Unknown:
+        return msgpack.ExtType(UnknownExtCode, b'\x00')
+    if isinstance(value, Decimal):
+        # go-cty accepts numbers not fitting int64/float64 as strings
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f'cannot serialize {value!r}')
+
+
+def parse_number(value: str):
+    if '.' not in value and 'e' not in value and 'E' not in value:
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    return Decimal(value)
+
+
+def _number(value):
+    if type(value) is str:
+        return parse_number(value)
+    return value
+
+
+# numbers not fitting int64/float64 come as strings, collections are checked for them at once
+def _number_sequence(values):
+    if str in map(type, values):
+        for i, value in enumerate(values):
+            if type(value) is str:
+                values[i] = parse_number(value)
+    return values
+
+
+def _number_mapping(values):
+    if str in map(type, values.values()):
+        for key, value in values.items():
+            if type(value) is str:
+                values[key] = parse_number(value)
+    return values
+
+
+def _json_number(value: str):
+    # json numbers are exact, they decode to the same values as numbers go-cty writes to msgpack
+    number = canonical_number(Decimal(value))
+    return Decimal(value) if type(number) is str else number
+
+
+def _known(convert: Converter) -> Converter:
+    def known(value):
+        if value is None or value is Unknown:
+            return value
+        return convert(value)
+
+    return known
+
+
+def _sequence(convert: Converter) -> Converter:
+    def sequence(values):
+        for i, value in enumerate(values):
+            if value is not None and value is not Unknown:
+                values[i] = convert(value)
+        return values
+
+    return sequence
+
+
+def _mapping(convert: Converter) -> Converter:
+    def mapping(values):
+        for key, value in values.items():
+            if value is not None and value is not Unknown:
+                values[key] = convert(value)
+        return values
+
+    return mapping
+
+
+def _attributes(converters: dict) -> Converter:
+    items = tuple(converters.items())
+
+    def attributes(values):
+        for name, convert in items:
+            value = values.get(name)
+            if value is not None and value is not Unknown:
+                values[name] = convert(value)
+        return values
+
+    return attributes
+
+
+def _positional(converters: list) -> Converter:
+    items = tuple((i, convert) for i, convert in enumerate(converters) if convert is not None)
+
+    def positional(values):
+        for i, convert in items:
+            value = values[i]
+            if value is not None and value is not Unknown:
+                values[i] = convert(value)
+        return values
+
+    return positional
+
+
+_converters: Dict[Tuple[cty.Type, bool], Optional[Converter]] = {}
+
+
+def compile_type(type_: cty.Type, use_json: bool = False) -> Optional[Converter]:
+    """
+    :param use_json: convert values decoded from `DynamicValue.json` instead of msgpack
+    :return: converter of a non-null known value, `None` when the decoded value needs no conversion
+    """
+    key = (type_, use_json)
+    try:
+        return _converters[key]
+    except KeyError:
+        pass
+
+    convert: Optional[Converter]
+    if type_ is cty.Number:
+        convert = _number
+    elif type_ is cty.DynamicPseudoType:
+        convert = _dynamic_json if use_json else _dynamic
+    elif type_.is_primitive:
+        convert = None
+    elif isinstance(type_, cty.CollectionType) and type_.element is cty.Number:
+        convert = _number_mapping if isinstance(type_, cty.Map) else _number_sequence
+    elif isinstance(type_, cty.Map):
+        element = compile_type(type_.element, use_json)
+        convert = element and _mapping(element)
+    elif isinstance(type_, cty.CollectionType):
+        element = compile_type(type_.element, use_json)
+        convert = element and _sequence(element)
+    elif isinstance(type_, cty.Object):
+        attributes = {name: compile_type(attribute, use_json) for name, attribute in type_.attributes.items()}
+        converters = {name: convert for name, convert in attributes.items() if convert is not None}
+        convert = _attributes(converters) if converters else None
+    elif isinstance(type_, cty.Tuple):
+        elements = [compile_type(element, use_json) for element in type_.elements]
+        convert = _positional(elements) if any(elements) else None
+    else:
+        raise ValueError(f'unsupported type {type_!r}')
+
+    _converters[key] = convert
+    return convert
+
+
+def _dynamic(value):
+    # https://github.com/zclconf/go-cty/blob/v1.8.0/cty/msgpack/dynamic.go
+    type_, value = value
+    convert = compile_type(cty.parse(type_))
+    if convert is None or value is None or value is Unknown:
+        return value
+    return convert(value)
+
+
+def _dynamic_json(value):
+    convert = compile_type(cty.from_json(value['type']), use_json=True)
+    value = value['value']
+    if convert is None or value is None:
+        return value
+    return convert(value)
+
+
+def compile_block(block: Schema.Block, use_json: bool = False) -> Optional[Converter]:
+    """
+    :return: converter of decoded block object, `None` when it needs no conversion
+    """
+    converters = {
+        attribute.name: compile_type(cty.parse(attribute.type), use_json)
+        for attribute in block.attributes
+    }
+    for nested in block.block_types:
+        convert = compile_block(nested.block, use_json)
+        if convert is None:
+            converters[nested.type_name] = None
+        elif nested.nesting in (Schema.NestedBlock.LIST, Schema.NestedBlock.SET):
+            converters[nested.type_name] = _sequence(convert)
+        elif nested.nesting == Schema.NestedBlock.MAP:
+            converters[nested.type_name] = _mapping(convert)
+        else:
+            converters[nested.type_name] = convert
+
+    converters = {name: convert for name, convert in converters.items() if convert is not None}
+    return _attributes(converters) if converters else None
+
+
+_int64 = 2 ** 63
+
+
+def canonical_number(value):
+    """
+    :return: `value` in the same msgpack representation go-cty would use:
+        int64 if it is integral and fits, float64 if it represents it exactly and string otherwise
+    """
+    kind = type(value)
+    if kind is int:
+        if -_int64 <= value < _int64:
+            return value
+    elif kind is float:
+        if value.is_integer() and -_int64 <= value < _int64:
+            return int(value)
+        return value
+    else:
+        value = Decimal(value)
+        if value == value.to_integral_value():
+            integer = int(value)
+            if -_int64 <= integer < _int64:
+                return integer
+
+    try:
+        number = float(value)
+    except OverflowError:
+        return str(value)
+    if Decimal(number) == value:
+        return number
+    return str(value)
+
+
+def implied_type(value: Any) -> cty.Type:
+    """
+    :return: type of a value assigned to `dynamic` attribute
+    """
+    if value is None or value is Unknown:
+        return cty.DynamicPseudoType
+    if isinstance(value, bool):
+        return cty.Bool
+    if isinstance(value, (int, float, Decimal)):
+        return cty.Number
+    if isinstance(value, str):
+        return cty.String
+    if isinstance(value, Mapping):
+        return cty.Object({name: implied_type(element) for name, element in value.items()})
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return cty.Tuple(implied_type(element) for element in value)
+    raise TypeError(f'cannot infer type of {value!r}')
+
+
+def _pack(packer: msgpack.Packer, value):
+    packer.pack(value)
+
+
+def _pack_number(packer: msgpack.Packer, value):
+    if type(value) is int and -_int64 <= value < _int64:
+        packer.pack(value)
+    elif value is None or value is Unknown:
+        packer.pack(value)
+    else:
+        packer.pack(canonical_number(value))
+
+
+def _native_numbers(values) -> bool:
+    """
+    :return: whether `values` are all written as they are, ints fitting int64 or non-integral floats
+    """
+    kinds = set(map(type, values))
+    if not kinds <= {int, float}:
+        return False
+    mixed = len(kinds) > 1
+    if float in kinds:
+        floats = [value for value in values if type(value) is float] if mixed else values
+        if any(map(float.is_integer, floats)):
+            return False
+    if int in kinds:
+        ints = [value for value in values if type(value) is int] if mixed else values
+        return -_int64 <= min(ints) and max(ints) < _int64
+    return True
+
+
+def _pack_number_sequence(packer: msgpack.Packer, values):
+    if values is None or values is Unknown:
+        packer.pack(values)
+        return
+    if type(values) is not list:
+        # reads `state.CowList` without copying shared values
+        values = list(list.__iter__(values) if isinstance(values, list) else values)
+    if _native_numbers(values):
+        packer.pack(values)
+        return
+    packer.pack_array_header(len(values))
+    for value in values:
+        _pack_number(packer, value)
+
+
+def _pack_number_mapping(packer: msgpack.Packer, values):
+    if values is None or values is Unknown:
+        packer.pack(values)
+    elif _native_numbers(values.values()):
+        packer.pack_map_pairs(sorted(values.items()))
+    else:
+        packer.pack_map_header(len(values))
+        for key, value in sorted(values.items()):
+            packer.pack(key)
+            _pack_number(packer, value)
+
+
+def _pack_dynamic(packer: msgpack.Packer, value):
+    if value is None or value is Unknown:
+        packer.pack(value)
+        return
+    type_ = implied_type(value)
+    packer.pack_array_header(2)
+    packer.pack(bytes(type_))
+    compile_encoder(type_)(packer, value)
+
+
+def _pack_sequence(encode: Encoder, empty=None) -> Encoder:
+    def sequence(packer: msgpack.Packer, values):
+        if values is None:
+            values = empty
+        if values is None or values is Unknown:
+            packer.pack(values)
+            return
+        packer.pack_array_header(len(values))
+        # reads `state.CowList` without copying shared values
+        for value in (list.__iter__(values) if isinstance(values, list) else values):
+            encode(packer, value)
+
+    return sequence
+
+
+def _pack_mapping(encode: Encoder, empty=None) -> Encoder:
+    def mapping(packer: msgpack.Packer, values):
+        if values is None:
+            values = empty
+        if values is None or values is Unknown:
+            packer.pack(values)
+            return
+        packer.pack_map_header(len(values))
+        getitem = dict.__getitem__ if isinstance(values, dict) else operator.getitem
+        for key in sorted(values):
+            packer.pack(key)
+            encode(packer, getitem(values, key))
+
+    return mapping
+
+
+def _pack_primitive_sequence(packer: msgpack.Packer, values):
+    if isinstance(values, (set, frozenset)):
+        # keeps the encoding deterministic
+        values = sorted(values)
+    packer.pack(values)
+
+
+def _set_order(value):
+    return (True, 0) if value is Unknown else (False, value)
+
+
+def _pack_set(encode: Encoder) -> Encoder:
+    # go-cty orders elements of primitive sets, unknown ones last
+    def set_(packer: msgpack.Packer, values):
+        if values is None or values is Unknown:
+            packer.pack(values)
+            return
+        values = sorted(values, key=_set_order)
+        if encode is _pack or encode is _pack_number and _native_numbers(values):
+            packer.pack(values)
+            return
+        packer.pack_array_header(len(values))
+        for value in values:
+            encode(packer, value)
+
+    return set_
+
+
+def _pack_primitive_mapping(packer: msgpack.Packer, values):
+    if values is None or values is Unknown:
+        packer.pack(values)
+    else:
+        packer.pack_map_pairs(sorted(values.items()))
+
+
+def _pack_attributes(encoders: dict, empty=None) -> Encoder:
+    # go-cty writes attributes sorted by name
+    items = tuple(sorted(encoders.items()))
+    size = len(items)
+
+    def attributes(packer: msgpack.Packer, value):
+        if value is None:
+            value = empty
+        if value is None or value is Unknown:
+            packer.pack(value)
+            return
+        packer.pack_map_header(size)
+        get: Callable[[str], Any]
+        if isinstance(value, dict):
+            # reads `state.CowDict` without copying shared values
+            get = types.MethodType(dict.get, value)
+        elif isinstance(value, Mapping):
+            get = value.get
+        else:
+            for name, encode in items:
+                packer.pack(name)
+                encode(packer, getattr(value, name, None))
+            return
+        for name, encode in items:
+            packer.pack(name)
+            encode(packer, get(name))
+
+    return attributes
+
+
+def _pack_positional(encoders: list) -> Encoder:
+    def positional(packer: msgpack.Packer, values):
+        if values is None or values is Unknown:
+            packer.pack(values)
+            return
+        packer.pack_array_header(len(encoders))
+        for encode, value in zip(encoders, list.__iter__(values) if isinstance(values, list) else values):
+            encode(packer, value)
+
+    return positional
+
+
+_encoders: Dict[cty.Type, Encoder] = {}
+
+
+def compile_encoder(type_: cty.Type) -> Encoder:
+    """
+    :return: function writing a value of `type_` into `msgpack.Packer`
+    """
+    try:
+        return _encoders[type_]
+    except KeyError:
+        pass
+
+    encode: Encoder
+    if type_ is cty.Number:
+        encode = _pack_number
+    elif type_ is cty.DynamicPseudoType:
+        encode = _pack_dynamic
+    elif type_.is_primitive:
+        encode = _pack
+    elif isinstance(type_, cty.Set) and type_.element.is_primitive:
+        encode = _pack_set(compile_encoder(type_.element))
+    elif isinstance(type_, cty.CollectionType) and type_.element is cty.Number:
+        encode = _pack_number_mapping if isinstance(type_, cty.Map) else _pack_number_sequence
+    elif isinstance(type_, cty.CollectionType) and type_.element in (cty.String, cty.Bool):
+        # msgpack writes these in one go
+        encode = _pack_primitive_mapping if isinstance(type_, cty.Map) else _pack_primitive_sequence
+    elif isinstance(type_, cty.Map):
+        encode = _pack_mapping(compile_encoder(type_.element))
+    elif isinstance(type_, cty.CollectionType):
+        encode = _pack_sequence(compile_encoder(type_.element))
+    elif isinstance(type_, cty.Object):
+        encode = _pack_attributes({name: compile_encoder(attribute) for name, attribute in type_.attributes.items()})
+    elif isinstance(type_, cty.Tuple):
+        encode = _pack_positional([compile_encoder(element) for element in type_.elements])
+    else:
+        raise ValueError(f'unsupported type {type_!r}')
+
+    _encoders[type_] = encode
+    return encode
+
+
+def compile_block_encoder(block: Schema.Block, empty=None) -> Encoder:
+    """
+    Absent nested blocks are written the way Terraform decodes them from configuration:
+    `SINGLE` as null, `GROUP` as object of nulls and the rest as empty collections.
+
+    :param empty: value written in place of `None`
+    """
+    encoders = {
+        attribute.name: compile_encoder(cty.parse(attribute.type))
+        for attribute in block.attributes
+    }
+    for nested in block.block_types:
+        if nested.nesting == Schema.NestedBlock.GROUP:
+            encoders[nested.type_name] = compile_block_encoder(nested.block, empty={})
+            continue
+        encode = compile_block_encoder(nested.block)
+        if nested.nesting in (Schema.NestedBlock.LIST, Schema.NestedBlock.SET):
+            encoders[nested.type_name] = _pack_sequence(encode, empty=())
+        elif nested.nesting == Schema.NestedBlock.MAP:
+            encoders[nested.type_name] = _pack_mapping(encode, empty={})
+        else:
+            encoders[nested.type_name] = encode
+    return _pack_attributes(encoders, empty=empty)
+
+
+def _packer() -> msgpack.Packer:
+    return msgpack.Packer(use_bin_type=True, autoreset=False, default=_default)
+
+
+def _encode(encode: Encoder, value: Any) -> bytes:
+    packer = _packer()
+    encode(packer, value)
+    return packer.bytes()
+
+
+class BlockCodec:
+    """
+    Decodes and encodes values of a schema block, eg. resource state or provider configuration.
+    Numbers are `int`, `float` or `Decimal` when they don't fit either, unknown values are `Unknown`.
+    """
+
+    def __init__(self, block: Schema.Block):
+        self._msgpack = _known(compile_block(block) or (lambda value: value))
+        self._json = _known(compile_block(block, use_json=True) or (lambda value: value))
+        self._encode = compile_block_encoder(block)
+
+    def decode(self, value: DynamicValue) -> Any:
+        if value.msgpack:
+            return self.decode_msgpack(value.msgpack)
+        if value.json:
+            return self.decode_json(value.json)
+        return None
+
+    def decode_msgpack(self, data: bytes) -> Any:
+        return self._msgpack(msgpack.unpackb(data, raw=False, ext_hook=_ext_hook))
+
+    def decode_json(self, data: bytes) -> Any:
+        return self._json(json.loads(data, parse_float=_json_number))
+
+    def encode(self, value: Any) -> DynamicValue:
+        return DynamicValue(msgpack=self.encode_msgpack(value))
+
+    def encode_msgpack(self, value: Any) -> bytes:
+        """
+        :param value: mapping or object with attributes and nested blocks of the block, `None` for null
+        """
+        return _encode(self._encode, value)
+
+
+def is_null(value: DynamicValue) -> bool:
+    if value.msgpack:
+        return value.msgpack == NullBytes
+    return not value.json or value.json.strip() == b'null'
+
+
+def unpackb(data: bytes) -> Any:
+    """
+    Schema-less decoding, dynamic values are left as `[type, value]` pairs.
+    """
+    return msgpack.unpackb(data, raw=False, ext_hook=_ext_hook)
+
+
+def packb(value: Any) -> bytes:
+    return msgpack.packb(value, use_bin_type=True, default=_default)
@@ -4,20 +4,59 @@ ProviderPluginName = "provider"
 ProvisionerPluginName = "provisioner"
 CoreProtocolVersion = 1
 DefaultProtocolVersion = 5
+# minor versions of protocol 5 are backwards compatible, the latest one implemented is 5.4
+SupportedProtocolVersions = (5,)
 PluginProtocolVersionKey = 'PLUGIN_PROTOCOL_VERSIONS'
 PluginCertKey = 'PLUGIN_CLIENT_CERT'
+UnixSocketDirKey = 'PLUGIN_UNIX_SOCKET_DIR'
 MagicCookieKey = "TF_PLUGIN_MAGIC_COOKIE"
 MagicCookieValue = "d602bf8f470bc67ca7faa0386276bbdd4330efaf76d1a219cb4d6991ca9872b2"
+ReattachProvidersKey = 'TF_REATTACH_PROVIDERS'
+DaemonKey = 'TF_PLUGIN_DAEMON'
+ZygoteSocketKey = 'TF_PLUGIN_ZYGOTE_SOCKET'
+CacheDirKey = 'TF_PLUGIN_CACHE_DIR'
+TLSCacheKey = 'TF_PLUGIN_TLS_CACHE'
+KeyAlgorithmKey = 'TF_PLUGIN_KEY_ALGORITHM'
+DefaultKeyAlgorithm = 'P256'
+TimingFileKey = 'TF_PLUGIN_TIMING_FILE'
+MaxWorkersKey = 'TF_PLUGIN_MAX_WORKERS'
+AdaptiveWorkersKey = 'TF_PLUGIN_ADAPTIVE_WORKERS'
+ProcessesKey = 'TF_PLUGIN_PROCESSES'
+SchemaCacheKey = 'TF_PLUGIN_SCHEMA_CACHE'
+# https://www.terraform.io/docs/commands/apply.html#parallelism-n
+DefaultParallelism = 10
+ProviderExecutablePrefix = 'terraform-provider-'
 
+ONE_HOUR_IN_SECONDS = 60 * 60
 ONE_DAY_IN_SECONDS = 60 * 60 * 24
 
 
-def get_protocol_version():
-    versions = sorted(filter(bool, os.getenv(PluginProtocolVersionKey, '').split()), reverse=True)
-    for version in versions:
+def get_protocol_version() -> int:
+    """
+    :return: highest of supported major versions offered by Terraform in comma-separated `PLUGIN_PROTOCOL_VERSIONS`
+        https://github.com/hashicorp/go-plugin/blob/v1.4.3/client.go#L556
+    """
+    offered = set()
+    for version in os.getenv(PluginProtocolVersionKey, '').split(','):
         try:
-            int(version)
+            offered.add(int(version))
         except ValueError:
             continue
-        return version
-    return DefaultProtocolVersion
+    versions = offered.intersection(SupportedProtocolVersions)
+    return max(versions) if versions else DefaultProtocolVersion
+
+
+def is_enabled(key: str) -> bool:
+    return os.getenv(key, '').lower() in ('1', 'true', 'yes')
+
+
+def is_daemon():
+    return is_enabled(DaemonKey)
+
+
+def is_tls_cache_enabled():
+    return is_enabled(TLSCacheKey)
+
+
+def is_schema_cache_enabled():
+    return is_enabled(SchemaCacheKey)
@@ -1,5 +1,11 @@
+import contextlib
 import datetime
+import logging
 import os
+import queue
+import threading
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
 
 import grpc
 from cryptography import x509
@@ -9,17 +15,41 @@ from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePrivateKeyWithSerialization
 from cryptography.x509 import Certificate, load_der_x509_certificate
 
+from terraform_plugin import cache, constants
 from terraform_plugin.constants import PluginCertKey
 
+log = logging.getLogger(__name__)
+
+Identity = Tuple[EllipticCurvePrivateKeyWithSerialization, bytes, Certificate]
+
+# Ed25519 isn't offered: gRPC's TLS fails handshakes with it, on either side
+KeyAlgorithms = {
+    'P256': ec.SECP256R1(),
+    'P384': ec.SECP384R1(),
+    'P521': ec.SECP521R1(),
+}
+
+_pem_certificate_marker = b'-----BEGIN CERTIFICATE-----'
+_identity_pool: Optional['IdentityPool'] = None
+
 
 def utcnow():
     return datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc)
 
 
-def generate_private_key():
-    key: EllipticCurvePrivateKeyWithSerialization = ec.generate_private_key(
-        ec.SECP521R1, default_backend()
-    )
+def get_key_algorithm(algorithm: str = None) -> str:
+    algorithm = (algorithm or os.getenv(constants.KeyAlgorithmKey) or constants.DefaultKeyAlgorithm).upper()
+    if algorithm not in KeyAlgorithms:
+        raise ValueError(f'unsupported key algorithm {algorithm!r}, choose one of {", ".join(KeyAlgorithms)}')
+    return algorithm
+
+
+def generate_private_key(algorithm: str = None) -> Tuple[EllipticCurvePrivateKeyWithSerialization, bytes]:
+    """
+    :param algorithm: one of `KeyAlgorithms`, defaults to `TF_PLUGIN_KEY_ALGORITHM` environment variable or P256
+    """
+    curve = KeyAlgorithms[get_key_algorithm(algorithm)]
+    key: EllipticCurvePrivateKeyWithSerialization = ec.generate_private_key(curve, default_backend())
     key_bytes: bytes = key.private_bytes(
         encoding=serialization.Encoding.PEM,
         format=serialization.PrivateFormat.TraditionalOpenSSL,
@@ -28,7 +58,7 @@ def generate_private_key():
     return key, key_bytes
 
 
-def generate_certificate(key: EllipticCurvePrivateKeyWithSerialization):
+def generate_certificate(key: EllipticCurvePrivateKeyWithSerialization) -> Certificate:
     hostname = 'localhost'
     subject = issuer = x509.Name([
         x509.NameAttribute(x509.NameOID.COMMON_NAME, hostname)
@@ -82,6 +112,136 @@ def read_certificate(der_data: bytes) -> Certificate:
     return load_der_x509_certificate(der_data, backend=default_backend())
 
 
+def generate_identity(algorithm: str = None) -> Identity:
+    private_key, private_key_bytes = generate_private_key(algorithm)
+    certificate = generate_certificate(private_key)
+    return private_key, private_key_bytes, certificate
+
+
+def _load_identity(path: Path, algorithm: str) -> Optional[Identity]:
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+    private_key_bytes, marker, certificate_bytes = data.partition(_pem_certificate_marker)
+    try:
+        certificate = x509.load_pem_x509_certificate(marker + certificate_bytes, default_backend())
+        private_key = serialization.load_pem_private_key(private_key_bytes, None, default_backend())
+    except ValueError as e:
+        log.warning(f'ignoring malformed TLS identity at {path}: {e}')
+        return None
+    curve = KeyAlgorithms[algorithm]
+    if not (isinstance(private_key, ec.EllipticCurvePrivateKey) and private_key.curve.name == curve.name):
+        log.warning(f'ignoring TLS identity at {path}, its key is not {algorithm}')
+        return None
+
+    # rotate well before expiry, so the certificate stays valid for the whole Terraform run
+    expires_at = certificate.not_valid_after.replace(tzinfo=datetime.timezone.utc)
+    if expires_at - utcnow() < datetime.timedelta(seconds=constants.ONE_HOUR_IN_SECONDS):
+        return None
+    return private_key, private_key_bytes, certificate
+
+
+def _get_cached_identity(name: str) -> Identity:
+    directory = cache.get_cache_dir('tls')
+    if directory is None:
+        return generate_identity()
+
+    algorithm = get_key_algorithm()
+    path = directory / f'{name}-{algorithm.lower()}.pem'
+    identity = _load_identity(path, algorithm)
+    if identity:
+        return identity
+
+    with cache.locked(path):
+        # another process might have generated it while we were waiting for the lock
+        identity = _load_identity(path, algorithm)
+        if identity:
+            return identity
+
+        identity = private_key, private_key_bytes, certificate = generate_identity(algorithm)
+        cache.atomic_write(path, private_key_bytes + certificate.public_bytes(serialization.Encoding.PEM))
+        log.debug(f'cached TLS identity at {path}')
+    return identity
+
+
+class IdentityPool:
+    """
+    Generates identities in a background thread ahead of time, so a handshake never waits for it.
+    """
+
+    def __init__(self, size: int = 2, algorithm: str = None):
+        self.algorithm = get_key_algorithm(algorithm)
+        self.identities: 'queue.Queue[Identity]' = queue.Queue(maxsize=size)
+        # held while generating, acquire it before forking so the child doesn't inherit OpenSSL mid-operation
+        self.lock = threading.Lock()
+        self._thread = threading.Thread(target=self._fill, name='IdentityPool', daemon=True)
+
+    def start(self) -> 'IdentityPool':
+        self._thread.start()
+        return self
+
+    def _fill(self):
+        while True:
+            with self.lock:
+                identity = generate_identity(self.algorithm)
+            self.identities.put(identity)
+
+    def get(self) -> Identity:
+        try:
+            return self.identities.get_nowait()
+        except queue.Empty:
+            log.debug('identity pool is empty, generating identity in foreground')
+            return generate_identity(self.algorithm)
+
+
+def start_identity_pool(size: int = 2, algorithm: str = None) -> IdentityPool:
+    global _identity_pool
+    _identity_pool = IdentityPool(size, algorithm).start()
+    return _identity_pool
+
+
+def reset_identity_pool(identities: Iterable[Identity] = ()):
+    """
+    Replaces pool inherited by a forked process, its filling thread does not exist there.
+    """
+    global _identity_pool
+    identities = list(identities)
+    _identity_pool = None
+    if identities:
+        _identity_pool = IdentityPool(len(identities))
+        for identity in identities:
+            _identity_pool.identities.put_nowait(identity)
+
+
+def take_pooled_identity(algorithm: str = None) -> Optional[Identity]:
+    """
+    :param algorithm: `TF_PLUGIN_KEY_ALGORITHM` of the process the identity is for, P256 when not set
+    :return: pooled identity, `None` without a pool or when its identities use another algorithm
+    """
+    if _identity_pool is None or (algorithm or constants.DefaultKeyAlgorithm).upper() != _identity_pool.algorithm:
+        return None
+    return _identity_pool.get()
+
+
+def fork_lock():
+    return _identity_pool.lock if _identity_pool else contextlib.nullcontext()
+
+
+def get_identity(name: str) -> Identity:
+    """
+    :param name: role of the identity, eg. `server` or `client`
+    :return: private key, its PEM bytes and self-signed certificate, reused between processes
+        when `TF_PLUGIN_TLS_CACHE` is enabled or taken from the pool started with `start_identity_pool`
+    """
+    if constants.is_tls_cache_enabled():
+        return _get_cached_identity(name)
+    if _identity_pool:
+        return _identity_pool.get()
+    return generate_identity()
+
+
 def get_server_credentials():
     """
     https://www.sandtable.com/using-ssl-with-grpc-in-python/
@@ -92,8 +252,7 @@ def get_server_credentials():
     if not client_cert_pem:
         return None, b''
 
-    private_key, private_key_bytes = generate_private_key()
-    certificate = generate_certificate(private_key)
+    private_key, private_key_bytes, certificate = get_identity('server')
 
     certificate_chain_bytes: bytes = b'\n'.join((
         certificate.public_bytes(serialization.Encoding.DER),
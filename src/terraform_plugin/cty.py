@@ -0,0 +1,210 @@
+"""
+cty type system used by Terraform for attribute types:
+https://github.com/zclconf/go-cty/blob/v1.8.0/docs/types.md
+
+Types are interned, structurally equal types are the same object and compare by identity:
+
+    >>> cty.List(cty.String) is cty.parse(b'["list","string"]')
+    True
+    >>> bytes(cty.Map(cty.Number))
+    b'["map","number"]'
+"""
+import functools
+import json
+import threading
+import types
+import typing
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Union
+
+_interned: Dict[tuple, 'Type'] = {}
+_lock = threading.Lock()
+
+
+class Type:
+    """
+    Immutable cty type, create with `List`, `Set`, `Map`, `Object`, `Tuple` or use primitive types.
+    """
+    __slots__ = ('_key', '_bytes')
+    _key: tuple
+    _bytes: bytes
+
+    @classmethod
+    def _intern(cls, key: tuple, **attributes) -> 'Type':
+        try:
+            return _interned[key]
+        except KeyError:
+            pass
+        with _lock:
+            self = _interned.get(key)
+            if self is None:
+                self = object.__new__(cls)
+                for name, value in attributes.items():
+                    object.__setattr__(self, name, value)
+                object.__setattr__(self, '_key', key)
+                object.__setattr__(self, '_bytes', json.dumps(self.to_json(), separators=(',', ':')).encode())
+                _interned[key] = self
+            return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{self!r} is immutable')
+
+    def __bytes__(self) -> bytes:
+        """
+        :return: type JSON of `Schema.Attribute.type`
+        """
+        return self._bytes
+
+    def __reduce__(self):
+        return parse, (self._bytes,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def to_json(self) -> Any:
+        raise NotImplementedError()
+
+    @property
+    def is_primitive(self) -> bool:
+        return False
+
+    @property
+    def is_collection(self) -> bool:
+        return False
+
+
+class PrimitiveType(Type):
+    __slots__ = ('name',)
+    name: str
+
+    def __new__(cls, name: str):
+        return cls._intern((name,), name=name)
+
+    def __repr__(self):
+        return 'cty.DynamicPseudoType' if self is DynamicPseudoType else f'cty.{self.name.capitalize()}'
+
+    def to_json(self) -> Any:
+        return self.name
+
+    @property
+    def is_primitive(self) -> bool:
+        return self.name != 'dynamic'
+
+
+String = PrimitiveType('string')
+Number = PrimitiveType('number')
+Bool = PrimitiveType('bool')
+# placeholder for a type decided by value, values of it are sent along with their actual type
+DynamicPseudoType = PrimitiveType('dynamic')
+
+
+class CollectionType(Type):
+    __slots__ = ('element',)
+    element: Type
+    kind: Optional[str] = None
+
+    def __new__(cls, element: Type):
+        return cls._intern((cls.kind, element), element=element)
+
+    def __repr__(self):
+        return f'cty.{self.__class__.__name__}({self.element!r})'
+
+    def to_json(self) -> Any:
+        return [self.kind, self.element.to_json()]
+
+    @property
+    def is_collection(self) -> bool:
+        return True
+
+
+class List(CollectionType):
+    __slots__ = ()
+    kind = 'list'
+
+
+class Set(CollectionType):
+    __slots__ = ()
+    kind = 'set'
+
+
+class Map(CollectionType):
+    __slots__ = ()
+    kind = 'map'
+
+
+class Object(Type):
+    __slots__ = ('attributes', 'optional')
+    attributes: Mapping[str, Type]
+    optional: FrozenSet[str]
+
+    def __new__(cls, attributes: Mapping[str, Type], optional: Iterable[str] = ()):
+        """
+        :param optional: names of attributes which may be omitted in type constraints
+        """
+        items = tuple(sorted(attributes.items()))
+        optional = frozenset(optional)
+        return cls._intern(('object', items, optional), attributes=types.MappingProxyType(dict(items)),
+                           optional=optional)
+
+    def __repr__(self):
+        attributes = ', '.join(f'{name!r}: {type_!r}' for name, type_ in self.attributes.items())
+        optional = f', {sorted(self.optional)!r}' if self.optional else ''
+        return f'cty.Object({{{attributes}}}{optional})'
+
+    def to_json(self) -> Any:
+        value = ['object', {name: type_.to_json() for name, type_ in self.attributes.items()}]
+        if self.optional:
+            value.append(sorted(self.optional))
+        return value
+
+
+class Tuple(Type):
+    __slots__ = ('elements',)
+    elements: typing.Tuple[Type, ...]
+
+    def __new__(cls, elements: Iterable[Type]):
+        elements = tuple(elements)
+        return cls._intern(('tuple', elements), elements=elements)
+
+    def __repr__(self):
+        return f'cty.Tuple({list(self.elements)!r})'
+
+    def to_json(self) -> Any:
+        return ['tuple', [type_.to_json() for type_ in self.elements]]
+
+
+_primitives = {type_.name: type_ for type_ in (String, Number, Bool, DynamicPseudoType)}
+_collections = {cls.kind: cls for cls in (List, Set, Map)}
+
+
+def from_json(value: Any) -> Type:
+    """
+    :param value: decoded type JSON, eg. `["map", "string"]`
+    """
+    if isinstance(value, str):
+        try:
+            return _primitives[value]
+        except KeyError:
+            raise ValueError(f'unsupported type {value!r}') from None
+    if isinstance(value, list) and value:
+        kind = value[0]
+        if kind in _collections and len(value) == 2:
+            return _collections[kind](from_json(value[1]))
+        if kind == 'object' and len(value) in (2, 3):
+            return Object(
+                {name: from_json(attribute) for name, attribute in value[1].items()},
+                value[2] if len(value) == 3 else (),
+            )
+        if kind == 'tuple' and len(value) == 2:
+            return Tuple(from_json(element) for element in value[1])
+    raise ValueError(f'unsupported type {value!r}')
+
+
+@functools.lru_cache(maxsize=1024)
+def parse(data: Union[bytes, str]) -> Type:
+    """
+    :param data: type JSON, eg. `Schema.Attribute.type`
+    """
+    return from_json(json.loads(data))
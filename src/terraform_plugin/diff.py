@@ -0,0 +1,241 @@
+"""
+Schema-aware comparison of resource states:
+
+    changes = diff.diff(Server, prior_state, planned_state)
+    if 'disk' in changes:
+        resize(changes.patch(planned_state)['disk'])
+
+Paths are tuples of steps, `str` for attribute and nested block names, `int` for list indexes and `Key` for map keys.
+Changes are reported for attributes as a whole and for nested blocks (except sets) per element.
+"""
+from typing import (
+    Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, Union, cast,
+)
+
+from terraform_plugin import cty, hashing, schema
+from terraform_plugin.codec import Unknown
+from terraform_plugin.proto.tfplugin54_pb2 import AttributePath, Schema
+
+
+class Key(str):
+    """
+    Map key step of a path.
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return f'Key({str.__repr__(self)})'
+
+
+Path = Tuple[Union[str, int, Key], ...]
+Differ = Callable[[Any, Any, Path, List[Path], List[Path]], None]
+
+
+def to_proto(path: Path) -> AttributePath:
+    steps = []
+    for step in path:
+        if isinstance(step, Key):
+            steps.append(AttributePath.Step(element_key_string=step))
+        elif isinstance(step, int):
+            steps.append(AttributePath.Step(element_key_int=step))
+        else:
+            steps.append(AttributePath.Step(attribute_name=step))
+    return AttributePath(steps=steps)
+
+
+class Changes:
+    def __init__(self, paths: Iterable[Path], requires_replace: Iterable[Path] = ()):
+        self.paths: Tuple[Path, ...] = tuple(paths)
+        # paths of changed attributes and nested blocks marked with `requires_replace`
+        self.requires_replace: Tuple[Path, ...] = tuple(requires_replace)
+        # paths start with attribute or nested block name
+        self.names: FrozenSet[str] = frozenset(cast(str, path[0]) for path in self.paths)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({list(self.paths)!r})'
+
+    def __bool__(self):
+        return bool(self.paths)
+
+    def __iter__(self) -> Iterator[Path]:
+        return iter(self.paths)
+
+    def __contains__(self, path: Union[str, Path]) -> bool:
+        """
+        :param path: attribute or nested block name, or path of anything containing a change
+        """
+        if isinstance(path, str):
+            return path in self.names
+        return any(changed[:len(path)] == path for changed in self.paths)
+
+    def patch(self, value: Mapping) -> Dict[str, Any]:
+        """
+        :return: changed attributes and nested blocks of `value`
+        """
+        return {name: value.get(name) for name in self.names}
+
+    def to_proto(self) -> List[AttributePath]:
+        return [to_proto(path) for path in self.paths]
+
+    def requires_replace_proto(self) -> List[AttributePath]:
+        return [to_proto(path) for path in self.requires_replace]
+
+
+def _get(value: Any, name: str) -> Any:
+    if value is None or value is Unknown:
+        return None
+    if isinstance(value, dict):
+        # doesn't copy values shared by `state.CowDict`
+        return dict.get(value, name)
+    if isinstance(value, Mapping):
+        return value.get(name)
+    return getattr(value, name, None)
+
+
+def _elements(values: Sequence) -> Sequence:
+    # reading `state.CowList` by index would copy its elements
+    return list.__getitem__(values, slice(None)) if isinstance(values, list) and type(values) is not list else values
+
+
+def _same(a: Any, b: Any) -> bool:
+    return a is b or a == b
+
+
+def _same_set(key: Optional[hashing.Hasher]) -> Callable[[Any, Any], bool]:
+    """
+    :param key: hasher of elements, `None` for primitive ones compared as they are
+    """
+    def same(a, b):
+        if a is b or a == b:
+            return True
+        if a is None or b is None or a is Unknown or b is Unknown:
+            return False
+        # element order and duplicates don't matter
+        if key is None:
+            return set(a) == set(b)
+        return {key(element) for element in a} == {key(element) for element in b}
+
+    return same
+
+
+def _nested_list(differ: Differ) -> Differ:
+    def nested(prior, planned, path, changed, replace):
+        prior = _elements(prior)
+        planned = _elements(planned)
+        for i in range(max(len(prior), len(planned))):
+            if i >= len(prior) or i >= len(planned):
+                changed.append(path + (i,))
+            elif not _same(prior[i], planned[i]):
+                differ(prior[i], planned[i], path + (i,), changed, replace)
+
+    return nested
+
+
+def _nested_map(differ: Differ) -> Differ:
+    def nested(prior, planned, path, changed, replace):
+        for key in sorted(prior.keys() | planned.keys()):
+            if key not in prior or key not in planned:
+                changed.append(path + (Key(key),))
+                continue
+            a = _get(prior, key)
+            b = _get(planned, key)
+            if not _same(a, b):
+                differ(a, b, path + (Key(key),), changed, replace)
+
+    return nested
+
+
+class _Field:
+    __slots__ = ('name', 'same', 'requires_replace', 'nested')
+
+    def __init__(self, name: str, same: Callable[[Any, Any], bool], requires_replace: bool,
+                 nested: Optional[Differ] = None):
+        self.name = name
+        self.same = same
+        self.requires_replace = requires_replace
+        # compares nested blocks element by element, otherwise the whole value is changed
+        self.nested = nested
+
+
+_differs: Dict[type, Tuple[Differ, bool]] = {}
+
+
+def compile_block(block: Type[schema.Block]) -> Tuple[Differ, bool]:
+    """
+    :return: differ of `block` and whether any of its fields requires replacement
+    """
+    try:
+        return _differs[block]
+    except KeyError:
+        pass
+
+    compiled: List[_Field] = []
+    any_replace = False
+    for field in block.fields():
+        if isinstance(field, schema.NestedBlock):
+            nested, nested_replace = compile_block(field.block)
+            any_replace = any_replace or nested_replace
+            if field.nesting in (Schema.NestedBlock.SINGLE, Schema.NestedBlock.GROUP):
+                compiled.append(_Field(field.name, _same, field.requires_replace, nested))
+            elif field.nesting == Schema.NestedBlock.LIST:
+                compiled.append(_Field(field.name, _same, field.requires_replace, _nested_list(nested)))
+            elif field.nesting == Schema.NestedBlock.MAP:
+                compiled.append(_Field(field.name, _same, field.requires_replace, _nested_map(nested)))
+            else:
+                same = _same_set(hashing.compile_block(field.block))
+                compiled.append(_Field(field.name, same, field.requires_replace))
+        else:
+            same = _same
+            if isinstance(field.type, cty.Set):
+                element = field.type.element
+                same = _same_set(None if element.is_primitive else hashing.compile_type(element))
+            compiled.append(_Field(field.name, same, field.requires_replace))
+        any_replace = any_replace or field.requires_replace
+    fields = tuple(compiled)
+
+    def differ(prior, planned, path, changed, replace):
+        for field in fields:
+            a = _get(prior, field.name)
+            b = _get(planned, field.name)
+            if field.same(a, b):
+                continue
+            field_path = path + (field.name,)
+            if field.requires_replace:
+                replace.append(field_path)
+            if field.nested is None or a is None or b is None or a is Unknown or b is Unknown:
+                changed.append(field_path)
+            else:
+                field.nested(a, b, field_path, changed, replace)
+
+    _differs[block] = differ, any_replace
+    return differ, any_replace
+
+
+def diff(block: Type[schema.Block], prior: Any, planned: Any) -> Changes:
+    """
+    :param prior: `None` when creating the resource
+    :param planned: `None` when destroying the resource
+    """
+    if prior is planned or prior == planned:
+        return Changes(())
+    differ, _ = compile_block(block)
+    changed: List[Path] = []
+    replace: List[Path] = []
+    differ(prior, planned, (), changed, replace)
+    if prior is None or planned is None:
+        # Terraform doesn't replace resources being created or destroyed
+        replace = []
+    return Changes(changed, replace)
+
+
+def has_requires_replace(block: Type[schema.Block]) -> bool:
+    return compile_block(block)[1]
+
+
+def requires_replace(block: Type[schema.Block], prior: Any, planned: Any) -> List[AttributePath]:
+    """
+    :return: `PlanResourceChange.Response.requires_replace`, skips comparison when `block` has nothing to replace
+    """
+    if not has_requires_replace(block) or prior is None or planned is None:
+        return []
+    return diff(block, prior, planned).requires_replace_proto()
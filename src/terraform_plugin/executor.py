@@ -0,0 +1,235 @@
+"""
+Thread pools running RPC handlers of the synchronous gRPC server, measuring how long every RPC waited for a worker.
+"""
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from concurrent import futures
+from typing import Any, Callable, Optional, Set, Tuple, Union
+
+import grpc
+
+from terraform_plugin import constants
+
+log = logging.getLogger(__name__)
+
+_local = threading.local()
+_parallelism = re.compile(r'-parallelism[= ](\d+)')
+
+
+def get_parallelism() -> Optional[int]:
+    """
+    Terraform doesn't tell providers its `-parallelism`, but providers inherit `TF_CLI_ARGS*` variables it reads.
+    """
+    values = [
+        int(match)
+        for key, value in os.environ.items()
+        if key.startswith('TF_CLI_ARGS')
+        for match in _parallelism.findall(value)
+    ]
+    return max(values) if values else None
+
+
+def get_max_workers(max_workers: int = None) -> int:
+    """
+    :return: `max_workers`, `TF_PLUGIN_MAX_WORKERS` or Terraform's parallelism,
+        with an extra worker so `Stop` is served even when all operations are in flight
+    """
+    if max_workers:
+        return max_workers
+    value = os.getenv(constants.MaxWorkersKey)
+    if value:
+        return int(value)
+    return (get_parallelism() or constants.DefaultParallelism) + 1
+
+
+def current_queue_wait() -> Optional[float]:
+    """
+    :return: seconds the RPC handled by current thread waited for a worker
+    """
+    return getattr(_local, 'queue_wait', None)
+
+
+class QueueWaitStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, wait: float):
+        with self._lock:
+            self.count += 1
+            self.total += wait
+            self.max = max(self.max, wait)
+
+    def __str__(self):
+        mean = self.total / self.count if self.count else 0.0
+        return f'{self.count} calls waited for a worker {mean * 1000:.2f} ms on average, {self.max * 1000:.2f} ms max'
+
+
+def _measured(stats: QueueWaitStats, fn, args, kwargs):
+    enqueued_at = time.monotonic()
+
+    def run():
+        _local.queue_wait = wait = time.monotonic() - enqueued_at
+        stats.record(wait)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _local.queue_wait = None
+
+    return run
+
+
+class ThreadPoolExecutor(futures.ThreadPoolExecutor):
+    def __init__(self, max_workers: int = None, **kwargs):
+        super().__init__(max_workers=max_workers, **kwargs)
+        self.stats = QueueWaitStats()
+
+    def submit(self, fn, *args, **kwargs):
+        return super().submit(_measured(self.stats, fn, args, kwargs))
+
+
+class AdaptiveThreadPoolExecutor(futures.Executor):
+    """
+    Adds a thread whenever a call is submitted while all threads are busy, up to `max_workers`, so calls never
+    wait behind long running ones while the pool can grow. Threads are retired when calls waited less than
+    `target_wait` seconds for a worker on average and other threads are idle, or after `idle_timeout` seconds
+    without a call, never going below `min_workers`.
+    """
+
+    def __init__(self, min_workers: int = 2, max_workers: int = 64, target_wait: float = 0.005,
+                 idle_timeout: float = 30.0):
+        self.min_workers = min_workers
+        self.max_workers = max(min_workers, max_workers)
+        self.target_wait = target_wait
+        self.idle_timeout = idle_timeout
+        self.stats = QueueWaitStats()
+
+        # `None` stops a worker thread
+        self._queue: 'queue.Queue[Optional[Tuple[futures.Future, Callable[[], Any], float]]]' = queue.Queue()
+        self._lock = threading.Lock()
+        self._threads: Set[threading.Thread] = set()
+        # threads not running a call less calls waiting in the queue, negative when calls wait for a thread
+        self._idle = 0
+        # moving average of seconds calls waited for a worker
+        self._wait = 0.0
+        self._shutdown = False
+
+    @property
+    def size(self) -> int:
+        return len(self._threads)
+
+    def _spawn(self):
+        thread = threading.Thread(target=self._work, name=f'AdaptiveThreadPoolExecutor-{len(self._threads)}',
+                                  daemon=True)
+        self._threads.add(thread)
+        self._idle += 1
+        thread.start()
+
+    def submit(self, fn, *args, **kwargs):
+        future = futures.Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            self._queue.put((future, _measured(self.stats, fn, args, kwargs), time.monotonic()))
+            self._idle -= 1
+            if self._idle < 0 and len(self._threads) < self.max_workers:
+                self._spawn()
+                log.debug(f'growing worker pool to {len(self._threads)} threads')
+        return future
+
+    def _retire(self, timeout: bool) -> bool:
+        """
+        :param timeout: the thread waited `idle_timeout` for a call, otherwise it just finished one
+        """
+        with self._lock:
+            if not timeout:
+                self._idle += 1
+            # another thread is idle as well, so the next call doesn't wait for this one
+            spare = self._idle > 1 and self._wait < self.target_wait
+            if self._shutdown or len(self._threads) <= self.min_workers or not (timeout and self._idle > 0 or spare):
+                return False
+            self._threads.discard(threading.current_thread())
+            self._idle -= 1
+            log.debug(f'shrinking worker pool to {len(self._threads)} threads')
+            return True
+
+    def _work(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                if self._retire(timeout=True):
+                    return
+                continue
+            if item is None:
+                # shutdown
+                return
+
+            future, run, enqueued_at = item
+            wait = time.monotonic() - enqueued_at
+            with self._lock:
+                self._wait += (wait - self._wait) / 8
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = run()
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            if self._retire(timeout=False):
+                return
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            self._shutdown = True
+            threads = list(self._threads)
+            for _ in threads:
+                self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+def create_executor(
+        max_workers: int = None,
+        adaptive: bool = None,
+) -> Union[ThreadPoolExecutor, AdaptiveThreadPoolExecutor]:
+    """
+    :param max_workers: see `get_max_workers`
+    :param adaptive: size the pool by observed queueing delay up to `max_workers`,
+        defaults to `TF_PLUGIN_ADAPTIVE_WORKERS` environment variable
+    """
+    max_workers = get_max_workers(max_workers)
+    if adaptive is None:
+        adaptive = constants.is_enabled(constants.AdaptiveWorkersKey)
+    if adaptive:
+        return AdaptiveThreadPoolExecutor(max_workers=max_workers)
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+class QueueWaitInterceptor(grpc.ServerInterceptor):
+    """
+    Logs time every RPC spent waiting for a worker thread.
+    """
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None:
+            return handler
+
+        method = handler_call_details.method
+        behavior = handler.unary_unary
+
+        def unary_unary(request, context):
+            wait = current_queue_wait()
+            if wait is not None and log.isEnabledFor(logging.DEBUG):
+                log.debug(f'{method} waited {wait * 1000:.2f} ms for a worker')
+            return behavior(request, context)
+
+        return handler._replace(unary_unary=unary_unary)
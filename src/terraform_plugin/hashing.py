@@ -0,0 +1,218 @@
+"""
+Canonical digests of decoded values, equal cty values have equal digests in any process:
+
+    hashing.digest(Server, state) == hashing.digest(Server, codec.decode(codec.encode(state)))
+
+Digest is blake2b of the canonical msgpack encoding (see `codec`), numbers compare by value and absent nested blocks
+as empty ones. Encoding doesn't order sets of objects, values of types containing them are digested structurally,
+elements of sets by their sorted unique digests.
+"""
+import hashlib
+from typing import Any, Callable, Dict, Mapping, Set, Tuple, Type
+
+from terraform_plugin import codec, cty, schema
+from terraform_plugin.codec import Unknown
+from terraform_plugin.proto.tfplugin54_pb2 import Schema
+
+# returns digest of a value
+Hasher = Callable[[Any], bytes]
+
+DigestSize = 32
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=DigestSize).digest()
+
+
+_NullDigest = _digest(codec.NullBytes)
+_UnknownDigest = _digest(codec.UnknownBytes)
+
+
+def _special(value: Any) -> bytes:
+    return _NullDigest if value is None else _UnknownDigest
+
+
+def _get(value: Any, name: str) -> Any:
+    if isinstance(value, dict):
+        # doesn't copy values shared by `state.CowDict`
+        return dict.get(value, name)
+    if isinstance(value, Mapping):
+        return value.get(name)
+    return getattr(value, name, None)
+
+
+def _canonical(type_: cty.Type) -> bool:
+    """
+    :return: whether encoding of `type_` values is canonical
+    """
+    if isinstance(type_, cty.Set):
+        return type_.element.is_primitive
+    if isinstance(type_, cty.CollectionType):
+        return _canonical(type_.element)
+    if isinstance(type_, cty.Object):
+        return all(_canonical(attribute) for attribute in type_.attributes.values())
+    if isinstance(type_, cty.Tuple):
+        return all(_canonical(element) for element in type_.elements)
+    return True
+
+
+def _encoded(encode: codec.Encoder) -> Hasher:
+    def encoded(value):
+        return _digest(codec._encode(encode, value))
+
+    return encoded
+
+
+def _set(element: Hasher, empty=None) -> Hasher:
+    def set_(values):
+        if values is None:
+            values = empty
+        if values is None or values is Unknown:
+            return _special(values)
+        return _digest(b'S' + b''.join(sorted({element(value) for value in values})))
+
+    return set_
+
+
+def _list(element: Hasher, empty=None) -> Hasher:
+    def list_(values):
+        if values is None:
+            values = empty
+        if values is None or values is Unknown:
+            return _special(values)
+        return _digest(b'L' + b''.join(element(value) for value in values))
+
+    return list_
+
+
+def _map(element: Hasher, empty=None) -> Hasher:
+    def map_(values):
+        if values is None:
+            values = empty
+        if values is None or values is Unknown:
+            return _special(values)
+        return _digest(b'M' + b''.join(
+            _digest(key.encode()) + element(_get(values, key)) for key in sorted(values)))
+
+    return map_
+
+
+def _object(hashers: Dict[str, Hasher], empty=None) -> Hasher:
+    items = tuple(sorted(hashers.items()))
+
+    def object_(value):
+        if value is None:
+            value = empty
+        if value is None or value is Unknown:
+            return _special(value)
+        return _digest(b'O' + b''.join(hasher(_get(value, name)) for name, hasher in items))
+
+    return object_
+
+
+def _group(element: Hasher) -> Hasher:
+    def group(value):
+        # absent group is the same as an empty one
+        return element({} if value is None else value)
+
+    return group
+
+
+def _tuple(hashers: Tuple[Hasher, ...]) -> Hasher:
+    def tuple_(values):
+        if values is None or values is Unknown:
+            return _special(values)
+        return _digest(b'T' + b''.join(hasher(value) for hasher, value in zip(hashers, values)))
+
+    return tuple_
+
+
+_hashers: Dict[cty.Type, Hasher] = {}
+
+
+def compile_type(type_: cty.Type) -> Hasher:
+    try:
+        return _hashers[type_]
+    except KeyError:
+        pass
+
+    if _canonical(type_):
+        hasher = _encoded(codec.compile_encoder(type_))
+    elif isinstance(type_, cty.Set):
+        hasher = _set(compile_type(type_.element))
+    elif isinstance(type_, cty.Map):
+        hasher = _map(compile_type(type_.element))
+    elif isinstance(type_, cty.List):
+        hasher = _list(compile_type(type_.element))
+    elif isinstance(type_, cty.Object):
+        hasher = _object({name: compile_type(attribute) for name, attribute in type_.attributes.items()})
+    elif isinstance(type_, cty.Tuple):
+        hasher = _tuple(tuple(compile_type(element) for element in type_.elements))
+    else:
+        raise ValueError(f'unsupported type {type_!r}')
+
+    _hashers[type_] = hasher
+    return hasher
+
+
+_block_hashers: Dict[type, Hasher] = {}
+# blocks hashed by their encoding
+_canonical_blocks: Set[type] = set()
+
+
+def compile_block(block: Type[schema.Block]) -> Hasher:
+    """
+    :return: hasher of `block` values, `None` is null
+    """
+    try:
+        return _block_hashers[block]
+    except KeyError:
+        pass
+
+    hashers: Dict[str, Hasher] = {}
+    canonical = True
+    for field in block.fields():
+        if isinstance(field, schema.Attribute):
+            hashers[field.name] = compile_type(field.type)
+            canonical = canonical and _canonical(field.type)
+            continue
+        element = compile_block(field.block)
+        if field.nesting == Schema.NestedBlock.SET:
+            hashers[field.name] = _set(element, empty=())
+            canonical = False
+        elif field.nesting == Schema.NestedBlock.LIST:
+            hashers[field.name] = _list(element, empty=())
+        elif field.nesting == Schema.NestedBlock.MAP:
+            hashers[field.name] = _map(element, empty={})
+        elif field.nesting == Schema.NestedBlock.GROUP:
+            hashers[field.name] = _group(element)
+        else:
+            hashers[field.name] = element
+        canonical = canonical and field.block in _canonical_blocks
+
+    if canonical:
+        block_codec = block.get_codec()
+
+        def hasher(value):
+            return _digest(block_codec.encode_msgpack(value))
+
+        _canonical_blocks.add(block)
+    else:
+        hasher = _object(hashers)
+
+    _block_hashers[block] = hasher
+    return hasher
+
+
+def digest(block: Type[schema.Block], value: Any) -> bytes:
+    """
+    :return: digest of `block` value, eg. to key caches of responses
+    """
+    return compile_block(block)(value)
+
+
+def equal(block: Type[schema.Block], a: Any, b: Any) -> bool:
+    """
+    :return: whether `a` and `b` are the same value of `block`, regardless of set order and number types
+    """
+    return a is b or digest(block, a) == digest(block, b)
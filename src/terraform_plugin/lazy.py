@@ -0,0 +1,349 @@
+"""
+Lazy views of msgpack `DynamicValue`, decoding values when they're accessed:
+
+    state = lazy.LazyCodec(Server.to_proto(), Server.get_codec()).decode(request.current_state)
+    state['name']  # scans keys up to `name`, decodes only its value
+
+Views read a `memoryview` of the message bytes. Attributes are decoded as a whole on first access, nested blocks
+are views of their own. Modifying a view decodes all of its keys (nested blocks stay views) and works on them
+from then on, `modified` tells whether a view still matches bytes it was created from.
+"""
+from collections.abc import MutableMapping, MutableSequence
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import msgpack
+
+from terraform_plugin import codec, cty
+from terraform_plugin.proto.tfplugin54_pb2 import DynamicValue, Schema
+
+# loads value from `data[start:end]`
+Loader = Callable[[memoryview, int, int], Any]
+
+# sizes of values by their first byte, 0 for variable sizes
+_FIXED = [0] * 256
+for _byte in [*range(0x00, 0x80), *range(0xe0, 0x100), 0xc0, 0xc2, 0xc3]:
+    _FIXED[_byte] = 1
+for _byte in range(0xa0, 0xc0):
+    _FIXED[_byte] = 1 + _byte - 0xa0
+for _byte, _size in {0xca: 5, 0xcb: 9, 0xcc: 2, 0xcd: 3, 0xce: 5, 0xcf: 9, 0xd0: 2, 0xd1: 3, 0xd2: 5, 0xd3: 9,
+                     0xd4: 3, 0xd5: 4, 0xd6: 6, 0xd7: 10, 0xd8: 18}.items():
+    _FIXED[_byte] = _size
+# str, bin and ext: bytes of length and bytes following it before the payload
+_SIZED = {0xd9: (1, 0), 0xda: (2, 0), 0xdb: (4, 0), 0xc4: (1, 0), 0xc5: (2, 0), 0xc6: (4, 0),
+          0xc7: (1, 1), 0xc8: (2, 1), 0xc9: (4, 1)}
+# arrays and maps: bytes of length and items per element
+_CONTAINERS = {0xdc: (2, 1), 0xdd: (4, 1), 0xde: (2, 2), 0xdf: (4, 2)}
+_EXT = {0xc7, 0xc8, 0xc9, 0xd4, 0xd5, 0xd6, 0xd7, 0xd8}
+# reads lengths straight from `memoryview`
+_from_bytes: Callable[[Any, Any], int] = int.from_bytes
+
+
+def _header(data: memoryview, offset: int) -> Tuple[int, int, int]:
+    """
+    :return: number of elements, items per element and offset of the first one of array or map at `offset`
+    """
+    byte = data[offset]
+    if 0x80 <= byte <= 0x8f:
+        return byte & 0x0f, 2, offset + 1
+    if 0x90 <= byte <= 0x9f:
+        return byte & 0x0f, 1, offset + 1
+    try:
+        size, items = _CONTAINERS[byte]
+    except KeyError:
+        raise ValueError(f'expected array or map at {offset}, got {byte:#x}') from None
+    return _from_bytes(data[offset + 1:offset + 1 + size], 'big'), items, offset + 1 + size
+
+
+def _skip(data: memoryview, offset: int) -> int:
+    """
+    :return: offset right after the value at `offset`
+    """
+    remaining = 1
+    while remaining:
+        remaining -= 1
+        byte = data[offset]
+        size = _FIXED[byte]
+        if size:
+            offset += size
+        elif byte in _SIZED:
+            size, extra = _SIZED[byte]
+            offset += 1 + size + extra + _from_bytes(data[offset + 1:offset + 1 + size], 'big')
+        else:
+            count, items, offset = _header(data, offset)
+            remaining += count * items
+    return offset
+
+
+def _decode(data: memoryview, start: int, end: int) -> Any:
+    return msgpack.unpackb(data[start:end], raw=False, ext_hook=codec._ext_hook)
+
+
+def _attribute(convert: Optional[codec.Converter]) -> Loader:
+    if convert is None:
+        return _decode
+
+    def attribute(data, start, end):
+        value = _decode(data, start, end)
+        if value is None or value is codec.Unknown:
+            return value
+        return convert(value)
+
+    return attribute
+
+
+def _nested(view: Loader) -> Loader:
+    def nested(data, start, end):
+        byte = data[start]
+        if byte == 0xc0 or byte in _EXT:
+            # null or unknown
+            return _decode(data, start, end)
+        return view(data, start, end)
+
+    return nested
+
+
+def _is_modified(value: Any, loader: Loader, data: memoryview, start: int, end: int) -> bool:
+    if isinstance(value, (LazyMap, LazyList)):
+        return value.modified
+    if isinstance(value, (dict, list)):
+        # decoded attributes can be modified in place
+        return value != loader(data, start, end)
+    return False
+
+
+class LazyMap(MutableMapping):
+    """
+    View of msgpack map, keys are indexed up to the one accessed.
+    """
+    __slots__ = ('_data', '_start', '_end', '_loaders', '_default', '_size', '_remaining', '_offset', '_index',
+                 '_values', '_dict')
+
+    def __init__(self, data: memoryview, start: int, end: int, loaders: Dict[str, Loader], default: Loader):
+        """
+        :param loaders: loaders of values by key, `default` loads the rest
+        """
+        self._data = data
+        self._start = start
+        self._end = end
+        self._loaders = loaders
+        self._default = default
+        self._size, _, self._offset = _header(data, start)
+        self._remaining = self._size
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._values: Dict[str, Any] = {}
+        # decoded when modified
+        self._dict: Optional[dict] = None
+
+    def _scan(self, key: str = None) -> bool:
+        """
+        Indexes keys up to `key`, all of them when it's `None`.
+        """
+        data = self._data
+        while self._remaining:
+            start = self._offset
+            key_end = _skip(data, start)
+            name = _decode(data, start, key_end)
+            end = _skip(data, key_end)
+            self._index[name] = key_end, end
+            self._remaining -= 1
+            self._offset = end
+            if name == key:
+                return True
+        return False
+
+    def _load(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        if key not in self._index and not self._scan(key):
+            raise KeyError(key)
+        start, end = self._index[key]
+        value = self._values[key] = self._loaders.get(key, self._default)(self._data, start, end)
+        return value
+
+    def _materialize(self) -> dict:
+        if self._dict is None:
+            self._scan()
+            self._dict = {key: self._load(key) for key in self._index}
+        return self._dict
+
+    def __getitem__(self, key):
+        if self._dict is not None:
+            return self._dict[key]
+        return self._load(key)
+
+    def __contains__(self, key):
+        if self._dict is not None:
+            return key in self._dict
+        return key in self._index or self._scan(key)
+
+    def __len__(self):
+        return self._size if self._dict is None else len(self._dict)
+
+    def __iter__(self):
+        if self._dict is not None:
+            return iter(self._dict)
+        self._scan()
+        return iter(list(self._index))
+
+    def __setitem__(self, key, value):
+        self._materialize()[key] = value
+
+    def __delitem__(self, key):
+        del self._materialize()[key]
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({dict(self)!r})'
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    @property
+    def modified(self) -> bool:
+        if self._dict is not None:
+            return True
+        return any(
+            _is_modified(value, self._loaders.get(key, self._default), self._data, *self._index[key])
+            for key, value in self._values.items()
+        )
+
+    def raw(self) -> memoryview:
+        """
+        :return: bytes the view was created from
+        """
+        return self._data[self._start:self._end]
+
+    def original(self) -> 'LazyMap':
+        """
+        :return: new view of bytes this one was created from
+        """
+        return self.__class__(self._data, self._start, self._end, self._loaders, self._default)
+
+
+class LazyList(MutableSequence):
+    """
+    View of msgpack array, elements are indexed up to the one accessed.
+    """
+    __slots__ = ('_data', '_start', '_end', '_loader', '_size', '_remaining', '_offset', '_index', '_values',
+                 '_list')
+
+    def __init__(self, data: memoryview, start: int, end: int, loader: Loader):
+        self._data = data
+        self._start = start
+        self._end = end
+        self._loader = loader
+        self._size, _, self._offset = _header(data, start)
+        self._remaining = self._size
+        self._index: List[Tuple[int, int]] = []
+        self._values: Dict[int, Any] = {}
+        self._list: Optional[list] = None
+
+    def _scan(self, index: int):
+        data = self._data
+        while len(self._index) <= index and self._remaining:
+            end = _skip(data, self._offset)
+            self._index.append((self._offset, end))
+            self._remaining -= 1
+            self._offset = end
+
+    def _load(self, index: int) -> Any:
+        try:
+            return self._values[index]
+        except KeyError:
+            pass
+        self._scan(index)
+        value = self._values[index] = self._loader(self._data, *self._index[index])
+        return value
+
+    def _materialize(self) -> list:
+        if self._list is None:
+            self._list = [self._load(index) for index in range(self._size)]
+        return self._list
+
+    def __getitem__(self, index):
+        if self._list is not None:
+            return self._list[index]
+        if isinstance(index, slice):
+            return [self._load(i) for i in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('list index out of range')
+        return self._load(index)
+
+    def __len__(self):
+        return self._size if self._list is None else len(self._list)
+
+    def __iter__(self):
+        if self._list is not None:
+            return iter(self._list)
+        return (self._load(index) for index in range(self._size))
+
+    def __setitem__(self, index, value):
+        self._materialize()[index] = value
+
+    def __delitem__(self, index):
+        del self._materialize()[index]
+
+    def insert(self, index, value):
+        self._materialize().insert(index, value)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, LazyList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({list(self)!r})'
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    @property
+    def modified(self) -> bool:
+        if self._list is not None:
+            return True
+        return any(
+            _is_modified(value, self._loader, self._data, *self._index[index])
+            for index, value in self._values.items()
+        )
+
+
+def compile_block(block: Schema.Block) -> Loader:
+    """
+    :return: loader of `LazyMap` views of `block` values
+    """
+    loaders = {
+        attribute.name: _attribute(codec.compile_type(cty.parse(attribute.type)))
+        for attribute in block.attributes
+    }
+    for nested in block.block_types:
+        element = compile_block(nested.block)
+        if nested.nesting in (Schema.NestedBlock.SINGLE, Schema.NestedBlock.GROUP):
+            loaders[nested.type_name] = element
+        elif nested.nesting == Schema.NestedBlock.MAP:
+            loaders[nested.type_name] = _nested(partial(LazyMap, loaders={}, default=element))
+        else:
+            loaders[nested.type_name] = _nested(partial(LazyList, loader=element))
+    return _nested(partial(LazyMap, loaders=loaders, default=_decode))
+
+
+class LazyCodec:
+    """
+    Decodes msgpack values of a schema block to `LazyMap` views, values are the same `codec.BlockCodec` decodes.
+    """
+
+    def __init__(self, block: Schema.Block, block_codec: codec.BlockCodec):
+        """
+        :param block_codec: decodes values sent as json
+        """
+        self._load = compile_block(block)
+        self._codec = block_codec
+
+    def decode(self, value: DynamicValue) -> Any:
+        if not value.msgpack:
+            return self._codec.decode(value)
+        data = memoryview(value.msgpack)
+        return self._load(data, 0, len(data))
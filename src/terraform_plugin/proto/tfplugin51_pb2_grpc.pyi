@@ -1,53 +1 @@
-# Stubs for tfplugin51_pb2_grpc (Python 3)
-#
-# NOTE: This dynamically typed stub was automatically generated by stubgen.
-# It was edited by @nazarewk
-
-from typing import Any
-from .tfplugin51_pb2 import *
-
-class ProviderStub:
-    GetSchema: Any = ...
-    PrepareProviderConfig: Any = ...
-    ValidateResourceTypeConfig: Any = ...
-    ValidateDataSourceConfig: Any = ...
-    UpgradeResourceState: Any = ...
-    Configure: Any = ...
-    ReadResource: Any = ...
-    PlanResourceChange: Any = ...
-    ApplyResourceChange: Any = ...
-    ImportResourceState: Any = ...
-    ReadDataSource: Any = ...
-    Stop: Any = ...
-    def __init__(self, channel: Any) -> None: ...
-
-class ProviderServicer:
-    def GetSchema(self, request: GetProviderSchema.Request, context: Any) -> GetProviderSchema.Response: ...
-    def PrepareProviderConfig(self, request: PrepareProviderConfig.Request, context: Any) -> PrepareProviderConfig.Response: ...
-    def ValidateResourceTypeConfig(self, request: ValidateResourceTypeConfig.Request, context: Any) -> ValidateResourceTypeConfig.Response: ...
-    def ValidateDataSourceConfig(self, request: ValidateDataSourceConfig.Request, context: Any) -> ValidateDataSourceConfig.Response: ...
-    def UpgradeResourceState(self, request: UpgradeResourceState.Request, context: Any) -> UpgradeResourceState.Response: ...
-    def Configure(self, request: Configure.Request, context: Any) -> Configure.Response: ...
-    def ReadResource(self, request: ReadResource.Request, context: Any) -> ReadResource.Response: ...
-    def PlanResourceChange(self, request: PlanResourceChange.Request, context: Any) -> PlanResourceChange.Response: ...
-    def ApplyResourceChange(self, request: ApplyResourceChange.Request, context: Any) -> ApplyResourceChange.Response: ...
-    def ImportResourceState(self, request: ImportResourceState.Request, context: Any) -> ImportResourceState.Response: ...
-    def ReadDataSource(self, request: ReadDataSource.Request, context: Any) -> ReadDataSource.Response: ...
-    def Stop(self, request: Stop.Request, context: Any) -> Stop.Response: ...
-
-def add_ProviderServicer_to_server(servicer: ProviderServicer, server: Any) -> None: ...
-
-class ProvisionerStub:
-    GetSchema: Any = ...
-    ValidateProvisionerConfig: Any = ...
-    ProvisionResource: Any = ...
-    Stop: Any = ...
-    def __init__(self, channel: Any) -> None: ...
-
-class ProvisionerServicer:
-    def GetSchema(self, request: GetProvisionerSchema.Request, context: Any) -> GetProvisionerSchema.Response: ...
-    def ValidateProvisionerConfig(self, request: ValidateProvisionerConfig.Request, context: Any) -> ValidateProvisionerConfig.Response: ...
-    def ProvisionResource(self, request: ProvisionResource.Request, context: Any) -> ProvisionResource.Response: ...
-    def Stop(self, request: Stop.Request, context: Any) -> Stop.Response: ...
-
-def add_ProvisionerServicer_to_server(servicer: ProvisionerServicer, server: Any) -> None: ...
+from .tfplugin54_pb2_grpc import *
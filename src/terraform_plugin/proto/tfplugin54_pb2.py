@@ -0,0 +1,3278 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: terraform_plugin/proto/tfplugin54.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf.internal import enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='terraform_plugin/proto/tfplugin54.proto',
+  package='tfplugin5',
+  syntax='proto3',
+  serialized_options=None,
+  serialized_pb=_b('\n\'terraform_plugin/proto/tfplugin54.proto\x12\ttfplugin5\"-\n\x0c\x44ynamicValue\x12\x0f\n\x07msgpack\x18\x01 \x01(\x0c\x12\x0c\n\x04json\x18\x02 \x01(\x0c\"\xbd\x01\n\nDiagnostic\x12\x30\n\x08severity\x18\x01 \x01(\x0e\x32\x1e.tfplugin5.Diagnostic.Severity\x12\x0f\n\x07summary\x18\x02 \x01(\t\x12\x0e\n\x06\x64\x65tail\x18\x03 \x01(\t\x12+\n\tattribute\x18\x04 \x01(\x0b\x32\x18.tfplugin5.AttributePath\"/\n\x08Severity\x12\x0b\n\x07INVALID\x10\x00\x12\t\n\x05\x45RROR\x10\x01\x12\x0b\n\x07WARNING\x10\x02\"\xa4\x01\n\rAttributePath\x12,\n\x05steps\x18\x01 \x03(\x0b\x32\x1d.tfplugin5.AttributePath.Step\x1a\x65\n\x04Step\x12\x18\n\x0e\x61ttribute_name\x18\x01 \x01(\tH\x00\x12\x1c\n\x12\x65lement_key_string\x18\x02 \x01(\tH\x00\x12\x19\n\x0f\x65lement_key_int\x18\x03 \x01(\x03H\x00\x42\n\n\x08selector\",\n\x04Stop\x1a\t\n\x07Request\x1a\x19\n\x08Response\x12\r\n\x05\x45rror\x18\x01 \x01(\t\"{\n\x08RawState\x12\x0c\n\x04json\x18\x01 \x01(\x0c\x12\x31\n\x07\x66latmap\x18\x02 \x03(\x0b\x32 .tfplugin5.RawState.FlatmapEntry\x1a.\n\x0c\x46latmapEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xe4\x05\n\x06Schema\x12\x0f\n\x07version\x18\x01 \x01(\x03\x12&\n\x05\x62lock\x18\x02 \x01(\x0b\x32\x17.tfplugin5.Schema.Block\x1a\xd7\x01\n\x05\x42lock\x12\x0f\n\x07version\x18\x01 \x01(\x03\x12/\n\nattributes\x18\x02 \x03(\x0b\x32\x1b.tfplugin5.Schema.Attribute\x12\x32\n\x0b\x62lock_types\x18\x03 \x03(\x0b\x32\x1d.tfplugin5.Schema.NestedBlock\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12/\n\x10\x64\x65scription_kind\x18\x05 \x01(\x0e\x32\x15.tfplugin5.StringKind\x12\x12\n\ndeprecated\x18\x06 \x01(\x08\x1a\xca\x01\n\tAttribute\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\x0c\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x10\n\x08required\x18\x04 \x01(\x08\x12\x10\n\x08optional\x18\x05 \x01(\x08\x12\x10\n\x08\x63omputed\x18\x06 \x01(\x08\x12\x11\n\tsensitive\x18\x07 \x01(\x08\x12/\n\x10\x64\x65scription_kind\x18\x08 \x01(\x0e\x32\x15.tfplugin5.StringKind\x12\x12\n\ndeprecated\x18\t \x01(\x08\x1a\xf9\x01\n\x0bNestedBlock\x12\x11\n\ttype_name\x18\x01 \x01(\t\x12&\n\x05\x62lock\x18\x02 \x01(\x0b\x32\x17.tfplugin5.Schema.Block\x12:\n\x07nesting\x18\x03 \x01(\x0e\x32).tfplugin5.Schema.NestedBlock.NestingMode\x12\x11\n\tmin_items\x18\x04 \x01(\x03\x12\x11\n\tmax_items\x18\x05 \x01(\x03\"M\n\x0bNestingMode\x12\x0b\n\x07INVALID\x10\x00\x12\n\n\x06SINGLE\x10\x01\x12\x08\n\x04LIST\x10\x02\x12\x07\n\x03SET\x10\x03\x12\x07\n\x03MAP\x10\x04\x12\t\n\x05GROUP\x10\x05\"P\n\x12ServerCapabilities\x12\x14\n\x0cplan_destroy\x18\x01 \x01(\x08\x12$\n\x1cget_provider_schema_optional\x18\x02 \x01(\x08\"\xda\x02\n\x0bGetMetadata\x1a\t\n\x07Request\x1a\xef\x01\n\x08Response\x12:\n\x13server_capabilities\x18\x01 \x01(\x0b\x32\x1d.tfplugin5.ServerCapabilities\x12*\n\x0b\x64iagnostics\x18\x02 \x03(\x0b\x32\x15.tfplugin5.Diagnostic\x12?\n\x0c\x64\x61ta_sources\x18\x03 \x03(\x0b\x32).tfplugin5.GetMetadata.DataSourceMetadata\x12:\n\tresources\x18\x04 \x03(\x0b\x32\'.tfplugin5.GetMetadata.ResourceMetadata\x1a\'\n\x12\x44\x61taSourceMetadata\x12\x11\n\ttype_name\x18\x01 \x01(\t\x1a%\n\x10ResourceMetadata\x12\x11\n\ttype_name\x18\x01 \x01(\t\"\xab\x04\n\x11GetProviderSchema\x1a\t\n\x07Request\x1a\x8a\x04\n\x08Response\x12#\n\x08provider\x18\x01 \x01(\x0b\x32\x11.tfplugin5.Schema\x12T\n\x10resource_schemas\x18\x02 \x03(\x0b\x32:.tfplugin5.GetProviderSchema.Response.ResourceSchemasEntry\x12Y\n\x13\x64\x61ta_source_schemas\x18\x03 \x03(\x0b\x32<.tfplugin5.GetProviderSchema.Response.DataSourceSchemasEntry\x12*\n\x0b\x64iagnostics\x18\x04 \x03(\x0b\x32\x15.tfplugin5.Diagnostic\x12(\n\rprovider_meta\x18\x05 \x01(\x0b\x32\x11.tfplugin5.Schema\x12:\n\x13server_capabilities\x18\x06 \x01(\x0b\x32\x1d.tfplugin5.ServerCapabilities\x1aI\n\x14ResourceSchemasEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12 \n\x05value\x18\x02 \x01(\x0b\x32\x11.tfplugin5.Schema:\x02\x38\x01\x1aK\n\x16\x44\x61taSourceSchemasEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12 \n\x05value\x18\x02 \x01(\x0b\x32\x11.tfplugin5.Schema:\x02\x38\x01\"\xb5\x01\n\x15PrepareProviderConfig\x1a\x32\n\x07Request\x12\'\n\x06\x63onfig\x18\x01 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x1ah\n\x08Response\x12\x30\n\x0fprepared_config\x18\x01 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12*\n\x0b\x64iagnostics\x18\x02 \x03(\x0b\x32\x15.tfplugin5.Diagnostic\"\xd6\x01\n\x14UpgradeResourceState\x1aU\n\x07Request\x12\x11\n\ttype_name\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\x03\x12&\n\traw_state\x18\x03 \x01(\x0b\x32\x13.tfplugin5.RawState\x1ag\n\x08Response\x12/\n\x0eupgraded_state\x18\x01 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12*\n\x0b\x64iagnostics\x18\x02 \x03(\x0b\x32\x15.tfplugin5.Diagnostic\"\x9b\x01\n\x1aValidateResourceTypeConfig\x1a\x45\n\x07Request\x12\x11\n\ttype_name\x18\x01 \x01(\t\x12\'\n\x06\x63onfig\x18\x02 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x1a\x36\n\x08Response\x12*\n\x0b\x64iagnostics\x18\x01 \x03(\x0b\x32\x15.tfplugin5.Diagnostic\"\x99\x01\n\x18ValidateDataSourceConfig\x1a\x45\n\x07Request\x12\x11\n\ttype_name\x18\x01 \x01(\t\x12\'\n\x06\x63onfig\x18\x02 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x1a\x36\n\x08Response\x12*\n\x0b\x64iagnostics\x18\x01 \x03(\x0b\x32\x15.tfplugin5.Diagnostic\"\x92\x01\n\tConfigure\x1aM\n\x07Request\x12\x19\n\x11terraform_version\x18\x01 \x01(\t\x12\'\n\x06\x63onfig\x18\x02 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x1a\x36\n\x08Response\x12*\n\x0b\x64iagnostics\x18\x01 \x03(\x0b\x32\x15.tfplugin5.Diagnostic\"\x93\x02\n\x0cReadResource\x1a\x8d\x01\n\x07Request\x12\x11\n\ttype_name\x18\x01 \x01(\t\x12.\n\rcurrent_state\x18\x02 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12\x0f\n\x07private\x18\x03 \x01(\x0c\x12.\n\rprovider_meta\x18\x04 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x1as\n\x08Response\x12*\n\tnew_state\x18\x01 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12*\n\x0b\x64iagnostics\x18\x02 \x03(\x0b\x32\x15.tfplugin5.Diagnostic\x12\x0f\n\x07private\x18\x03 \x01(\x0c\"\xd8\x03\n\x12PlanResourceChange\x1a\xef\x01\n\x07Request\x12\x11\n\ttype_name\x18\x01 \x01(\t\x12,\n\x0bprior_state\x18\x02 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12\x33\n\x12proposed_new_state\x18\x03 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12\'\n\x06\x63onfig\x18\x04 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12\x15\n\rprior_private\x18\x05 \x01(\x0c\x12.\n\rprovider_meta\x18\x06 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x1a\xcf\x01\n\x08Response\x12.\n\rplanned_state\x18\x01 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12\x32\n\x10requires_replace\x18\x02 \x03(\x0b\x32\x18.tfplugin5.AttributePath\x12\x17\n\x0fplanned_private\x18\x03 \x01(\x0c\x12*\n\x0b\x64iagnostics\x18\x04 \x03(\x0b\x32\x15.tfplugin5.Diagnostic\x12\x1a\n\x12legacy_type_system\x18\x05 \x01(\x08\"\x96\x03\n\x13\x41pplyResourceChange\x1a\xec\x01\n\x07Request\x12\x11\n\ttype_name\x18\x01 \x01(\t\x12,\n\x0bprior_state\x18\x02 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12.\n\rplanned_state\x18\x03 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12\'\n\x06\x63onfig\x18\x04 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12\x17\n\x0fplanned_private\x18\x05 \x01(\x0c\x12.\n\rprovider_meta\x18\x06 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x1a\x8f\x01\n\x08Response\x12*\n\tnew_state\x18\x01 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12\x0f\n\x07private\x18\x02 \x01(\x0c\x12*\n\x0b\x64iagnostics\x18\x03 \x03(\x0b\x32\x15.tfplugin5.Diagnostic\x12\x1a\n\x12legacy_type_system\x18\x04 \x01(\x08\"\xa5\x02\n\x13ImportResourceState\x1a(\n\x07Request\x12\x11\n\ttype_name\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\x1a^\n\x10ImportedResource\x12\x11\n\ttype_name\x18\x01 \x01(\t\x12&\n\x05state\x18\x02 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12\x0f\n\x07private\x18\x03 \x01(\x0c\x1a\x83\x01\n\x08Response\x12K\n\x12imported_resources\x18\x01 \x03(\x0b\x32/.tfplugin5.ImportResourceState.ImportedResource\x12*\n\x0b\x64iagnostics\x18\x02 \x03(\x0b\x32\x15.tfplugin5.Diagnostic\"\xe7\x01\n\x0eReadDataSource\x1au\n\x07Request\x12\x11\n\ttype_name\x18\x01 \x01(\t\x12\'\n\x06\x63onfig\x18\x02 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12.\n\rprovider_meta\x18\x03 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x1a^\n\x08Response\x12&\n\x05state\x18\x01 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12*\n\x0b\x64iagnostics\x18\x02 \x03(\x0b\x32\x15.tfplugin5.Diagnostic\"\x81\x01\n\x14GetProvisionerSchema\x1a\t\n\x07Request\x1a^\n\x08Response\x12&\n\x0bprovisioner\x18\x01 \x01(\x0b\x32\x11.tfplugin5.Schema\x12*\n\x0b\x64iagnostics\x18\x02 \x03(\x0b\x32\x15.tfplugin5.Diagnostic\"\x87\x01\n\x19ValidateProvisionerConfig\x1a\x32\n\x07Request\x12\'\n\x06\x63onfig\x18\x01 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x1a\x36\n\x08Response\x12*\n\x0b\x64iagnostics\x18\x01 \x03(\x0b\x32\x15.tfplugin5.Diagnostic\"\xbc\x01\n\x11ProvisionResource\x1a_\n\x07Request\x12\'\n\x06\x63onfig\x18\x01 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x12+\n\nconnection\x18\x02 \x01(\x0b\x32\x17.tfplugin5.DynamicValue\x1a\x46\n\x08Response\x12\x0e\n\x06output\x18\x01 \x01(\t\x12*\n\x0b\x64iagnostics\x18\x02 \x03(\x0b\x32\x15.tfplugin5.Diagnostic*%\n\nStringKind\x12\t\n\x05PLAIN\x10\x00\x12\x0c\n\x08MARKDOWN\x10\x01\x32\xe7\t\n\x08Provider\x12N\n\x0bGetMetadata\x12\x1e.tfplugin5.GetMetadata.Request\x1a\x1f.tfplugin5.GetMetadata.Response\x12X\n\tGetSchema\x12$.tfplugin5.GetProviderSchema.Request\x1a%.tfplugin5.GetProviderSchema.Response\x12l\n\x15PrepareProviderConfig\x12(.tfplugin5.PrepareProviderConfig.Request\x1a).tfplugin5.PrepareProviderConfig.Response\x12{\n\x1aValidateResourceTypeConfig\x12-.tfplugin5.ValidateResourceTypeConfig.Request\x1a..tfplugin5.ValidateResourceTypeConfig.Response\x12u\n\x18ValidateDataSourceConfig\x12+.tfplugin5.ValidateDataSourceConfig.Request\x1a,.tfplugin5.ValidateDataSourceConfig.Response\x12i\n\x14UpgradeResourceState\x12\'.tfplugin5.UpgradeResourceState.Request\x1a(.tfplugin5.UpgradeResourceState.Response\x12H\n\tConfigure\x12\x1c.tfplugin5.Configure.Request\x1a\x1d.tfplugin5.Configure.Response\x12Q\n\x0cReadResource\x12\x1f.tfplugin5.ReadResource.Request\x1a .tfplugin5.ReadResource.Response\x12\x63\n\x12PlanResourceChange\x12%.tfplugin5.PlanResourceChange.Request\x1a&.tfplugin5.PlanResourceChange.Response\x12\x66\n\x13\x41pplyResourceChange\x12&.tfplugin5.ApplyResourceChange.Request\x1a\'.tfplugin5.ApplyResourceChange.Response\x12\x66\n\x13ImportResourceState\x12&.tfplugin5.ImportResourceState.Request\x1a\'.tfplugin5.ImportResourceState.Response\x12W\n\x0eReadDataSource\x12!.tfplugin5.ReadDataSource.Request\x1a\".tfplugin5.ReadDataSource.Response\x12\x39\n\x04Stop\x12\x17.tfplugin5.Stop.Request\x1a\x18.tfplugin5.Stop.Response2\x86\x03\n\x0bProvisioner\x12^\n\tGetSchema\x12\'.tfplugin5.GetProvisionerSchema.Request\x1a(.tfplugin5.GetProvisionerSchema.Response\x12x\n\x19ValidateProvisionerConfig\x12,.tfplugin5.ValidateProvisionerConfig.Request\x1a-.tfplugin5.ValidateProvisionerConfig.Response\x12\x62\n\x11ProvisionResource\x12$.tfplugin5.ProvisionResource.Request\x1a%.tfplugin5.ProvisionResource.Response0\x01\x12\x39\n\x04Stop\x12\x17.tfplugin5.Stop.Request\x1a\x18.tfplugin5.Stop.Responseb\x06proto3')
+)
+
+_STRINGKIND = _descriptor.EnumDescriptor(
+  name='StringKind',
+  full_name='tfplugin5.StringKind',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='PLAIN', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MARKDOWN', index=1, number=1,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=5380,
+  serialized_end=5417,
+)
+_sym_db.RegisterEnumDescriptor(_STRINGKIND)
+
+StringKind = enum_type_wrapper.EnumTypeWrapper(_STRINGKIND)
+PLAIN = 0
+MARKDOWN = 1
+
+
+_DIAGNOSTIC_SEVERITY = _descriptor.EnumDescriptor(
+  name='Severity',
+  full_name='tfplugin5.Diagnostic.Severity',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='INVALID', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ERROR', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WARNING', index=2, number=2,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=244,
+  serialized_end=291,
+)
+_sym_db.RegisterEnumDescriptor(_DIAGNOSTIC_SEVERITY)
+
+_SCHEMA_NESTEDBLOCK_NESTINGMODE = _descriptor.EnumDescriptor(
+  name='NestingMode',
+  full_name='tfplugin5.Schema.NestedBlock.NestingMode',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='INVALID', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SINGLE', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='LIST', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SET', index=3, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MAP', index=4, number=4,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='GROUP', index=5, number=5,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=1295,
+  serialized_end=1372,
+)
+_sym_db.RegisterEnumDescriptor(_SCHEMA_NESTEDBLOCK_NESTINGMODE)
+
+
+_DYNAMICVALUE = _descriptor.Descriptor(
+  name='DynamicValue',
+  full_name='tfplugin5.DynamicValue',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='msgpack', full_name='tfplugin5.DynamicValue.msgpack', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='json', full_name='tfplugin5.DynamicValue.json', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=54,
+  serialized_end=99,
+)
+
+
+_DIAGNOSTIC = _descriptor.Descriptor(
+  name='Diagnostic',
+  full_name='tfplugin5.Diagnostic',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='severity', full_name='tfplugin5.Diagnostic.severity', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='summary', full_name='tfplugin5.Diagnostic.summary', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='detail', full_name='tfplugin5.Diagnostic.detail', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='attribute', full_name='tfplugin5.Diagnostic.attribute', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _DIAGNOSTIC_SEVERITY,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=102,
+  serialized_end=291,
+)
+
+
+_ATTRIBUTEPATH_STEP = _descriptor.Descriptor(
+  name='Step',
+  full_name='tfplugin5.AttributePath.Step',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='attribute_name', full_name='tfplugin5.AttributePath.Step.attribute_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='element_key_string', full_name='tfplugin5.AttributePath.Step.element_key_string', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='element_key_int', full_name='tfplugin5.AttributePath.Step.element_key_int', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='selector', full_name='tfplugin5.AttributePath.Step.selector',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=357,
+  serialized_end=458,
+)
+
+_ATTRIBUTEPATH = _descriptor.Descriptor(
+  name='AttributePath',
+  full_name='tfplugin5.AttributePath',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='steps', full_name='tfplugin5.AttributePath.steps', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_ATTRIBUTEPATH_STEP, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=294,
+  serialized_end=458,
+)
+
+
+_STOP_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.Stop.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=468,
+  serialized_end=477,
+)
+
+_STOP_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.Stop.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Error', full_name='tfplugin5.Stop.Response.Error', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=479,
+  serialized_end=504,
+)
+
+_STOP = _descriptor.Descriptor(
+  name='Stop',
+  full_name='tfplugin5.Stop',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_STOP_REQUEST, _STOP_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=460,
+  serialized_end=504,
+)
+
+
+_RAWSTATE_FLATMAPENTRY = _descriptor.Descriptor(
+  name='FlatmapEntry',
+  full_name='tfplugin5.RawState.FlatmapEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='tfplugin5.RawState.FlatmapEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='tfplugin5.RawState.FlatmapEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=_b('8\001'),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=583,
+  serialized_end=629,
+)
+
+_RAWSTATE = _descriptor.Descriptor(
+  name='RawState',
+  full_name='tfplugin5.RawState',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='json', full_name='tfplugin5.RawState.json', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flatmap', full_name='tfplugin5.RawState.flatmap', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_RAWSTATE_FLATMAPENTRY, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=506,
+  serialized_end=629,
+)
+
+
+_SCHEMA_BLOCK = _descriptor.Descriptor(
+  name='Block',
+  full_name='tfplugin5.Schema.Block',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='version', full_name='tfplugin5.Schema.Block.version', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='attributes', full_name='tfplugin5.Schema.Block.attributes', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='block_types', full_name='tfplugin5.Schema.Block.block_types', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='description', full_name='tfplugin5.Schema.Block.description', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='description_kind', full_name='tfplugin5.Schema.Block.description_kind', index=4,
+      number=5, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='deprecated', full_name='tfplugin5.Schema.Block.deprecated', index=5,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=700,
+  serialized_end=915,
+)
+
+_SCHEMA_ATTRIBUTE = _descriptor.Descriptor(
+  name='Attribute',
+  full_name='tfplugin5.Schema.Attribute',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='tfplugin5.Schema.Attribute.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='tfplugin5.Schema.Attribute.type', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='description', full_name='tfplugin5.Schema.Attribute.description', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='required', full_name='tfplugin5.Schema.Attribute.required', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='optional', full_name='tfplugin5.Schema.Attribute.optional', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='computed', full_name='tfplugin5.Schema.Attribute.computed', index=5,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sensitive', full_name='tfplugin5.Schema.Attribute.sensitive', index=6,
+      number=7, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='description_kind', full_name='tfplugin5.Schema.Attribute.description_kind', index=7,
+      number=8, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='deprecated', full_name='tfplugin5.Schema.Attribute.deprecated', index=8,
+      number=9, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=918,
+  serialized_end=1120,
+)
+
+_SCHEMA_NESTEDBLOCK = _descriptor.Descriptor(
+  name='NestedBlock',
+  full_name='tfplugin5.Schema.NestedBlock',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type_name', full_name='tfplugin5.Schema.NestedBlock.type_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='block', full_name='tfplugin5.Schema.NestedBlock.block', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nesting', full_name='tfplugin5.Schema.NestedBlock.nesting', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='min_items', full_name='tfplugin5.Schema.NestedBlock.min_items', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='max_items', full_name='tfplugin5.Schema.NestedBlock.max_items', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _SCHEMA_NESTEDBLOCK_NESTINGMODE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1123,
+  serialized_end=1372,
+)
+
+_SCHEMA = _descriptor.Descriptor(
+  name='Schema',
+  full_name='tfplugin5.Schema',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='version', full_name='tfplugin5.Schema.version', index=0,
+      number=1, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='block', full_name='tfplugin5.Schema.block', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_SCHEMA_BLOCK, _SCHEMA_ATTRIBUTE, _SCHEMA_NESTEDBLOCK, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=632,
+  serialized_end=1372,
+)
+
+
+_SERVERCAPABILITIES = _descriptor.Descriptor(
+  name='ServerCapabilities',
+  full_name='tfplugin5.ServerCapabilities',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='plan_destroy', full_name='tfplugin5.ServerCapabilities.plan_destroy', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='get_provider_schema_optional', full_name='tfplugin5.ServerCapabilities.get_provider_schema_optional', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1374,
+  serialized_end=1454,
+)
+
+
+_GETMETADATA_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.GetMetadata.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=468,
+  serialized_end=477,
+)
+
+_GETMETADATA_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.GetMetadata.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='server_capabilities', full_name='tfplugin5.GetMetadata.Response.server_capabilities', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.GetMetadata.Response.diagnostics', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='data_sources', full_name='tfplugin5.GetMetadata.Response.data_sources', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='resources', full_name='tfplugin5.GetMetadata.Response.resources', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1484,
+  serialized_end=1723,
+)
+
+_GETMETADATA_DATASOURCEMETADATA = _descriptor.Descriptor(
+  name='DataSourceMetadata',
+  full_name='tfplugin5.GetMetadata.DataSourceMetadata',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type_name', full_name='tfplugin5.GetMetadata.DataSourceMetadata.type_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1725,
+  serialized_end=1764,
+)
+
+_GETMETADATA_RESOURCEMETADATA = _descriptor.Descriptor(
+  name='ResourceMetadata',
+  full_name='tfplugin5.GetMetadata.ResourceMetadata',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type_name', full_name='tfplugin5.GetMetadata.ResourceMetadata.type_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1766,
+  serialized_end=1803,
+)
+
+_GETMETADATA = _descriptor.Descriptor(
+  name='GetMetadata',
+  full_name='tfplugin5.GetMetadata',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_GETMETADATA_REQUEST, _GETMETADATA_RESPONSE, _GETMETADATA_DATASOURCEMETADATA, _GETMETADATA_RESOURCEMETADATA, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1457,
+  serialized_end=1803,
+)
+
+
+_GETPROVIDERSCHEMA_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.GetProviderSchema.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=468,
+  serialized_end=477,
+)
+
+_GETPROVIDERSCHEMA_RESPONSE_RESOURCESCHEMASENTRY = _descriptor.Descriptor(
+  name='ResourceSchemasEntry',
+  full_name='tfplugin5.GetProviderSchema.Response.ResourceSchemasEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='tfplugin5.GetProviderSchema.Response.ResourceSchemasEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='tfplugin5.GetProviderSchema.Response.ResourceSchemasEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=_b('8\001'),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2211,
+  serialized_end=2284,
+)
+
+_GETPROVIDERSCHEMA_RESPONSE_DATASOURCESCHEMASENTRY = _descriptor.Descriptor(
+  name='DataSourceSchemasEntry',
+  full_name='tfplugin5.GetProviderSchema.Response.DataSourceSchemasEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='tfplugin5.GetProviderSchema.Response.DataSourceSchemasEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='tfplugin5.GetProviderSchema.Response.DataSourceSchemasEntry.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=_b('8\001'),
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2286,
+  serialized_end=2361,
+)
+
+_GETPROVIDERSCHEMA_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.GetProviderSchema.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='provider', full_name='tfplugin5.GetProviderSchema.Response.provider', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='resource_schemas', full_name='tfplugin5.GetProviderSchema.Response.resource_schemas', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='data_source_schemas', full_name='tfplugin5.GetProviderSchema.Response.data_source_schemas', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.GetProviderSchema.Response.diagnostics', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='provider_meta', full_name='tfplugin5.GetProviderSchema.Response.provider_meta', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='server_capabilities', full_name='tfplugin5.GetProviderSchema.Response.server_capabilities', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_GETPROVIDERSCHEMA_RESPONSE_RESOURCESCHEMASENTRY, _GETPROVIDERSCHEMA_RESPONSE_DATASOURCESCHEMASENTRY, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1839,
+  serialized_end=2361,
+)
+
+_GETPROVIDERSCHEMA = _descriptor.Descriptor(
+  name='GetProviderSchema',
+  full_name='tfplugin5.GetProviderSchema',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_GETPROVIDERSCHEMA_REQUEST, _GETPROVIDERSCHEMA_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1806,
+  serialized_end=2361,
+)
+
+
+_PREPAREPROVIDERCONFIG_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.PrepareProviderConfig.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='config', full_name='tfplugin5.PrepareProviderConfig.Request.config', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2389,
+  serialized_end=2439,
+)
+
+_PREPAREPROVIDERCONFIG_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.PrepareProviderConfig.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='prepared_config', full_name='tfplugin5.PrepareProviderConfig.Response.prepared_config', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.PrepareProviderConfig.Response.diagnostics', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2441,
+  serialized_end=2545,
+)
+
+_PREPAREPROVIDERCONFIG = _descriptor.Descriptor(
+  name='PrepareProviderConfig',
+  full_name='tfplugin5.PrepareProviderConfig',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_PREPAREPROVIDERCONFIG_REQUEST, _PREPAREPROVIDERCONFIG_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2364,
+  serialized_end=2545,
+)
+
+
+_UPGRADERESOURCESTATE_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.UpgradeResourceState.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type_name', full_name='tfplugin5.UpgradeResourceState.Request.type_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='version', full_name='tfplugin5.UpgradeResourceState.Request.version', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='raw_state', full_name='tfplugin5.UpgradeResourceState.Request.raw_state', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2572,
+  serialized_end=2657,
+)
+
+_UPGRADERESOURCESTATE_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.UpgradeResourceState.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='upgraded_state', full_name='tfplugin5.UpgradeResourceState.Response.upgraded_state', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.UpgradeResourceState.Response.diagnostics', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2659,
+  serialized_end=2762,
+)
+
+_UPGRADERESOURCESTATE = _descriptor.Descriptor(
+  name='UpgradeResourceState',
+  full_name='tfplugin5.UpgradeResourceState',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_UPGRADERESOURCESTATE_REQUEST, _UPGRADERESOURCESTATE_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2548,
+  serialized_end=2762,
+)
+
+
+_VALIDATERESOURCETYPECONFIG_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.ValidateResourceTypeConfig.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type_name', full_name='tfplugin5.ValidateResourceTypeConfig.Request.type_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='config', full_name='tfplugin5.ValidateResourceTypeConfig.Request.config', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2795,
+  serialized_end=2864,
+)
+
+_VALIDATERESOURCETYPECONFIG_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.ValidateResourceTypeConfig.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.ValidateResourceTypeConfig.Response.diagnostics', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2866,
+  serialized_end=2920,
+)
+
+_VALIDATERESOURCETYPECONFIG = _descriptor.Descriptor(
+  name='ValidateResourceTypeConfig',
+  full_name='tfplugin5.ValidateResourceTypeConfig',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_VALIDATERESOURCETYPECONFIG_REQUEST, _VALIDATERESOURCETYPECONFIG_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2765,
+  serialized_end=2920,
+)
+
+
+_VALIDATEDATASOURCECONFIG_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.ValidateDataSourceConfig.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type_name', full_name='tfplugin5.ValidateDataSourceConfig.Request.type_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='config', full_name='tfplugin5.ValidateDataSourceConfig.Request.config', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2795,
+  serialized_end=2864,
+)
+
+_VALIDATEDATASOURCECONFIG_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.ValidateDataSourceConfig.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.ValidateDataSourceConfig.Response.diagnostics', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2866,
+  serialized_end=2920,
+)
+
+_VALIDATEDATASOURCECONFIG = _descriptor.Descriptor(
+  name='ValidateDataSourceConfig',
+  full_name='tfplugin5.ValidateDataSourceConfig',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_VALIDATEDATASOURCECONFIG_REQUEST, _VALIDATEDATASOURCECONFIG_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2923,
+  serialized_end=3076,
+)
+
+
+_CONFIGURE_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.Configure.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='terraform_version', full_name='tfplugin5.Configure.Request.terraform_version', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='config', full_name='tfplugin5.Configure.Request.config', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3092,
+  serialized_end=3169,
+)
+
+_CONFIGURE_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.Configure.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.Configure.Response.diagnostics', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2866,
+  serialized_end=2920,
+)
+
+_CONFIGURE = _descriptor.Descriptor(
+  name='Configure',
+  full_name='tfplugin5.Configure',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_CONFIGURE_REQUEST, _CONFIGURE_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3079,
+  serialized_end=3225,
+)
+
+
+_READRESOURCE_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.ReadResource.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type_name', full_name='tfplugin5.ReadResource.Request.type_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='current_state', full_name='tfplugin5.ReadResource.Request.current_state', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='private', full_name='tfplugin5.ReadResource.Request.private', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='provider_meta', full_name='tfplugin5.ReadResource.Request.provider_meta', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3245,
+  serialized_end=3386,
+)
+
+_READRESOURCE_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.ReadResource.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='new_state', full_name='tfplugin5.ReadResource.Response.new_state', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.ReadResource.Response.diagnostics', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='private', full_name='tfplugin5.ReadResource.Response.private', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3388,
+  serialized_end=3503,
+)
+
+_READRESOURCE = _descriptor.Descriptor(
+  name='ReadResource',
+  full_name='tfplugin5.ReadResource',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_READRESOURCE_REQUEST, _READRESOURCE_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3228,
+  serialized_end=3503,
+)
+
+
+_PLANRESOURCECHANGE_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.PlanResourceChange.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type_name', full_name='tfplugin5.PlanResourceChange.Request.type_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='prior_state', full_name='tfplugin5.PlanResourceChange.Request.prior_state', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='proposed_new_state', full_name='tfplugin5.PlanResourceChange.Request.proposed_new_state', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='config', full_name='tfplugin5.PlanResourceChange.Request.config', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='prior_private', full_name='tfplugin5.PlanResourceChange.Request.prior_private', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='provider_meta', full_name='tfplugin5.PlanResourceChange.Request.provider_meta', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3529,
+  serialized_end=3768,
+)
+
+_PLANRESOURCECHANGE_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.PlanResourceChange.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='planned_state', full_name='tfplugin5.PlanResourceChange.Response.planned_state', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='requires_replace', full_name='tfplugin5.PlanResourceChange.Response.requires_replace', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='planned_private', full_name='tfplugin5.PlanResourceChange.Response.planned_private', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.PlanResourceChange.Response.diagnostics', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='legacy_type_system', full_name='tfplugin5.PlanResourceChange.Response.legacy_type_system', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3771,
+  serialized_end=3978,
+)
+
+_PLANRESOURCECHANGE = _descriptor.Descriptor(
+  name='PlanResourceChange',
+  full_name='tfplugin5.PlanResourceChange',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_PLANRESOURCECHANGE_REQUEST, _PLANRESOURCECHANGE_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3506,
+  serialized_end=3978,
+)
+
+
+_APPLYRESOURCECHANGE_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.ApplyResourceChange.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type_name', full_name='tfplugin5.ApplyResourceChange.Request.type_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='prior_state', full_name='tfplugin5.ApplyResourceChange.Request.prior_state', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='planned_state', full_name='tfplugin5.ApplyResourceChange.Request.planned_state', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='config', full_name='tfplugin5.ApplyResourceChange.Request.config', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='planned_private', full_name='tfplugin5.ApplyResourceChange.Request.planned_private', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='provider_meta', full_name='tfplugin5.ApplyResourceChange.Request.provider_meta', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4005,
+  serialized_end=4241,
+)
+
+_APPLYRESOURCECHANGE_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.ApplyResourceChange.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='new_state', full_name='tfplugin5.ApplyResourceChange.Response.new_state', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='private', full_name='tfplugin5.ApplyResourceChange.Response.private', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.ApplyResourceChange.Response.diagnostics', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='legacy_type_system', full_name='tfplugin5.ApplyResourceChange.Response.legacy_type_system', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4244,
+  serialized_end=4387,
+)
+
+_APPLYRESOURCECHANGE = _descriptor.Descriptor(
+  name='ApplyResourceChange',
+  full_name='tfplugin5.ApplyResourceChange',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_APPLYRESOURCECHANGE_REQUEST, _APPLYRESOURCECHANGE_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3981,
+  serialized_end=4387,
+)
+
+
+_IMPORTRESOURCESTATE_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.ImportResourceState.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type_name', full_name='tfplugin5.ImportResourceState.Request.type_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='id', full_name='tfplugin5.ImportResourceState.Request.id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4413,
+  serialized_end=4453,
+)
+
+_IMPORTRESOURCESTATE_IMPORTEDRESOURCE = _descriptor.Descriptor(
+  name='ImportedResource',
+  full_name='tfplugin5.ImportResourceState.ImportedResource',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type_name', full_name='tfplugin5.ImportResourceState.ImportedResource.type_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='state', full_name='tfplugin5.ImportResourceState.ImportedResource.state', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='private', full_name='tfplugin5.ImportResourceState.ImportedResource.private', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4455,
+  serialized_end=4549,
+)
+
+_IMPORTRESOURCESTATE_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.ImportResourceState.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='imported_resources', full_name='tfplugin5.ImportResourceState.Response.imported_resources', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.ImportResourceState.Response.diagnostics', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4552,
+  serialized_end=4683,
+)
+
+_IMPORTRESOURCESTATE = _descriptor.Descriptor(
+  name='ImportResourceState',
+  full_name='tfplugin5.ImportResourceState',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_IMPORTRESOURCESTATE_REQUEST, _IMPORTRESOURCESTATE_IMPORTEDRESOURCE, _IMPORTRESOURCESTATE_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4390,
+  serialized_end=4683,
+)
+
+
+_READDATASOURCE_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.ReadDataSource.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type_name', full_name='tfplugin5.ReadDataSource.Request.type_name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='config', full_name='tfplugin5.ReadDataSource.Request.config', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='provider_meta', full_name='tfplugin5.ReadDataSource.Request.provider_meta', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4704,
+  serialized_end=4821,
+)
+
+_READDATASOURCE_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.ReadDataSource.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='state', full_name='tfplugin5.ReadDataSource.Response.state', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.ReadDataSource.Response.diagnostics', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4823,
+  serialized_end=4917,
+)
+
+_READDATASOURCE = _descriptor.Descriptor(
+  name='ReadDataSource',
+  full_name='tfplugin5.ReadDataSource',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_READDATASOURCE_REQUEST, _READDATASOURCE_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4686,
+  serialized_end=4917,
+)
+
+
+_GETPROVISIONERSCHEMA_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.GetProvisionerSchema.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=468,
+  serialized_end=477,
+)
+
+_GETPROVISIONERSCHEMA_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.GetProvisionerSchema.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='provisioner', full_name='tfplugin5.GetProvisionerSchema.Response.provisioner', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.GetProvisionerSchema.Response.diagnostics', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4955,
+  serialized_end=5049,
+)
+
+_GETPROVISIONERSCHEMA = _descriptor.Descriptor(
+  name='GetProvisionerSchema',
+  full_name='tfplugin5.GetProvisionerSchema',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_GETPROVISIONERSCHEMA_REQUEST, _GETPROVISIONERSCHEMA_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4920,
+  serialized_end=5049,
+)
+
+
+_VALIDATEPROVISIONERCONFIG_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.ValidateProvisionerConfig.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='config', full_name='tfplugin5.ValidateProvisionerConfig.Request.config', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2389,
+  serialized_end=2439,
+)
+
+_VALIDATEPROVISIONERCONFIG_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.ValidateProvisionerConfig.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.ValidateProvisionerConfig.Response.diagnostics', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2866,
+  serialized_end=2920,
+)
+
+_VALIDATEPROVISIONERCONFIG = _descriptor.Descriptor(
+  name='ValidateProvisionerConfig',
+  full_name='tfplugin5.ValidateProvisionerConfig',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_VALIDATEPROVISIONERCONFIG_REQUEST, _VALIDATEPROVISIONERCONFIG_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5052,
+  serialized_end=5187,
+)
+
+
+_PROVISIONRESOURCE_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='tfplugin5.ProvisionResource.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='config', full_name='tfplugin5.ProvisionResource.Request.config', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='connection', full_name='tfplugin5.ProvisionResource.Request.connection', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5211,
+  serialized_end=5306,
+)
+
+_PROVISIONRESOURCE_RESPONSE = _descriptor.Descriptor(
+  name='Response',
+  full_name='tfplugin5.ProvisionResource.Response',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='output', full_name='tfplugin5.ProvisionResource.Response.output', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='diagnostics', full_name='tfplugin5.ProvisionResource.Response.diagnostics', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5308,
+  serialized_end=5378,
+)
+
+_PROVISIONRESOURCE = _descriptor.Descriptor(
+  name='ProvisionResource',
+  full_name='tfplugin5.ProvisionResource',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+  ],
+  extensions=[
+  ],
+  nested_types=[_PROVISIONRESOURCE_REQUEST, _PROVISIONRESOURCE_RESPONSE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5190,
+  serialized_end=5378,
+)
+
+_DIAGNOSTIC.fields_by_name['severity'].enum_type = _DIAGNOSTIC_SEVERITY
+_DIAGNOSTIC.fields_by_name['attribute'].message_type = _ATTRIBUTEPATH
+_DIAGNOSTIC_SEVERITY.containing_type = _DIAGNOSTIC
+_ATTRIBUTEPATH_STEP.containing_type = _ATTRIBUTEPATH
+_ATTRIBUTEPATH_STEP.oneofs_by_name['selector'].fields.append(
+  _ATTRIBUTEPATH_STEP.fields_by_name['attribute_name'])
+_ATTRIBUTEPATH_STEP.fields_by_name['attribute_name'].containing_oneof = _ATTRIBUTEPATH_STEP.oneofs_by_name['selector']
+_ATTRIBUTEPATH_STEP.oneofs_by_name['selector'].fields.append(
+  _ATTRIBUTEPATH_STEP.fields_by_name['element_key_string'])
+_ATTRIBUTEPATH_STEP.fields_by_name['element_key_string'].containing_oneof = _ATTRIBUTEPATH_STEP.oneofs_by_name['selector']
+_ATTRIBUTEPATH_STEP.oneofs_by_name['selector'].fields.append(
+  _ATTRIBUTEPATH_STEP.fields_by_name['element_key_int'])
+_ATTRIBUTEPATH_STEP.fields_by_name['element_key_int'].containing_oneof = _ATTRIBUTEPATH_STEP.oneofs_by_name['selector']
+_ATTRIBUTEPATH.fields_by_name['steps'].message_type = _ATTRIBUTEPATH_STEP
+_STOP_REQUEST.containing_type = _STOP
+_STOP_RESPONSE.containing_type = _STOP
+_RAWSTATE_FLATMAPENTRY.containing_type = _RAWSTATE
+_RAWSTATE.fields_by_name['flatmap'].message_type = _RAWSTATE_FLATMAPENTRY
+_SCHEMA_BLOCK.fields_by_name['attributes'].message_type = _SCHEMA_ATTRIBUTE
+_SCHEMA_BLOCK.fields_by_name['block_types'].message_type = _SCHEMA_NESTEDBLOCK
+_SCHEMA_BLOCK.fields_by_name['description_kind'].enum_type = _STRINGKIND
+_SCHEMA_BLOCK.containing_type = _SCHEMA
+_SCHEMA_ATTRIBUTE.fields_by_name['description_kind'].enum_type = _STRINGKIND
+_SCHEMA_ATTRIBUTE.containing_type = _SCHEMA
+_SCHEMA_NESTEDBLOCK.fields_by_name['block'].message_type = _SCHEMA_BLOCK
+_SCHEMA_NESTEDBLOCK.fields_by_name['nesting'].enum_type = _SCHEMA_NESTEDBLOCK_NESTINGMODE
+_SCHEMA_NESTEDBLOCK.containing_type = _SCHEMA
+_SCHEMA_NESTEDBLOCK_NESTINGMODE.containing_type = _SCHEMA_NESTEDBLOCK
+_SCHEMA.fields_by_name['block'].message_type = _SCHEMA_BLOCK
+_GETMETADATA_REQUEST.containing_type = _GETMETADATA
+_GETMETADATA_RESPONSE.fields_by_name['server_capabilities'].message_type = _SERVERCAPABILITIES
+_GETMETADATA_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_GETMETADATA_RESPONSE.fields_by_name['data_sources'].message_type = _GETMETADATA_DATASOURCEMETADATA
+_GETMETADATA_RESPONSE.fields_by_name['resources'].message_type = _GETMETADATA_RESOURCEMETADATA
+_GETMETADATA_RESPONSE.containing_type = _GETMETADATA
+_GETMETADATA_DATASOURCEMETADATA.containing_type = _GETMETADATA
+_GETMETADATA_RESOURCEMETADATA.containing_type = _GETMETADATA
+_GETPROVIDERSCHEMA_REQUEST.containing_type = _GETPROVIDERSCHEMA
+_GETPROVIDERSCHEMA_RESPONSE_RESOURCESCHEMASENTRY.fields_by_name['value'].message_type = _SCHEMA
+_GETPROVIDERSCHEMA_RESPONSE_RESOURCESCHEMASENTRY.containing_type = _GETPROVIDERSCHEMA_RESPONSE
+_GETPROVIDERSCHEMA_RESPONSE_DATASOURCESCHEMASENTRY.fields_by_name['value'].message_type = _SCHEMA
+_GETPROVIDERSCHEMA_RESPONSE_DATASOURCESCHEMASENTRY.containing_type = _GETPROVIDERSCHEMA_RESPONSE
+_GETPROVIDERSCHEMA_RESPONSE.fields_by_name['provider'].message_type = _SCHEMA
+_GETPROVIDERSCHEMA_RESPONSE.fields_by_name['resource_schemas'].message_type = _GETPROVIDERSCHEMA_RESPONSE_RESOURCESCHEMASENTRY
+_GETPROVIDERSCHEMA_RESPONSE.fields_by_name['data_source_schemas'].message_type = _GETPROVIDERSCHEMA_RESPONSE_DATASOURCESCHEMASENTRY
+_GETPROVIDERSCHEMA_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_GETPROVIDERSCHEMA_RESPONSE.fields_by_name['provider_meta'].message_type = _SCHEMA
+_GETPROVIDERSCHEMA_RESPONSE.fields_by_name['server_capabilities'].message_type = _SERVERCAPABILITIES
+_GETPROVIDERSCHEMA_RESPONSE.containing_type = _GETPROVIDERSCHEMA
+_PREPAREPROVIDERCONFIG_REQUEST.fields_by_name['config'].message_type = _DYNAMICVALUE
+_PREPAREPROVIDERCONFIG_REQUEST.containing_type = _PREPAREPROVIDERCONFIG
+_PREPAREPROVIDERCONFIG_RESPONSE.fields_by_name['prepared_config'].message_type = _DYNAMICVALUE
+_PREPAREPROVIDERCONFIG_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_PREPAREPROVIDERCONFIG_RESPONSE.containing_type = _PREPAREPROVIDERCONFIG
+_UPGRADERESOURCESTATE_REQUEST.fields_by_name['raw_state'].message_type = _RAWSTATE
+_UPGRADERESOURCESTATE_REQUEST.containing_type = _UPGRADERESOURCESTATE
+_UPGRADERESOURCESTATE_RESPONSE.fields_by_name['upgraded_state'].message_type = _DYNAMICVALUE
+_UPGRADERESOURCESTATE_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_UPGRADERESOURCESTATE_RESPONSE.containing_type = _UPGRADERESOURCESTATE
+_VALIDATERESOURCETYPECONFIG_REQUEST.fields_by_name['config'].message_type = _DYNAMICVALUE
+_VALIDATERESOURCETYPECONFIG_REQUEST.containing_type = _VALIDATERESOURCETYPECONFIG
+_VALIDATERESOURCETYPECONFIG_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_VALIDATERESOURCETYPECONFIG_RESPONSE.containing_type = _VALIDATERESOURCETYPECONFIG
+_VALIDATEDATASOURCECONFIG_REQUEST.fields_by_name['config'].message_type = _DYNAMICVALUE
+_VALIDATEDATASOURCECONFIG_REQUEST.containing_type = _VALIDATEDATASOURCECONFIG
+_VALIDATEDATASOURCECONFIG_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_VALIDATEDATASOURCECONFIG_RESPONSE.containing_type = _VALIDATEDATASOURCECONFIG
+_CONFIGURE_REQUEST.fields_by_name['config'].message_type = _DYNAMICVALUE
+_CONFIGURE_REQUEST.containing_type = _CONFIGURE
+_CONFIGURE_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_CONFIGURE_RESPONSE.containing_type = _CONFIGURE
+_READRESOURCE_REQUEST.fields_by_name['current_state'].message_type = _DYNAMICVALUE
+_READRESOURCE_REQUEST.fields_by_name['provider_meta'].message_type = _DYNAMICVALUE
+_READRESOURCE_REQUEST.containing_type = _READRESOURCE
+_READRESOURCE_RESPONSE.fields_by_name['new_state'].message_type = _DYNAMICVALUE
+_READRESOURCE_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_READRESOURCE_RESPONSE.containing_type = _READRESOURCE
+_PLANRESOURCECHANGE_REQUEST.fields_by_name['prior_state'].message_type = _DYNAMICVALUE
+_PLANRESOURCECHANGE_REQUEST.fields_by_name['proposed_new_state'].message_type = _DYNAMICVALUE
+_PLANRESOURCECHANGE_REQUEST.fields_by_name['config'].message_type = _DYNAMICVALUE
+_PLANRESOURCECHANGE_REQUEST.fields_by_name['provider_meta'].message_type = _DYNAMICVALUE
+_PLANRESOURCECHANGE_REQUEST.containing_type = _PLANRESOURCECHANGE
+_PLANRESOURCECHANGE_RESPONSE.fields_by_name['planned_state'].message_type = _DYNAMICVALUE
+_PLANRESOURCECHANGE_RESPONSE.fields_by_name['requires_replace'].message_type = _ATTRIBUTEPATH
+_PLANRESOURCECHANGE_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_PLANRESOURCECHANGE_RESPONSE.containing_type = _PLANRESOURCECHANGE
+_APPLYRESOURCECHANGE_REQUEST.fields_by_name['prior_state'].message_type = _DYNAMICVALUE
+_APPLYRESOURCECHANGE_REQUEST.fields_by_name['planned_state'].message_type = _DYNAMICVALUE
+_APPLYRESOURCECHANGE_REQUEST.fields_by_name['config'].message_type = _DYNAMICVALUE
+_APPLYRESOURCECHANGE_REQUEST.fields_by_name['provider_meta'].message_type = _DYNAMICVALUE
+_APPLYRESOURCECHANGE_REQUEST.containing_type = _APPLYRESOURCECHANGE
+_APPLYRESOURCECHANGE_RESPONSE.fields_by_name['new_state'].message_type = _DYNAMICVALUE
+_APPLYRESOURCECHANGE_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_APPLYRESOURCECHANGE_RESPONSE.containing_type = _APPLYRESOURCECHANGE
+_IMPORTRESOURCESTATE_REQUEST.containing_type = _IMPORTRESOURCESTATE
+_IMPORTRESOURCESTATE_IMPORTEDRESOURCE.fields_by_name['state'].message_type = _DYNAMICVALUE
+_IMPORTRESOURCESTATE_IMPORTEDRESOURCE.containing_type = _IMPORTRESOURCESTATE
+_IMPORTRESOURCESTATE_RESPONSE.fields_by_name['imported_resources'].message_type = _IMPORTRESOURCESTATE_IMPORTEDRESOURCE
+_IMPORTRESOURCESTATE_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_IMPORTRESOURCESTATE_RESPONSE.containing_type = _IMPORTRESOURCESTATE
+_READDATASOURCE_REQUEST.fields_by_name['config'].message_type = _DYNAMICVALUE
+_READDATASOURCE_REQUEST.fields_by_name['provider_meta'].message_type = _DYNAMICVALUE
+_READDATASOURCE_REQUEST.containing_type = _READDATASOURCE
+_READDATASOURCE_RESPONSE.fields_by_name['state'].message_type = _DYNAMICVALUE
+_READDATASOURCE_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_READDATASOURCE_RESPONSE.containing_type = _READDATASOURCE
+_GETPROVISIONERSCHEMA_REQUEST.containing_type = _GETPROVISIONERSCHEMA
+_GETPROVISIONERSCHEMA_RESPONSE.fields_by_name['provisioner'].message_type = _SCHEMA
+_GETPROVISIONERSCHEMA_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_GETPROVISIONERSCHEMA_RESPONSE.containing_type = _GETPROVISIONERSCHEMA
+_VALIDATEPROVISIONERCONFIG_REQUEST.fields_by_name['config'].message_type = _DYNAMICVALUE
+_VALIDATEPROVISIONERCONFIG_REQUEST.containing_type = _VALIDATEPROVISIONERCONFIG
+_VALIDATEPROVISIONERCONFIG_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_VALIDATEPROVISIONERCONFIG_RESPONSE.containing_type = _VALIDATEPROVISIONERCONFIG
+_PROVISIONRESOURCE_REQUEST.fields_by_name['config'].message_type = _DYNAMICVALUE
+_PROVISIONRESOURCE_REQUEST.fields_by_name['connection'].message_type = _DYNAMICVALUE
+_PROVISIONRESOURCE_REQUEST.containing_type = _PROVISIONRESOURCE
+_PROVISIONRESOURCE_RESPONSE.fields_by_name['diagnostics'].message_type = _DIAGNOSTIC
+_PROVISIONRESOURCE_RESPONSE.containing_type = _PROVISIONRESOURCE
+DESCRIPTOR.message_types_by_name['DynamicValue'] = _DYNAMICVALUE
+DESCRIPTOR.message_types_by_name['Diagnostic'] = _DIAGNOSTIC
+DESCRIPTOR.message_types_by_name['AttributePath'] = _ATTRIBUTEPATH
+DESCRIPTOR.message_types_by_name['Stop'] = _STOP
+DESCRIPTOR.message_types_by_name['RawState'] = _RAWSTATE
+DESCRIPTOR.message_types_by_name['Schema'] = _SCHEMA
+DESCRIPTOR.message_types_by_name['ServerCapabilities'] = _SERVERCAPABILITIES
+DESCRIPTOR.message_types_by_name['GetMetadata'] = _GETMETADATA
+DESCRIPTOR.message_types_by_name['GetProviderSchema'] = _GETPROVIDERSCHEMA
+DESCRIPTOR.message_types_by_name['PrepareProviderConfig'] = _PREPAREPROVIDERCONFIG
+DESCRIPTOR.message_types_by_name['UpgradeResourceState'] = _UPGRADERESOURCESTATE
+DESCRIPTOR.message_types_by_name['ValidateResourceTypeConfig'] = _VALIDATERESOURCETYPECONFIG
+DESCRIPTOR.message_types_by_name['ValidateDataSourceConfig'] = _VALIDATEDATASOURCECONFIG
+DESCRIPTOR.message_types_by_name['Configure'] = _CONFIGURE
+DESCRIPTOR.message_types_by_name['ReadResource'] = _READRESOURCE
+DESCRIPTOR.message_types_by_name['PlanResourceChange'] = _PLANRESOURCECHANGE
+DESCRIPTOR.message_types_by_name['ApplyResourceChange'] = _APPLYRESOURCECHANGE
+DESCRIPTOR.message_types_by_name['ImportResourceState'] = _IMPORTRESOURCESTATE
+DESCRIPTOR.message_types_by_name['ReadDataSource'] = _READDATASOURCE
+DESCRIPTOR.message_types_by_name['GetProvisionerSchema'] = _GETPROVISIONERSCHEMA
+DESCRIPTOR.message_types_by_name['ValidateProvisionerConfig'] = _VALIDATEPROVISIONERCONFIG
+DESCRIPTOR.message_types_by_name['ProvisionResource'] = _PROVISIONRESOURCE
+DESCRIPTOR.enum_types_by_name['StringKind'] = _STRINGKIND
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+DynamicValue = _reflection.GeneratedProtocolMessageType('DynamicValue', (_message.Message,), {
+  'DESCRIPTOR' : _DYNAMICVALUE,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.DynamicValue)
+  })
+_sym_db.RegisterMessage(DynamicValue)
+
+Diagnostic = _reflection.GeneratedProtocolMessageType('Diagnostic', (_message.Message,), {
+  'DESCRIPTOR' : _DIAGNOSTIC,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.Diagnostic)
+  })
+_sym_db.RegisterMessage(Diagnostic)
+
+AttributePath = _reflection.GeneratedProtocolMessageType('AttributePath', (_message.Message,), {
+
+  'Step' : _reflection.GeneratedProtocolMessageType('Step', (_message.Message,), {
+    'DESCRIPTOR' : _ATTRIBUTEPATH_STEP,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.AttributePath.Step)
+    })
+  ,
+  'DESCRIPTOR' : _ATTRIBUTEPATH,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.AttributePath)
+  })
+_sym_db.RegisterMessage(AttributePath)
+_sym_db.RegisterMessage(AttributePath.Step)
+
+Stop = _reflection.GeneratedProtocolMessageType('Stop', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _STOP_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.Stop.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _STOP_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.Stop.Response)
+    })
+  ,
+  'DESCRIPTOR' : _STOP,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.Stop)
+  })
+_sym_db.RegisterMessage(Stop)
+_sym_db.RegisterMessage(Stop.Request)
+_sym_db.RegisterMessage(Stop.Response)
+
+RawState = _reflection.GeneratedProtocolMessageType('RawState', (_message.Message,), {
+
+  'FlatmapEntry' : _reflection.GeneratedProtocolMessageType('FlatmapEntry', (_message.Message,), {
+    'DESCRIPTOR' : _RAWSTATE_FLATMAPENTRY,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.RawState.FlatmapEntry)
+    })
+  ,
+  'DESCRIPTOR' : _RAWSTATE,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.RawState)
+  })
+_sym_db.RegisterMessage(RawState)
+_sym_db.RegisterMessage(RawState.FlatmapEntry)
+
+Schema = _reflection.GeneratedProtocolMessageType('Schema', (_message.Message,), {
+
+  'Block' : _reflection.GeneratedProtocolMessageType('Block', (_message.Message,), {
+    'DESCRIPTOR' : _SCHEMA_BLOCK,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.Schema.Block)
+    })
+  ,
+
+  'Attribute' : _reflection.GeneratedProtocolMessageType('Attribute', (_message.Message,), {
+    'DESCRIPTOR' : _SCHEMA_ATTRIBUTE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.Schema.Attribute)
+    })
+  ,
+
+  'NestedBlock' : _reflection.GeneratedProtocolMessageType('NestedBlock', (_message.Message,), {
+    'DESCRIPTOR' : _SCHEMA_NESTEDBLOCK,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.Schema.NestedBlock)
+    })
+  ,
+  'DESCRIPTOR' : _SCHEMA,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.Schema)
+  })
+_sym_db.RegisterMessage(Schema)
+_sym_db.RegisterMessage(Schema.Block)
+_sym_db.RegisterMessage(Schema.Attribute)
+_sym_db.RegisterMessage(Schema.NestedBlock)
+
+ServerCapabilities = _reflection.GeneratedProtocolMessageType('ServerCapabilities', (_message.Message,), {
+  'DESCRIPTOR' : _SERVERCAPABILITIES,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.ServerCapabilities)
+  })
+_sym_db.RegisterMessage(ServerCapabilities)
+
+GetMetadata = _reflection.GeneratedProtocolMessageType('GetMetadata', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _GETMETADATA_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.GetMetadata.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _GETMETADATA_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.GetMetadata.Response)
+    })
+  ,
+
+  'DataSourceMetadata' : _reflection.GeneratedProtocolMessageType('DataSourceMetadata', (_message.Message,), {
+    'DESCRIPTOR' : _GETMETADATA_DATASOURCEMETADATA,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.GetMetadata.DataSourceMetadata)
+    })
+  ,
+
+  'ResourceMetadata' : _reflection.GeneratedProtocolMessageType('ResourceMetadata', (_message.Message,), {
+    'DESCRIPTOR' : _GETMETADATA_RESOURCEMETADATA,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.GetMetadata.ResourceMetadata)
+    })
+  ,
+  'DESCRIPTOR' : _GETMETADATA,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.GetMetadata)
+  })
+_sym_db.RegisterMessage(GetMetadata)
+_sym_db.RegisterMessage(GetMetadata.Request)
+_sym_db.RegisterMessage(GetMetadata.Response)
+_sym_db.RegisterMessage(GetMetadata.DataSourceMetadata)
+_sym_db.RegisterMessage(GetMetadata.ResourceMetadata)
+
+GetProviderSchema = _reflection.GeneratedProtocolMessageType('GetProviderSchema', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _GETPROVIDERSCHEMA_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.GetProviderSchema.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+
+    'ResourceSchemasEntry' : _reflection.GeneratedProtocolMessageType('ResourceSchemasEntry', (_message.Message,), {
+      'DESCRIPTOR' : _GETPROVIDERSCHEMA_RESPONSE_RESOURCESCHEMASENTRY,
+      '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+      # @@protoc_insertion_point(class_scope:tfplugin5.GetProviderSchema.Response.ResourceSchemasEntry)
+      })
+    ,
+
+    'DataSourceSchemasEntry' : _reflection.GeneratedProtocolMessageType('DataSourceSchemasEntry', (_message.Message,), {
+      'DESCRIPTOR' : _GETPROVIDERSCHEMA_RESPONSE_DATASOURCESCHEMASENTRY,
+      '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+      # @@protoc_insertion_point(class_scope:tfplugin5.GetProviderSchema.Response.DataSourceSchemasEntry)
+      })
+    ,
+    'DESCRIPTOR' : _GETPROVIDERSCHEMA_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.GetProviderSchema.Response)
+    })
+  ,
+  'DESCRIPTOR' : _GETPROVIDERSCHEMA,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.GetProviderSchema)
+  })
+_sym_db.RegisterMessage(GetProviderSchema)
+_sym_db.RegisterMessage(GetProviderSchema.Request)
+_sym_db.RegisterMessage(GetProviderSchema.Response)
+_sym_db.RegisterMessage(GetProviderSchema.Response.ResourceSchemasEntry)
+_sym_db.RegisterMessage(GetProviderSchema.Response.DataSourceSchemasEntry)
+
+PrepareProviderConfig = _reflection.GeneratedProtocolMessageType('PrepareProviderConfig', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _PREPAREPROVIDERCONFIG_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.PrepareProviderConfig.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _PREPAREPROVIDERCONFIG_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.PrepareProviderConfig.Response)
+    })
+  ,
+  'DESCRIPTOR' : _PREPAREPROVIDERCONFIG,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.PrepareProviderConfig)
+  })
+_sym_db.RegisterMessage(PrepareProviderConfig)
+_sym_db.RegisterMessage(PrepareProviderConfig.Request)
+_sym_db.RegisterMessage(PrepareProviderConfig.Response)
+
+UpgradeResourceState = _reflection.GeneratedProtocolMessageType('UpgradeResourceState', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _UPGRADERESOURCESTATE_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.UpgradeResourceState.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _UPGRADERESOURCESTATE_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.UpgradeResourceState.Response)
+    })
+  ,
+  'DESCRIPTOR' : _UPGRADERESOURCESTATE,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.UpgradeResourceState)
+  })
+_sym_db.RegisterMessage(UpgradeResourceState)
+_sym_db.RegisterMessage(UpgradeResourceState.Request)
+_sym_db.RegisterMessage(UpgradeResourceState.Response)
+
+ValidateResourceTypeConfig = _reflection.GeneratedProtocolMessageType('ValidateResourceTypeConfig', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _VALIDATERESOURCETYPECONFIG_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ValidateResourceTypeConfig.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _VALIDATERESOURCETYPECONFIG_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ValidateResourceTypeConfig.Response)
+    })
+  ,
+  'DESCRIPTOR' : _VALIDATERESOURCETYPECONFIG,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.ValidateResourceTypeConfig)
+  })
+_sym_db.RegisterMessage(ValidateResourceTypeConfig)
+_sym_db.RegisterMessage(ValidateResourceTypeConfig.Request)
+_sym_db.RegisterMessage(ValidateResourceTypeConfig.Response)
+
+ValidateDataSourceConfig = _reflection.GeneratedProtocolMessageType('ValidateDataSourceConfig', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _VALIDATEDATASOURCECONFIG_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ValidateDataSourceConfig.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _VALIDATEDATASOURCECONFIG_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ValidateDataSourceConfig.Response)
+    })
+  ,
+  'DESCRIPTOR' : _VALIDATEDATASOURCECONFIG,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.ValidateDataSourceConfig)
+  })
+_sym_db.RegisterMessage(ValidateDataSourceConfig)
+_sym_db.RegisterMessage(ValidateDataSourceConfig.Request)
+_sym_db.RegisterMessage(ValidateDataSourceConfig.Response)
+
+Configure = _reflection.GeneratedProtocolMessageType('Configure', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _CONFIGURE_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.Configure.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _CONFIGURE_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.Configure.Response)
+    })
+  ,
+  'DESCRIPTOR' : _CONFIGURE,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.Configure)
+  })
+_sym_db.RegisterMessage(Configure)
+_sym_db.RegisterMessage(Configure.Request)
+_sym_db.RegisterMessage(Configure.Response)
+
+ReadResource = _reflection.GeneratedProtocolMessageType('ReadResource', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _READRESOURCE_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ReadResource.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _READRESOURCE_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ReadResource.Response)
+    })
+  ,
+  'DESCRIPTOR' : _READRESOURCE,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.ReadResource)
+  })
+_sym_db.RegisterMessage(ReadResource)
+_sym_db.RegisterMessage(ReadResource.Request)
+_sym_db.RegisterMessage(ReadResource.Response)
+
+PlanResourceChange = _reflection.GeneratedProtocolMessageType('PlanResourceChange', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _PLANRESOURCECHANGE_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.PlanResourceChange.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _PLANRESOURCECHANGE_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.PlanResourceChange.Response)
+    })
+  ,
+  'DESCRIPTOR' : _PLANRESOURCECHANGE,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.PlanResourceChange)
+  })
+_sym_db.RegisterMessage(PlanResourceChange)
+_sym_db.RegisterMessage(PlanResourceChange.Request)
+_sym_db.RegisterMessage(PlanResourceChange.Response)
+
+ApplyResourceChange = _reflection.GeneratedProtocolMessageType('ApplyResourceChange', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _APPLYRESOURCECHANGE_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ApplyResourceChange.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _APPLYRESOURCECHANGE_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ApplyResourceChange.Response)
+    })
+  ,
+  'DESCRIPTOR' : _APPLYRESOURCECHANGE,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.ApplyResourceChange)
+  })
+_sym_db.RegisterMessage(ApplyResourceChange)
+_sym_db.RegisterMessage(ApplyResourceChange.Request)
+_sym_db.RegisterMessage(ApplyResourceChange.Response)
+
+ImportResourceState = _reflection.GeneratedProtocolMessageType('ImportResourceState', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _IMPORTRESOURCESTATE_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ImportResourceState.Request)
+    })
+  ,
+
+  'ImportedResource' : _reflection.GeneratedProtocolMessageType('ImportedResource', (_message.Message,), {
+    'DESCRIPTOR' : _IMPORTRESOURCESTATE_IMPORTEDRESOURCE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ImportResourceState.ImportedResource)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _IMPORTRESOURCESTATE_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ImportResourceState.Response)
+    })
+  ,
+  'DESCRIPTOR' : _IMPORTRESOURCESTATE,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.ImportResourceState)
+  })
+_sym_db.RegisterMessage(ImportResourceState)
+_sym_db.RegisterMessage(ImportResourceState.Request)
+_sym_db.RegisterMessage(ImportResourceState.ImportedResource)
+_sym_db.RegisterMessage(ImportResourceState.Response)
+
+ReadDataSource = _reflection.GeneratedProtocolMessageType('ReadDataSource', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _READDATASOURCE_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ReadDataSource.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _READDATASOURCE_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ReadDataSource.Response)
+    })
+  ,
+  'DESCRIPTOR' : _READDATASOURCE,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.ReadDataSource)
+  })
+_sym_db.RegisterMessage(ReadDataSource)
+_sym_db.RegisterMessage(ReadDataSource.Request)
+_sym_db.RegisterMessage(ReadDataSource.Response)
+
+GetProvisionerSchema = _reflection.GeneratedProtocolMessageType('GetProvisionerSchema', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _GETPROVISIONERSCHEMA_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.GetProvisionerSchema.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _GETPROVISIONERSCHEMA_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.GetProvisionerSchema.Response)
+    })
+  ,
+  'DESCRIPTOR' : _GETPROVISIONERSCHEMA,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.GetProvisionerSchema)
+  })
+_sym_db.RegisterMessage(GetProvisionerSchema)
+_sym_db.RegisterMessage(GetProvisionerSchema.Request)
+_sym_db.RegisterMessage(GetProvisionerSchema.Response)
+
+ValidateProvisionerConfig = _reflection.GeneratedProtocolMessageType('ValidateProvisionerConfig', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _VALIDATEPROVISIONERCONFIG_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ValidateProvisionerConfig.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _VALIDATEPROVISIONERCONFIG_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ValidateProvisionerConfig.Response)
+    })
+  ,
+  'DESCRIPTOR' : _VALIDATEPROVISIONERCONFIG,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.ValidateProvisionerConfig)
+  })
+_sym_db.RegisterMessage(ValidateProvisionerConfig)
+_sym_db.RegisterMessage(ValidateProvisionerConfig.Request)
+_sym_db.RegisterMessage(ValidateProvisionerConfig.Response)
+
+ProvisionResource = _reflection.GeneratedProtocolMessageType('ProvisionResource', (_message.Message,), {
+
+  'Request' : _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+    'DESCRIPTOR' : _PROVISIONRESOURCE_REQUEST,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ProvisionResource.Request)
+    })
+  ,
+
+  'Response' : _reflection.GeneratedProtocolMessageType('Response', (_message.Message,), {
+    'DESCRIPTOR' : _PROVISIONRESOURCE_RESPONSE,
+    '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+    # @@protoc_insertion_point(class_scope:tfplugin5.ProvisionResource.Response)
+    })
+  ,
+  'DESCRIPTOR' : _PROVISIONRESOURCE,
+  '__module__' : 'terraform_plugin.proto.tfplugin54_pb2'
+  # @@protoc_insertion_point(class_scope:tfplugin5.ProvisionResource)
+  })
+_sym_db.RegisterMessage(ProvisionResource)
+_sym_db.RegisterMessage(ProvisionResource.Request)
+_sym_db.RegisterMessage(ProvisionResource.Response)
+
+
+_RAWSTATE_FLATMAPENTRY._options = None
+_GETPROVIDERSCHEMA_RESPONSE_RESOURCESCHEMASENTRY._options = None
+_GETPROVIDERSCHEMA_RESPONSE_DATASOURCESCHEMASENTRY._options = None
+
+_PROVIDER = _descriptor.ServiceDescriptor(
+  name='Provider',
+  full_name='tfplugin5.Provider',
+  file=DESCRIPTOR,
+  index=0,
+  serialized_options=None,
+  serialized_start=5420,
+  serialized_end=6675,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='GetMetadata',
+    full_name='tfplugin5.Provider.GetMetadata',
+    index=0,
+    containing_service=None,
+    input_type=_GETMETADATA_REQUEST,
+    output_type=_GETMETADATA_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetSchema',
+    full_name='tfplugin5.Provider.GetSchema',
+    index=1,
+    containing_service=None,
+    input_type=_GETPROVIDERSCHEMA_REQUEST,
+    output_type=_GETPROVIDERSCHEMA_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='PrepareProviderConfig',
+    full_name='tfplugin5.Provider.PrepareProviderConfig',
+    index=2,
+    containing_service=None,
+    input_type=_PREPAREPROVIDERCONFIG_REQUEST,
+    output_type=_PREPAREPROVIDERCONFIG_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ValidateResourceTypeConfig',
+    full_name='tfplugin5.Provider.ValidateResourceTypeConfig',
+    index=3,
+    containing_service=None,
+    input_type=_VALIDATERESOURCETYPECONFIG_REQUEST,
+    output_type=_VALIDATERESOURCETYPECONFIG_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ValidateDataSourceConfig',
+    full_name='tfplugin5.Provider.ValidateDataSourceConfig',
+    index=4,
+    containing_service=None,
+    input_type=_VALIDATEDATASOURCECONFIG_REQUEST,
+    output_type=_VALIDATEDATASOURCECONFIG_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='UpgradeResourceState',
+    full_name='tfplugin5.Provider.UpgradeResourceState',
+    index=5,
+    containing_service=None,
+    input_type=_UPGRADERESOURCESTATE_REQUEST,
+    output_type=_UPGRADERESOURCESTATE_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='Configure',
+    full_name='tfplugin5.Provider.Configure',
+    index=6,
+    containing_service=None,
+    input_type=_CONFIGURE_REQUEST,
+    output_type=_CONFIGURE_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ReadResource',
+    full_name='tfplugin5.Provider.ReadResource',
+    index=7,
+    containing_service=None,
+    input_type=_READRESOURCE_REQUEST,
+    output_type=_READRESOURCE_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='PlanResourceChange',
+    full_name='tfplugin5.Provider.PlanResourceChange',
+    index=8,
+    containing_service=None,
+    input_type=_PLANRESOURCECHANGE_REQUEST,
+    output_type=_PLANRESOURCECHANGE_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ApplyResourceChange',
+    full_name='tfplugin5.Provider.ApplyResourceChange',
+    index=9,
+    containing_service=None,
+    input_type=_APPLYRESOURCECHANGE_REQUEST,
+    output_type=_APPLYRESOURCECHANGE_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ImportResourceState',
+    full_name='tfplugin5.Provider.ImportResourceState',
+    index=10,
+    containing_service=None,
+    input_type=_IMPORTRESOURCESTATE_REQUEST,
+    output_type=_IMPORTRESOURCESTATE_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ReadDataSource',
+    full_name='tfplugin5.Provider.ReadDataSource',
+    index=11,
+    containing_service=None,
+    input_type=_READDATASOURCE_REQUEST,
+    output_type=_READDATASOURCE_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='Stop',
+    full_name='tfplugin5.Provider.Stop',
+    index=12,
+    containing_service=None,
+    input_type=_STOP_REQUEST,
+    output_type=_STOP_RESPONSE,
+    serialized_options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_PROVIDER)
+
+DESCRIPTOR.services_by_name['Provider'] = _PROVIDER
+
+
+_PROVISIONER = _descriptor.ServiceDescriptor(
+  name='Provisioner',
+  full_name='tfplugin5.Provisioner',
+  file=DESCRIPTOR,
+  index=1,
+  serialized_options=None,
+  serialized_start=6678,
+  serialized_end=7068,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='GetSchema',
+    full_name='tfplugin5.Provisioner.GetSchema',
+    index=0,
+    containing_service=None,
+    input_type=_GETPROVISIONERSCHEMA_REQUEST,
+    output_type=_GETPROVISIONERSCHEMA_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ValidateProvisionerConfig',
+    full_name='tfplugin5.Provisioner.ValidateProvisionerConfig',
+    index=1,
+    containing_service=None,
+    input_type=_VALIDATEPROVISIONERCONFIG_REQUEST,
+    output_type=_VALIDATEPROVISIONERCONFIG_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ProvisionResource',
+    full_name='tfplugin5.Provisioner.ProvisionResource',
+    index=2,
+    containing_service=None,
+    input_type=_PROVISIONRESOURCE_REQUEST,
+    output_type=_PROVISIONRESOURCE_RESPONSE,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='Stop',
+    full_name='tfplugin5.Provisioner.Stop',
+    index=3,
+    containing_service=None,
+    input_type=_STOP_REQUEST,
+    output_type=_STOP_RESPONSE,
+    serialized_options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_PROVISIONER)
+
+DESCRIPTOR.services_by_name['Provisioner'] = _PROVISIONER
+
+# @@protoc_insertion_point(module_scope)
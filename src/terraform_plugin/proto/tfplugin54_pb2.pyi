@@ -0,0 +1,1370 @@
+# @generated by generate_proto_mypy_stubs.py.  Do not edit!
+import sys
+from google.protobuf.descriptor import (
+    Descriptor as google___protobuf___descriptor___Descriptor,
+    EnumDescriptor as google___protobuf___descriptor___EnumDescriptor,
+)
+
+from google.protobuf.internal.containers import (
+    RepeatedCompositeFieldContainer as google___protobuf___internal___containers___RepeatedCompositeFieldContainer,
+)
+
+from google.protobuf.message import (
+    Message as google___protobuf___message___Message,
+)
+
+from typing import (
+    Iterable as typing___Iterable,
+    List as typing___List,
+    Mapping as typing___Mapping,
+    MutableMapping as typing___MutableMapping,
+    Optional as typing___Optional,
+    Text as typing___Text,
+    Tuple as typing___Tuple,
+    cast as typing___cast,
+)
+
+from typing_extensions import (
+    Literal as typing_extensions___Literal,
+)
+
+
+class StringKind(int):
+    DESCRIPTOR: google___protobuf___descriptor___EnumDescriptor = ...
+    @classmethod
+    def Name(cls, number: int) -> str: ...
+    @classmethod
+    def Value(cls, name: str) -> StringKind: ...
+    @classmethod
+    def keys(cls) -> typing___List[str]: ...
+    @classmethod
+    def values(cls) -> typing___List[StringKind]: ...
+    @classmethod
+    def items(cls) -> typing___List[typing___Tuple[str, StringKind]]: ...
+    PLAIN = typing___cast(StringKind, 0)
+    MARKDOWN = typing___cast(StringKind, 1)
+PLAIN = typing___cast(StringKind, 0)
+MARKDOWN = typing___cast(StringKind, 1)
+
+class DynamicValue(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    msgpack = ... # type: bytes
+    json = ... # type: bytes
+
+    def __init__(self,
+        *,
+        msgpack : typing___Optional[bytes] = None,
+        json : typing___Optional[bytes] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> DynamicValue: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"json",u"msgpack"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"json",b"json",u"msgpack",b"msgpack"]) -> None: ...
+
+class Diagnostic(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Severity(int):
+        DESCRIPTOR: google___protobuf___descriptor___EnumDescriptor = ...
+        @classmethod
+        def Name(cls, number: int) -> str: ...
+        @classmethod
+        def Value(cls, name: str) -> Diagnostic.Severity: ...
+        @classmethod
+        def keys(cls) -> typing___List[str]: ...
+        @classmethod
+        def values(cls) -> typing___List[Diagnostic.Severity]: ...
+        @classmethod
+        def items(cls) -> typing___List[typing___Tuple[str, Diagnostic.Severity]]: ...
+        INVALID = typing___cast(Diagnostic.Severity, 0)
+        ERROR = typing___cast(Diagnostic.Severity, 1)
+        WARNING = typing___cast(Diagnostic.Severity, 2)
+    INVALID = typing___cast(Diagnostic.Severity, 0)
+    ERROR = typing___cast(Diagnostic.Severity, 1)
+    WARNING = typing___cast(Diagnostic.Severity, 2)
+
+    severity = ... # type: Diagnostic.Severity
+    summary = ... # type: typing___Text
+    detail = ... # type: typing___Text
+
+    @property
+    def attribute(self) -> AttributePath: ...
+
+    def __init__(self,
+        *,
+        severity : typing___Optional[Diagnostic.Severity] = None,
+        summary : typing___Optional[typing___Text] = None,
+        detail : typing___Optional[typing___Text] = None,
+        attribute : typing___Optional[AttributePath] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> Diagnostic: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"attribute"]) -> bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"attribute",u"detail",u"severity",u"summary"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"attribute",b"attribute"]) -> bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"attribute",b"attribute",u"detail",b"detail",u"severity",b"severity",u"summary",b"summary"]) -> None: ...
+
+class AttributePath(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Step(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        attribute_name = ... # type: typing___Text
+        element_key_string = ... # type: typing___Text
+        element_key_int = ... # type: int
+
+        def __init__(self,
+            *,
+            attribute_name : typing___Optional[typing___Text] = None,
+            element_key_string : typing___Optional[typing___Text] = None,
+            element_key_int : typing___Optional[int] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> AttributePath.Step: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"attribute_name",u"element_key_int",u"element_key_string",u"selector"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"attribute_name",u"element_key_int",u"element_key_string",u"selector"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"attribute_name",b"attribute_name",u"element_key_int",b"element_key_int",u"element_key_string",b"element_key_string",u"selector",b"selector"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"attribute_name",b"attribute_name",u"element_key_int",b"element_key_int",u"element_key_string",b"element_key_string",u"selector",b"selector"]) -> None: ...
+        def WhichOneof(self, oneof_group: typing_extensions___Literal[u"selector",b"selector"]) -> typing_extensions___Literal["attribute_name","element_key_string","element_key_int"]: ...
+
+
+    @property
+    def steps(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[AttributePath.Step]: ...
+
+    def __init__(self,
+        *,
+        steps : typing___Optional[typing___Iterable[AttributePath.Step]] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> AttributePath: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"steps"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"steps",b"steps"]) -> None: ...
+
+class Stop(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        def __init__(self,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> Stop.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        Error = ... # type: typing___Text
+
+        def __init__(self,
+            *,
+            Error : typing___Optional[typing___Text] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> Stop.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"Error"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"Error",b"Error"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> Stop: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class RawState(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class FlatmapEntry(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        key = ... # type: typing___Text
+        value = ... # type: typing___Text
+
+        def __init__(self,
+            *,
+            key : typing___Optional[typing___Text] = None,
+            value : typing___Optional[typing___Text] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> RawState.FlatmapEntry: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"key",u"value"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"key",b"key",u"value",b"value"]) -> None: ...
+
+    json = ... # type: bytes
+
+    @property
+    def flatmap(self) -> typing___MutableMapping[typing___Text, typing___Text]: ...
+
+    def __init__(self,
+        *,
+        json : typing___Optional[bytes] = None,
+        flatmap : typing___Optional[typing___Mapping[typing___Text, typing___Text]] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> RawState: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"flatmap",u"json"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"flatmap",b"flatmap",u"json",b"json"]) -> None: ...
+
+class Schema(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Block(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        version = ... # type: int
+        description = ... # type: typing___Text
+        description_kind = ... # type: StringKind
+        deprecated = ... # type: bool
+
+        @property
+        def attributes(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Schema.Attribute]: ...
+
+        @property
+        def block_types(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Schema.NestedBlock]: ...
+
+        def __init__(self,
+            *,
+            version : typing___Optional[int] = None,
+            attributes : typing___Optional[typing___Iterable[Schema.Attribute]] = None,
+            block_types : typing___Optional[typing___Iterable[Schema.NestedBlock]] = None,
+            description : typing___Optional[typing___Text] = None,
+            description_kind : typing___Optional[StringKind] = None,
+            deprecated : typing___Optional[bool] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> Schema.Block: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"attributes",u"block_types",u"deprecated",u"description",u"description_kind",u"version"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"attributes",b"attributes",u"block_types",b"block_types",u"deprecated",b"deprecated",u"description",b"description",u"description_kind",b"description_kind",u"version",b"version"]) -> None: ...
+
+    class Attribute(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        name = ... # type: typing___Text
+        type = ... # type: bytes
+        description = ... # type: typing___Text
+        required = ... # type: bool
+        optional = ... # type: bool
+        computed = ... # type: bool
+        sensitive = ... # type: bool
+        description_kind = ... # type: StringKind
+        deprecated = ... # type: bool
+
+        def __init__(self,
+            *,
+            name : typing___Optional[typing___Text] = None,
+            type : typing___Optional[bytes] = None,
+            description : typing___Optional[typing___Text] = None,
+            required : typing___Optional[bool] = None,
+            optional : typing___Optional[bool] = None,
+            computed : typing___Optional[bool] = None,
+            sensitive : typing___Optional[bool] = None,
+            description_kind : typing___Optional[StringKind] = None,
+            deprecated : typing___Optional[bool] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> Schema.Attribute: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"computed",u"deprecated",u"description",u"description_kind",u"name",u"optional",u"required",u"sensitive",u"type"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"computed",b"computed",u"deprecated",b"deprecated",u"description",b"description",u"description_kind",b"description_kind",u"name",b"name",u"optional",b"optional",u"required",b"required",u"sensitive",b"sensitive",u"type",b"type"]) -> None: ...
+
+    class NestedBlock(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        class NestingMode(int):
+            DESCRIPTOR: google___protobuf___descriptor___EnumDescriptor = ...
+            @classmethod
+            def Name(cls, number: int) -> str: ...
+            @classmethod
+            def Value(cls, name: str) -> Schema.NestedBlock.NestingMode: ...
+            @classmethod
+            def keys(cls) -> typing___List[str]: ...
+            @classmethod
+            def values(cls) -> typing___List[Schema.NestedBlock.NestingMode]: ...
+            @classmethod
+            def items(cls) -> typing___List[typing___Tuple[str, Schema.NestedBlock.NestingMode]]: ...
+            INVALID = typing___cast(Schema.NestedBlock.NestingMode, 0)
+            SINGLE = typing___cast(Schema.NestedBlock.NestingMode, 1)
+            LIST = typing___cast(Schema.NestedBlock.NestingMode, 2)
+            SET = typing___cast(Schema.NestedBlock.NestingMode, 3)
+            MAP = typing___cast(Schema.NestedBlock.NestingMode, 4)
+            GROUP = typing___cast(Schema.NestedBlock.NestingMode, 5)
+        INVALID = typing___cast(Schema.NestedBlock.NestingMode, 0)
+        SINGLE = typing___cast(Schema.NestedBlock.NestingMode, 1)
+        LIST = typing___cast(Schema.NestedBlock.NestingMode, 2)
+        SET = typing___cast(Schema.NestedBlock.NestingMode, 3)
+        MAP = typing___cast(Schema.NestedBlock.NestingMode, 4)
+        GROUP = typing___cast(Schema.NestedBlock.NestingMode, 5)
+
+        type_name = ... # type: typing___Text
+        nesting = ... # type: Schema.NestedBlock.NestingMode
+        min_items = ... # type: int
+        max_items = ... # type: int
+
+        @property
+        def block(self) -> Schema.Block: ...
+
+        def __init__(self,
+            *,
+            type_name : typing___Optional[typing___Text] = None,
+            block : typing___Optional[Schema.Block] = None,
+            nesting : typing___Optional[Schema.NestedBlock.NestingMode] = None,
+            min_items : typing___Optional[int] = None,
+            max_items : typing___Optional[int] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> Schema.NestedBlock: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"block"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"block",u"max_items",u"min_items",u"nesting",u"type_name"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"block",b"block"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"block",b"block",u"max_items",b"max_items",u"min_items",b"min_items",u"nesting",b"nesting",u"type_name",b"type_name"]) -> None: ...
+
+    version = ... # type: int
+
+    @property
+    def block(self) -> Schema.Block: ...
+
+    def __init__(self,
+        *,
+        version : typing___Optional[int] = None,
+        block : typing___Optional[Schema.Block] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> Schema: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"block"]) -> bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"block",u"version"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"block",b"block"]) -> bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"block",b"block",u"version",b"version"]) -> None: ...
+
+class ServerCapabilities(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    plan_destroy = ... # type: bool
+    get_provider_schema_optional = ... # type: bool
+
+    def __init__(self,
+        *,
+        plan_destroy : typing___Optional[bool] = None,
+        get_provider_schema_optional : typing___Optional[bool] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> ServerCapabilities: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"get_provider_schema_optional",u"plan_destroy"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"get_provider_schema_optional",b"get_provider_schema_optional",u"plan_destroy",b"plan_destroy"]) -> None: ...
+
+class GetMetadata(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        def __init__(self,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> GetMetadata.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        @property
+        def server_capabilities(self) -> ServerCapabilities: ...
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        @property
+        def data_sources(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[GetMetadata.DataSourceMetadata]: ...
+
+        @property
+        def resources(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[GetMetadata.ResourceMetadata]: ...
+
+        def __init__(self,
+            *,
+            server_capabilities : typing___Optional[ServerCapabilities] = None,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            data_sources : typing___Optional[typing___Iterable[GetMetadata.DataSourceMetadata]] = None,
+            resources : typing___Optional[typing___Iterable[GetMetadata.ResourceMetadata]] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> GetMetadata.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"server_capabilities"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"data_sources",u"diagnostics",u"resources",u"server_capabilities"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"server_capabilities",b"server_capabilities"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"data_sources",b"data_sources",u"diagnostics",b"diagnostics",u"resources",b"resources",u"server_capabilities",b"server_capabilities"]) -> None: ...
+
+    class DataSourceMetadata(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        type_name = ... # type: typing___Text
+
+        def __init__(self,
+            *,
+            type_name : typing___Optional[typing___Text] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> GetMetadata.DataSourceMetadata: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"type_name"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"type_name",b"type_name"]) -> None: ...
+
+    class ResourceMetadata(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        type_name = ... # type: typing___Text
+
+        def __init__(self,
+            *,
+            type_name : typing___Optional[typing___Text] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> GetMetadata.ResourceMetadata: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"type_name"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"type_name",b"type_name"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> GetMetadata: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class GetProviderSchema(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        def __init__(self,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> GetProviderSchema.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        class ResourceSchemasEntry(google___protobuf___message___Message):
+            DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+            key = ... # type: typing___Text
+
+            @property
+            def value(self) -> Schema: ...
+
+            def __init__(self,
+                *,
+                key : typing___Optional[typing___Text] = None,
+                value : typing___Optional[Schema] = None,
+                ) -> None: ...
+            @classmethod
+            def FromString(cls, s: bytes) -> GetProviderSchema.Response.ResourceSchemasEntry: ...
+            def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+            def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+            if sys.version_info >= (3,):
+                def HasField(self, field_name: typing_extensions___Literal[u"value"]) -> bool: ...
+                def ClearField(self, field_name: typing_extensions___Literal[u"key",u"value"]) -> None: ...
+            else:
+                def HasField(self, field_name: typing_extensions___Literal[u"value",b"value"]) -> bool: ...
+                def ClearField(self, field_name: typing_extensions___Literal[u"key",b"key",u"value",b"value"]) -> None: ...
+
+        class DataSourceSchemasEntry(google___protobuf___message___Message):
+            DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+            key = ... # type: typing___Text
+
+            @property
+            def value(self) -> Schema: ...
+
+            def __init__(self,
+                *,
+                key : typing___Optional[typing___Text] = None,
+                value : typing___Optional[Schema] = None,
+                ) -> None: ...
+            @classmethod
+            def FromString(cls, s: bytes) -> GetProviderSchema.Response.DataSourceSchemasEntry: ...
+            def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+            def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+            if sys.version_info >= (3,):
+                def HasField(self, field_name: typing_extensions___Literal[u"value"]) -> bool: ...
+                def ClearField(self, field_name: typing_extensions___Literal[u"key",u"value"]) -> None: ...
+            else:
+                def HasField(self, field_name: typing_extensions___Literal[u"value",b"value"]) -> bool: ...
+                def ClearField(self, field_name: typing_extensions___Literal[u"key",b"key",u"value",b"value"]) -> None: ...
+
+
+        @property
+        def provider(self) -> Schema: ...
+
+        @property
+        def resource_schemas(self) -> typing___MutableMapping[typing___Text, Schema]: ...
+
+        @property
+        def data_source_schemas(self) -> typing___MutableMapping[typing___Text, Schema]: ...
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        @property
+        def provider_meta(self) -> Schema: ...
+
+        @property
+        def server_capabilities(self) -> ServerCapabilities: ...
+
+        def __init__(self,
+            *,
+            provider : typing___Optional[Schema] = None,
+            resource_schemas : typing___Optional[typing___Mapping[typing___Text, Schema]] = None,
+            data_source_schemas : typing___Optional[typing___Mapping[typing___Text, Schema]] = None,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            provider_meta : typing___Optional[Schema] = None,
+            server_capabilities : typing___Optional[ServerCapabilities] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> GetProviderSchema.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"provider",u"provider_meta",u"server_capabilities"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"data_source_schemas",u"diagnostics",u"provider",u"provider_meta",u"resource_schemas",u"server_capabilities"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"provider",b"provider",u"provider_meta",b"provider_meta",u"server_capabilities",b"server_capabilities"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"data_source_schemas",b"data_source_schemas",u"diagnostics",b"diagnostics",u"provider",b"provider",u"provider_meta",b"provider_meta",u"resource_schemas",b"resource_schemas",u"server_capabilities",b"server_capabilities"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> GetProviderSchema: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class PrepareProviderConfig(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        @property
+        def config(self) -> DynamicValue: ...
+
+        def __init__(self,
+            *,
+            config : typing___Optional[DynamicValue] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> PrepareProviderConfig.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"config"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"config",b"config"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",b"config"]) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        @property
+        def prepared_config(self) -> DynamicValue: ...
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        def __init__(self,
+            *,
+            prepared_config : typing___Optional[DynamicValue] = None,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> PrepareProviderConfig.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"prepared_config"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",u"prepared_config"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"prepared_config",b"prepared_config"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",b"diagnostics",u"prepared_config",b"prepared_config"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> PrepareProviderConfig: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class UpgradeResourceState(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        type_name = ... # type: typing___Text
+        version = ... # type: int
+
+        @property
+        def raw_state(self) -> RawState: ...
+
+        def __init__(self,
+            *,
+            type_name : typing___Optional[typing___Text] = None,
+            version : typing___Optional[int] = None,
+            raw_state : typing___Optional[RawState] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> UpgradeResourceState.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"raw_state"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"raw_state",u"type_name",u"version"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"raw_state",b"raw_state"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"raw_state",b"raw_state",u"type_name",b"type_name",u"version",b"version"]) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        @property
+        def upgraded_state(self) -> DynamicValue: ...
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        def __init__(self,
+            *,
+            upgraded_state : typing___Optional[DynamicValue] = None,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> UpgradeResourceState.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"upgraded_state"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",u"upgraded_state"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"upgraded_state",b"upgraded_state"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",b"diagnostics",u"upgraded_state",b"upgraded_state"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> UpgradeResourceState: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class ValidateResourceTypeConfig(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        type_name = ... # type: typing___Text
+
+        @property
+        def config(self) -> DynamicValue: ...
+
+        def __init__(self,
+            *,
+            type_name : typing___Optional[typing___Text] = None,
+            config : typing___Optional[DynamicValue] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ValidateResourceTypeConfig.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"config"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",u"type_name"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"config",b"config"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",b"config",u"type_name",b"type_name"]) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        def __init__(self,
+            *,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ValidateResourceTypeConfig.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",b"diagnostics"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> ValidateResourceTypeConfig: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class ValidateDataSourceConfig(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        type_name = ... # type: typing___Text
+
+        @property
+        def config(self) -> DynamicValue: ...
+
+        def __init__(self,
+            *,
+            type_name : typing___Optional[typing___Text] = None,
+            config : typing___Optional[DynamicValue] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ValidateDataSourceConfig.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"config"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",u"type_name"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"config",b"config"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",b"config",u"type_name",b"type_name"]) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        def __init__(self,
+            *,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ValidateDataSourceConfig.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",b"diagnostics"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> ValidateDataSourceConfig: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class Configure(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        terraform_version = ... # type: typing___Text
+
+        @property
+        def config(self) -> DynamicValue: ...
+
+        def __init__(self,
+            *,
+            terraform_version : typing___Optional[typing___Text] = None,
+            config : typing___Optional[DynamicValue] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> Configure.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"config"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",u"terraform_version"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"config",b"config"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",b"config",u"terraform_version",b"terraform_version"]) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        def __init__(self,
+            *,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> Configure.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",b"diagnostics"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> Configure: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class ReadResource(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        type_name = ... # type: typing___Text
+        private = ... # type: bytes
+
+        @property
+        def current_state(self) -> DynamicValue: ...
+
+        @property
+        def provider_meta(self) -> DynamicValue: ...
+
+        def __init__(self,
+            *,
+            type_name : typing___Optional[typing___Text] = None,
+            current_state : typing___Optional[DynamicValue] = None,
+            private : typing___Optional[bytes] = None,
+            provider_meta : typing___Optional[DynamicValue] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ReadResource.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"current_state",u"provider_meta"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"current_state",u"private",u"provider_meta",u"type_name"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"current_state",b"current_state",u"provider_meta",b"provider_meta"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"current_state",b"current_state",u"private",b"private",u"provider_meta",b"provider_meta",u"type_name",b"type_name"]) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        private = ... # type: bytes
+
+        @property
+        def new_state(self) -> DynamicValue: ...
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        def __init__(self,
+            *,
+            new_state : typing___Optional[DynamicValue] = None,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            private : typing___Optional[bytes] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ReadResource.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"new_state"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",u"new_state",u"private"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"new_state",b"new_state"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",b"diagnostics",u"new_state",b"new_state",u"private",b"private"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> ReadResource: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class PlanResourceChange(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        type_name = ... # type: typing___Text
+        prior_private = ... # type: bytes
+
+        @property
+        def prior_state(self) -> DynamicValue: ...
+
+        @property
+        def proposed_new_state(self) -> DynamicValue: ...
+
+        @property
+        def config(self) -> DynamicValue: ...
+
+        @property
+        def provider_meta(self) -> DynamicValue: ...
+
+        def __init__(self,
+            *,
+            type_name : typing___Optional[typing___Text] = None,
+            prior_state : typing___Optional[DynamicValue] = None,
+            proposed_new_state : typing___Optional[DynamicValue] = None,
+            config : typing___Optional[DynamicValue] = None,
+            prior_private : typing___Optional[bytes] = None,
+            provider_meta : typing___Optional[DynamicValue] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> PlanResourceChange.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"config",u"prior_state",u"proposed_new_state",u"provider_meta"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",u"prior_private",u"prior_state",u"proposed_new_state",u"provider_meta",u"type_name"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"config",b"config",u"prior_state",b"prior_state",u"proposed_new_state",b"proposed_new_state",u"provider_meta",b"provider_meta"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",b"config",u"prior_private",b"prior_private",u"prior_state",b"prior_state",u"proposed_new_state",b"proposed_new_state",u"provider_meta",b"provider_meta",u"type_name",b"type_name"]) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        planned_private = ... # type: bytes
+        legacy_type_system = ... # type: bool
+
+        @property
+        def planned_state(self) -> DynamicValue: ...
+
+        @property
+        def requires_replace(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[AttributePath]: ...
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        def __init__(self,
+            *,
+            planned_state : typing___Optional[DynamicValue] = None,
+            requires_replace : typing___Optional[typing___Iterable[AttributePath]] = None,
+            planned_private : typing___Optional[bytes] = None,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            legacy_type_system : typing___Optional[bool] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> PlanResourceChange.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"planned_state"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",u"legacy_type_system",u"planned_private",u"planned_state",u"requires_replace"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"planned_state",b"planned_state"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",b"diagnostics",u"legacy_type_system",b"legacy_type_system",u"planned_private",b"planned_private",u"planned_state",b"planned_state",u"requires_replace",b"requires_replace"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> PlanResourceChange: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class ApplyResourceChange(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        type_name = ... # type: typing___Text
+        planned_private = ... # type: bytes
+
+        @property
+        def prior_state(self) -> DynamicValue: ...
+
+        @property
+        def planned_state(self) -> DynamicValue: ...
+
+        @property
+        def config(self) -> DynamicValue: ...
+
+        @property
+        def provider_meta(self) -> DynamicValue: ...
+
+        def __init__(self,
+            *,
+            type_name : typing___Optional[typing___Text] = None,
+            prior_state : typing___Optional[DynamicValue] = None,
+            planned_state : typing___Optional[DynamicValue] = None,
+            config : typing___Optional[DynamicValue] = None,
+            planned_private : typing___Optional[bytes] = None,
+            provider_meta : typing___Optional[DynamicValue] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ApplyResourceChange.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"config",u"planned_state",u"prior_state",u"provider_meta"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",u"planned_private",u"planned_state",u"prior_state",u"provider_meta",u"type_name"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"config",b"config",u"planned_state",b"planned_state",u"prior_state",b"prior_state",u"provider_meta",b"provider_meta"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",b"config",u"planned_private",b"planned_private",u"planned_state",b"planned_state",u"prior_state",b"prior_state",u"provider_meta",b"provider_meta",u"type_name",b"type_name"]) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        private = ... # type: bytes
+        legacy_type_system = ... # type: bool
+
+        @property
+        def new_state(self) -> DynamicValue: ...
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        def __init__(self,
+            *,
+            new_state : typing___Optional[DynamicValue] = None,
+            private : typing___Optional[bytes] = None,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            legacy_type_system : typing___Optional[bool] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ApplyResourceChange.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"new_state"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",u"legacy_type_system",u"new_state",u"private"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"new_state",b"new_state"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",b"diagnostics",u"legacy_type_system",b"legacy_type_system",u"new_state",b"new_state",u"private",b"private"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> ApplyResourceChange: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class ImportResourceState(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        type_name = ... # type: typing___Text
+        id = ... # type: typing___Text
+
+        def __init__(self,
+            *,
+            type_name : typing___Optional[typing___Text] = None,
+            id : typing___Optional[typing___Text] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ImportResourceState.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"id",u"type_name"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"id",b"id",u"type_name",b"type_name"]) -> None: ...
+
+    class ImportedResource(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        type_name = ... # type: typing___Text
+        private = ... # type: bytes
+
+        @property
+        def state(self) -> DynamicValue: ...
+
+        def __init__(self,
+            *,
+            type_name : typing___Optional[typing___Text] = None,
+            state : typing___Optional[DynamicValue] = None,
+            private : typing___Optional[bytes] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ImportResourceState.ImportedResource: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"state"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"private",u"state",u"type_name"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"state",b"state"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"private",b"private",u"state",b"state",u"type_name",b"type_name"]) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        @property
+        def imported_resources(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[ImportResourceState.ImportedResource]: ...
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        def __init__(self,
+            *,
+            imported_resources : typing___Optional[typing___Iterable[ImportResourceState.ImportedResource]] = None,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ImportResourceState.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",u"imported_resources"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",b"diagnostics",u"imported_resources",b"imported_resources"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> ImportResourceState: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class ReadDataSource(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        type_name = ... # type: typing___Text
+
+        @property
+        def config(self) -> DynamicValue: ...
+
+        @property
+        def provider_meta(self) -> DynamicValue: ...
+
+        def __init__(self,
+            *,
+            type_name : typing___Optional[typing___Text] = None,
+            config : typing___Optional[DynamicValue] = None,
+            provider_meta : typing___Optional[DynamicValue] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ReadDataSource.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"config",u"provider_meta"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",u"provider_meta",u"type_name"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"config",b"config",u"provider_meta",b"provider_meta"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",b"config",u"provider_meta",b"provider_meta",u"type_name",b"type_name"]) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        @property
+        def state(self) -> DynamicValue: ...
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        def __init__(self,
+            *,
+            state : typing___Optional[DynamicValue] = None,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ReadDataSource.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"state"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",u"state"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"state",b"state"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",b"diagnostics",u"state",b"state"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> ReadDataSource: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class GetProvisionerSchema(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        def __init__(self,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> GetProvisionerSchema.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        @property
+        def provisioner(self) -> Schema: ...
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        def __init__(self,
+            *,
+            provisioner : typing___Optional[Schema] = None,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> GetProvisionerSchema.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"provisioner"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",u"provisioner"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"provisioner",b"provisioner"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",b"diagnostics",u"provisioner",b"provisioner"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> GetProvisionerSchema: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class ValidateProvisionerConfig(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        @property
+        def config(self) -> DynamicValue: ...
+
+        def __init__(self,
+            *,
+            config : typing___Optional[DynamicValue] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ValidateProvisionerConfig.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"config"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"config",b"config"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",b"config"]) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        def __init__(self,
+            *,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ValidateProvisionerConfig.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",b"diagnostics"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> ValidateProvisionerConfig: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+
+class ProvisionResource(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class Request(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+        @property
+        def config(self) -> DynamicValue: ...
+
+        @property
+        def connection(self) -> DynamicValue: ...
+
+        def __init__(self,
+            *,
+            config : typing___Optional[DynamicValue] = None,
+            connection : typing___Optional[DynamicValue] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ProvisionResource.Request: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"config",u"connection"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",u"connection"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"config",b"config",u"connection",b"connection"]) -> bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"config",b"config",u"connection",b"connection"]) -> None: ...
+
+    class Response(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        output = ... # type: typing___Text
+
+        @property
+        def diagnostics(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Diagnostic]: ...
+
+        def __init__(self,
+            *,
+            output : typing___Optional[typing___Text] = None,
+            diagnostics : typing___Optional[typing___Iterable[Diagnostic]] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: bytes) -> ProvisionResource.Response: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",u"output"]) -> None: ...
+        else:
+            def ClearField(self, field_name: typing_extensions___Literal[u"diagnostics",b"diagnostics",u"output",b"output"]) -> None: ...
+
+
+    def __init__(self,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: bytes) -> ProvisionResource: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
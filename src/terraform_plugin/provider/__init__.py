@@ -1,49 +1,364 @@
-import enum
-from typing import Any
+import inspect
+import logging
+import threading
+from functools import partial
+from pathlib import Path
+from typing import (
+    Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple, Type, Union, TYPE_CHECKING,
+)
 
-from grpc._server import _Server
+import grpc
 
-from terraform_plugin.proto.tfplugin51_pb2 import (
+from terraform_plugin import codec, constants, diff, lazy, schema, schema_cache, state
+from terraform_plugin.proto.tfplugin54_pb2 import (
+    ApplyResourceChange,
     Configure,
+    Diagnostic,
+    DynamicValue,
+    GetMetadata,
+    GetProviderSchema,
+    ImportResourceState,
+    PlanResourceChange,
     PrepareProviderConfig,
+    ReadDataSource,
+    ReadResource,
+    ServerCapabilities,
     Stop,
+    UpgradeResourceState,
     ValidateDataSourceConfig,
     ValidateResourceTypeConfig,
 )
-from ..proto import tfplugin51_pb2_grpc
+from ..proto import tfplugin54_pb2_grpc
+
+if TYPE_CHECKING:
+    from grpc._server import _Server
+
+
+log = logging.getLogger(__name__)
+
+SERVICE_NAME = 'tfplugin5.Provider'
+
+# RPC name to name of its handler on `schema.Resource` and `schema.DataSource`
+RESOURCE_HANDLERS = {
+    'ValidateResourceTypeConfig': 'validate',
+    'UpgradeResourceState': 'upgrade',
+    'ReadResource': 'read',
+    'PlanResourceChange': 'plan',
+    'ApplyResourceChange': 'apply',
+    'ImportResourceState': 'import_state',
+}
+DATA_SOURCE_HANDLERS = {
+    'ValidateDataSourceConfig': 'validate',
+    'ReadDataSource': 'read',
+}
+
+
+# handlers without defaults, types not overriding them don't support the RPC
+_REQUIRED_HANDLERS = {schema.Resource.apply, schema.Resource.import_state, schema.DataSource.read}
+# defaults keeping values as they are, values aren't decoded when they're not overridden
+# (unlike them the default `plan` marks computed attributes unknown on create)
+_NOOP_HANDLERS = {schema.Resource.validate, schema.Resource.read, schema.DataSource.validate}
+
+
+class Route(NamedTuple):
+    handler: Callable
+    # handler is in `_NOOP_HANDLERS`, it isn't called
+    noop: bool
+    codec: codec.BlockCodec
+    block: Type[schema.Block]
+    # decodes states passed to `read`, `plan` and `apply`, lazily with `Resource.lazy_state`
+    decode: Callable[[DynamicValue], Any]
+    # `Resource.skip_unchanged`
+    skip_unchanged: bool
+
+
+Declaration = Union[Type[schema.Resource], Type[schema.DataSource], schema.Lazy]
+
+
+def _add_routes(routes: Dict[str, Dict[str, Route]], instance: Union[schema.Resource, schema.DataSource],
+                handlers: Dict[str, str]):
+    block_codec = instance.get_codec()
+    decode = instance.get_lazy_codec().decode if getattr(instance, 'lazy_state', False) else block_codec.decode
+    skip_unchanged = getattr(instance, 'skip_unchanged', False)
+    for method, name in handlers.items():
+        handler = getattr(type(instance), name)
+        if handler not in _REQUIRED_HANDLERS:
+            routes[method][instance.type_name] = Route(
+                getattr(instance, name), handler in _NOOP_HANDLERS, block_codec, type(instance), decode, skip_unchanged)
+
+
+def _load(declaration: Union[Type[schema.Block], schema.Lazy]) -> Type[schema.Block]:
+    return declaration.load() if isinstance(declaration, schema.Lazy) else declaration
+
+
+def _unsupported(method: str, type_name: str) -> List[Diagnostic]:
+    return [Diagnostic(severity=Diagnostic.ERROR, summary=f'{method} is not supported by {type_name!r}')]
+
+
+def _skip_plan(route: Route, request: PlanResourceChange.Request) -> Optional[PlanResourceChange.Response]:
+    """
+    :return: response with proposed state as it is when destroying the resource or when it's the same bytes
+     as prior state, `None` when it has to be planned
+    """
+    proposed = request.proposed_new_state
+    if not (codec.is_null(proposed) or route.skip_unchanged and proposed == request.prior_state):
+        return None
+    return PlanResourceChange.Response(planned_state=proposed, planned_private=request.prior_private)
+
+
+def _encode(route: Route, value: Any) -> DynamicValue:
+    if isinstance(value, lazy.LazyMap) and not value.modified:
+        return DynamicValue(msgpack=bytes(value.raw()))
+    return route.codec.encode(value)
+
+
+def _skip_apply(route: Route, request: ApplyResourceChange.Request) -> Optional[ApplyResourceChange.Response]:
+    if route.skip_unchanged and request.planned_state == request.prior_state:
+        return ApplyResourceChange.Response(new_state=request.planned_state, private=request.planned_private)
+    return None
 
 
-class Type(enum.IntEnum):
+class _Call(NamedTuple):
     """
-    https://github.com/hashicorp/terraform/blob/fa7f496bef9da0b49728b969ac1b597b73d92c83/helper/schema/valuetype.go#L8-L18
+    Handler call prepared from a request, `finish` builds the response from its result.
     """
-    Invalid = enum.auto()
-    Bool = enum.auto()
-    Int = enum.auto()
-    Float = enum.auto()
-    String = enum.auto()
-    List = enum.auto()
-    Map = enum.auto()
-    Set = enum.auto()
-    _Object = enum.auto()
-
-
-class PrimitiveType(enum.Enum):
+    handler: Callable
+    args: tuple
+    finish: Callable[[Any], Any]
+
+
+def _call(prepared: Any, context: Any) -> Any:
     """
-    https://github.com/hashicorp/terraform/blob/aa6b55bb17955d73c24fd828c89d0a5ab19c13ff/vendor/github.com/zclconf/go-cty/cty/primitive_type.go#L14-L18
+    :param prepared: `_Call` or response of a request not calling the handler
     """
-    Bool = b'B'
-    Number = b'N'
-    String = b'S'
+    if not isinstance(prepared, _Call):
+        return prepared
+    return prepared.finish(prepared.handler(*prepared.args, context))
+
+
+def _validated(response_type: Type, diagnostics: Optional[List[Diagnostic]]) -> Any:
+    return response_type(diagnostics=diagnostics)
+
+
+def _upgraded(route: Route, upgraded_state: Any) -> UpgradeResourceState.Response:
+    return UpgradeResourceState.Response(upgraded_state=route.codec.encode(upgraded_state))
+
+
+def _read(route: Route, request: ReadResource.Request, current_state: Any, new_state: Any) -> ReadResource.Response:
+    # nothing changed upstream, state Terraform sent is encoded already
+    if not isinstance(current_state, lazy.LazyMap) and new_state == current_state:
+        return ReadResource.Response(new_state=request.current_state, private=request.private)
+    return ReadResource.Response(new_state=_encode(route, new_state), private=request.private)
+
+
+def _planned(route: Route, request: PlanResourceChange.Request, prior_state: Any,
+             planned_state: Any) -> PlanResourceChange.Response:
+    if isinstance(prior_state, lazy.LazyMap):
+        # the handler could modify the view it got
+        prior_state = prior_state.original()
+    return PlanResourceChange.Response(
+        planned_state=_encode(route, planned_state),
+        requires_replace=diff.requires_replace(route.block, prior_state, planned_state),
+        planned_private=request.prior_private,
+    )
+
+
+def _applied(route: Route, request: ApplyResourceChange.Request, new_state: Any) -> ApplyResourceChange.Response:
+    return ApplyResourceChange.Response(new_state=_encode(route, new_state), private=request.planned_private)
+
 
+def _imported(route: Route, request: ImportResourceState.Request,
+              states: Iterable[Any]) -> ImportResourceState.Response:
+    return ImportResourceState.Response(imported_resources=[
+        ImportResourceState.ImportedResource(type_name=request.type_name, state=route.codec.encode(state))
+        for state in states
+    ])
 
-class ProviderBase(tfplugin51_pb2_grpc.ProviderServicer):
-    def __init__(self, server: _Server = None):
+
+def _data_read(route: Route, data: Any) -> ReadDataSource.Response:
+    return ReadDataSource.Response(state=route.codec.encode(data))
+
+
+class ProviderBase(tfplugin54_pb2_grpc.ProviderServicer):
+    provider_schema: Optional[Type[schema.Block]] = None
+    resources: Sequence[Union[Type[schema.Resource], schema.Lazy]] = ()
+    data_sources: Sequence[Union[Type[schema.DataSource], schema.Lazy]] = ()
+    # serialized `GetProviderSchema.Response` written by `write_schema_file()`, relative to the provider module,
+    # served without importing `schema.Lazy` types
+    schema_file: Optional[str] = None
+    # `GetSchema` overrides are cached on disk only when set, their response may depend on more than source files
+    cache_custom_schema = False
+
+    _schema_bytes: Optional[bytes] = None
+
+    def __init__(self, server: '_Server' = None):
         self.server = server
+        # built once, handlers are looked up by RPC and `type_name` only
+        self.routes: Dict[str, Dict[str, Route]] = {
+            method: {} for method in (*RESOURCE_HANDLERS, *DATA_SOURCE_HANDLERS)
+        }
+        # `schema.Lazy` types not requested yet, shared by RPCs of resources and of data sources
+        self._lazy: Dict[str, Dict[str, schema.Lazy]] = {}
+        self._lock = threading.Lock()
+        routed: Tuple[Tuple[Sequence[Declaration], Dict[str, str]], ...] = (
+            (self.resources, RESOURCE_HANDLERS),
+            (self.data_sources, DATA_SOURCE_HANDLERS),
+        )
+        for declarations, handlers in routed:
+            lazy = {}
+            for declaration in declarations:
+                if isinstance(declaration, schema.Lazy):
+                    lazy[declaration.type_name] = declaration
+                else:
+                    _add_routes(self.routes, declaration(self), handlers)
+            self._lazy.update(dict.fromkeys(handlers, lazy))
+
+    def _get_route(self, method: str, type_name: str) -> Optional[Route]:
+        route = self.routes[method].get(type_name)
+        if route is None and type_name in self._lazy[method]:
+            with self._lock:
+                lazy = self._lazy[method].get(type_name)
+                if lazy is not None:
+                    handlers = RESOURCE_HANDLERS if method in RESOURCE_HANDLERS else DATA_SOURCE_HANDLERS
+                    _add_routes(self.routes, lazy.load()(self), handlers)
+                    del self._lazy[method][type_name]
+            route = self.routes[method].get(type_name)
+        return route
 
-    def bind(self, server: _Server = None):
+    def bind(self, server: '_Server' = None):
         self.server = server
 
+    def get_server_capabilities(self) -> ServerCapabilities:
+        # declared schema doesn't change between runs, so Terraform may use its cached copy instead of calling GetSchema
+        return ServerCapabilities(get_provider_schema_optional=True)
+
+    def get_schema(self) -> GetProviderSchema.Response:
+        """
+        :return: schema declared by `provider_schema`, `resources` and `data_sources`
+        """
+        return GetProviderSchema.Response(
+            provider=(self.provider_schema or schema.Block).to_schema(),
+            resource_schemas={resource.type_name: _load(resource).to_schema() for resource in self.resources},
+            data_source_schemas={
+                data_source.type_name: _load(data_source).to_schema()
+                for data_source in self.data_sources
+            },
+            server_capabilities=self.get_server_capabilities(),
+        )
+
+    def get_metadata(self) -> GetMetadata.Response:
+        """
+        :return: declared resource and data source types without building their schema
+        """
+        return GetMetadata.Response(
+            server_capabilities=self.get_server_capabilities(),
+            resources=[GetMetadata.ResourceMetadata(type_name=resource.type_name) for resource in self.resources],
+            data_sources=[
+                GetMetadata.DataSourceMetadata(type_name=data_source.type_name)
+                for data_source in self.data_sources
+            ],
+        )
+
+    def _has_custom_schema(self) -> bool:
+        return type(self).GetSchema is not ProviderBase.GetSchema
+
+    def GetMetadata(self, request: GetMetadata.Request, context: Any) -> GetMetadata.Response:
+        if self._has_custom_schema():
+            return _get_metadata(self._serve_schema(GetProviderSchema.Request(), context))
+        return self.get_metadata()
+
+    def GetSchema(self, request: GetProviderSchema.Request, context: Any) -> GetProviderSchema.Response:
+        return self.get_schema()
+
+    def get_schema_modules(self) -> Set[str]:
+        """
+        :return: modules defining the schema, packages containing them are fingerprinted for schema cache
+        """
+        declarations = (type(self), self.provider_schema, *self.resources, *self.data_sources)
+        return {
+            declaration.module_name if isinstance(declaration, schema.Lazy) else declaration.__module__
+            for declaration in declarations
+            if declaration is not None
+        }
+
+    def _get_schema_file(self) -> Optional[Path]:
+        if not self.schema_file:
+            return None
+        return Path(inspect.getfile(type(self))).parent / self.schema_file
+
+    def write_schema_file(self):
+        """
+        Builds `schema_file`, eg. when packaging the provider, importing all of its types.
+        """
+        self._get_schema_file().write_bytes(self.get_schema().SerializeToString())
+
+    def _load_schema(self) -> Optional[bytes]:
+        path = self._get_schema_file()
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError as e:
+            log.warning(f'failed to read schema file {path}: {e}')
+            return None
+
+    def _get_schema_fingerprint(self) -> Optional[str]:
+        if not constants.is_schema_cache_enabled() or self._has_custom_schema() and not self.cache_custom_schema:
+            return None
+        cls = type(self)
+        try:
+            return schema_cache.get_fingerprint(f'{cls.__module__}.{cls.__qualname__}', self.get_schema_modules())
+        except (OSError, ValueError) as e:
+            log.warning(f'not caching schema: {e}')
+            return None
+
+    def _remember_schema(self, response: GetProviderSchema.Response, fingerprint: Optional[str]) -> bytes:
+        schema_bytes = response.SerializeToString()
+        if not response.diagnostics:
+            self._schema_bytes = schema_bytes
+            if fingerprint:
+                schema_cache.store(fingerprint, schema_bytes)
+        return schema_bytes
+
+    def _prepare_schema(self) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        :return: schema served before or read from `schema_file` or schema cache, otherwise `None`
+         and fingerprint to cache the one `GetSchema` returns
+        """
+        fingerprint = None
+        if self._schema_bytes is None:
+            self._schema_bytes = self._load_schema()
+        if self._schema_bytes is None:
+            fingerprint = self._get_schema_fingerprint()
+            if fingerprint:
+                self._schema_bytes = schema_cache.load(fingerprint)
+        return self._schema_bytes, fingerprint
+
+    def _get_schema_handler(self) -> Callable:
+        """
+        :return: `GetSchema` handler returning serialized response
+        """
+        return self._serve_schema
+
+    def _serve_schema(self, request: GetProviderSchema.Request, context: Any) -> bytes:
+        schema_bytes, fingerprint = self._prepare_schema()
+        if schema_bytes is None:
+            return self._remember_schema(self.GetSchema(request, context), fingerprint)
+        return schema_bytes
+
+    def add_to_server(self, server: grpc.Server):
+        """
+        Registers the provider, `GetSchema` response is serialized on first call (or read from `schema_file`
+        or schema cache) and served as bytes afterwards.
+        """
+        # without response serializer the handler returns raw bytes, gRPC picks the first matching handler
+        handler = grpc.unary_unary_rpc_method_handler(
+            self._get_schema_handler(),
+            request_deserializer=GetProviderSchema.Request.FromString,
+        )
+        server.add_generic_rpc_handlers((grpc.method_handlers_generic_handler(SERVICE_NAME, {'GetSchema': handler}),))
+        tfplugin54_pb2_grpc.add_ProviderServicer_to_server(self, server)
+
     def Configure(
             self,
             request: Configure.Request,
@@ -58,15 +373,204 @@ class ProviderBase(tfplugin51_pb2_grpc.ProviderServicer):
     ) -> PrepareProviderConfig.Response:
         return PrepareProviderConfig.Response()
 
+    def _prepare_validate(self, method: str, response_type: Type, request: Any) -> Any:
+        route = self._get_route(method, request.type_name)
+        if route is None:
+            return response_type(diagnostics=_unsupported(method, request.type_name))
+        if route.noop:
+            return response_type()
+        return _Call(route.handler, (route.codec.decode(request.config),), partial(_validated, response_type))
+
+    def _prepare_upgrade(self, request: UpgradeResourceState.Request) -> Any:
+        route = self._get_route('UpgradeResourceState', request.type_name)
+        if route is None:
+            return UpgradeResourceState.Response(diagnostics=_unsupported('UpgradeResourceState', request.type_name))
+        if not request.raw_state.json:
+            # flatmap states were written by Terraform 0.11 and older
+            return UpgradeResourceState.Response(diagnostics=_unsupported('flatmap state', request.type_name))
+        return _Call(route.handler, (request.version, route.codec.decode_json(request.raw_state.json)),
+                     partial(_upgraded, route))
+
+    def _prepare_read(self, request: ReadResource.Request) -> Any:
+        route = self._get_route('ReadResource', request.type_name)
+        if route is None:
+            return ReadResource.Response(diagnostics=_unsupported('ReadResource', request.type_name))
+        if route.noop or codec.is_null(request.current_state):
+            return ReadResource.Response(new_state=request.current_state, private=request.private)
+        current_state = route.decode(request.current_state)
+        return _Call(route.handler, (state.cow(current_state),), partial(_read, route, request, current_state))
+
+    def _prepare_plan(self, request: PlanResourceChange.Request) -> Any:
+        route = self._get_route('PlanResourceChange', request.type_name)
+        if route is None:
+            return PlanResourceChange.Response(diagnostics=_unsupported('PlanResourceChange', request.type_name))
+        response = _skip_plan(route, request)
+        if response is not None:
+            return response
+        decode = route.decode
+        prior_state = decode(request.prior_state)
+        # modifying prior state in the handler doesn't change the one it's compared with
+        args = (state.cow(prior_state), decode(request.proposed_new_state), decode(request.config))
+        return _Call(route.handler, args, partial(_planned, route, request, prior_state))
+
+    def _prepare_apply(self, request: ApplyResourceChange.Request) -> Any:
+        route = self._get_route('ApplyResourceChange', request.type_name)
+        if route is None:
+            return ApplyResourceChange.Response(diagnostics=_unsupported('ApplyResourceChange', request.type_name))
+        response = _skip_apply(route, request)
+        if response is not None:
+            return response
+        decode = route.decode
+        args = (decode(request.prior_state), decode(request.planned_state), decode(request.config))
+        return _Call(route.handler, args, partial(_applied, route, request))
+
+    def _prepare_import(self, request: ImportResourceState.Request) -> Any:
+        route = self._get_route('ImportResourceState', request.type_name)
+        if route is None:
+            return ImportResourceState.Response(diagnostics=_unsupported('ImportResourceState', request.type_name))
+        return _Call(route.handler, (request.id,), partial(_imported, route, request))
+
+    def _prepare_read_data(self, request: ReadDataSource.Request) -> Any:
+        route = self._get_route('ReadDataSource', request.type_name)
+        if route is None:
+            return ReadDataSource.Response(diagnostics=_unsupported('ReadDataSource', request.type_name))
+        return _Call(route.handler, (route.codec.decode(request.config),), partial(_data_read, route))
+
     def ValidateDataSourceConfig(self, request: ValidateDataSourceConfig.Request,
                                  context: Any) -> ValidateDataSourceConfig.Response:
-        return ValidateDataSourceConfig.Response()
+        return _call(self._prepare_validate(
+            'ValidateDataSourceConfig', ValidateDataSourceConfig.Response, request), context)
 
     def ValidateResourceTypeConfig(self, request: ValidateResourceTypeConfig.Request,
                                    context: Any) -> ValidateResourceTypeConfig.Response:
-        return ValidateResourceTypeConfig.Response()
+        return _call(self._prepare_validate(
+            'ValidateResourceTypeConfig', ValidateResourceTypeConfig.Response, request), context)
+
+    def UpgradeResourceState(self, request: UpgradeResourceState.Request,
+                             context: Any) -> UpgradeResourceState.Response:
+        return _call(self._prepare_upgrade(request), context)
+
+    def ReadResource(self, request: ReadResource.Request, context: Any) -> ReadResource.Response:
+        return _call(self._prepare_read(request), context)
+
+    def PlanResourceChange(self, request: PlanResourceChange.Request, context: Any) -> PlanResourceChange.Response:
+        return _call(self._prepare_plan(request), context)
+
+    def ApplyResourceChange(self, request: ApplyResourceChange.Request,
+                            context: Any) -> ApplyResourceChange.Response:
+        return _call(self._prepare_apply(request), context)
+
+    def ImportResourceState(self, request: ImportResourceState.Request,
+                            context: Any) -> ImportResourceState.Response:
+        return _call(self._prepare_import(request), context)
+
+    def ReadDataSource(self, request: ReadDataSource.Request, context: Any) -> ReadDataSource.Response:
+        return _call(self._prepare_read_data(request), context)
 
     def Stop(self, request: Stop.Request, context: Any) -> Stop.Response:
         if self.server:
             self.server.stop(0)
         return super().Stop(request, context)
+
+
+def _get_metadata(schema_bytes: bytes) -> GetMetadata.Response:
+    response = GetProviderSchema.Response.FromString(schema_bytes)
+    return GetMetadata.Response(
+        server_capabilities=response.server_capabilities,
+        diagnostics=response.diagnostics,
+        resources=[GetMetadata.ResourceMetadata(type_name=type_name) for type_name in response.resource_schemas],
+        data_sources=[
+            GetMetadata.DataSourceMetadata(type_name=type_name)
+            for type_name in response.data_source_schemas
+        ],
+    )
+
+
+async def _call_async(prepared: Any, context: Any) -> Any:
+    """
+    Like `_call`, awaiting the handler when it's a coroutine function (defaults of `schema.Resource` aren't).
+    """
+    if not isinstance(prepared, _Call):
+        return prepared
+    result = prepared.handler(*prepared.args, context)
+    if inspect.isawaitable(result):
+        result = await result
+    return prepared.finish(result)
+
+
+class AsyncProviderBase(ProviderBase):
+    """
+    RPC handlers are coroutines served from a single asyncio event loop by `grpc.aio`,
+    so awaiting upstream APIs doesn't hold a thread per in-flight call. They override sync handlers
+    of `ProviderBase`, which type checkers don't allow.
+    """
+
+    def _has_custom_schema(self) -> bool:
+        return type(self).GetSchema is not AsyncProviderBase.GetSchema
+
+    async def GetMetadata(self, request: GetMetadata.Request,  # type: ignore[override]
+                          context: Any) -> GetMetadata.Response:
+        if self._has_custom_schema():
+            return _get_metadata(await self._serve_schema_async(GetProviderSchema.Request(), context))
+        return self.get_metadata()
+
+    async def GetSchema(self, request: GetProviderSchema.Request,  # type: ignore[override]
+                        context: Any) -> GetProviderSchema.Response:
+        return self.get_schema()
+
+    def _get_schema_handler(self) -> Callable:
+        return self._serve_schema_async
+
+    async def _serve_schema_async(self, request: GetProviderSchema.Request, context: Any) -> bytes:
+        schema_bytes, fingerprint = self._prepare_schema()
+        if schema_bytes is None:
+            return self._remember_schema(await self.GetSchema(request, context), fingerprint)
+        return schema_bytes
+
+    async def Configure(self, request: Configure.Request, context: Any) -> Configure.Response:  # type: ignore[override]
+        return Configure.Response()
+
+    async def PrepareProviderConfig(self, request: PrepareProviderConfig.Request,  # type: ignore[override]
+                                    context: Any) -> PrepareProviderConfig.Response:
+        return PrepareProviderConfig.Response()
+
+    async def ValidateDataSourceConfig(self, request: ValidateDataSourceConfig.Request,  # type: ignore[override]
+                                       context: Any) -> ValidateDataSourceConfig.Response:
+        return await _call_async(self._prepare_validate(
+            'ValidateDataSourceConfig', ValidateDataSourceConfig.Response, request), context)
+
+    async def ValidateResourceTypeConfig(self, request: ValidateResourceTypeConfig.Request,  # type: ignore[override]
+                                         context: Any) -> ValidateResourceTypeConfig.Response:
+        return await _call_async(self._prepare_validate(
+            'ValidateResourceTypeConfig', ValidateResourceTypeConfig.Response, request), context)
+
+    async def UpgradeResourceState(self, request: UpgradeResourceState.Request,  # type: ignore[override]
+                                   context: Any) -> UpgradeResourceState.Response:
+        return await _call_async(self._prepare_upgrade(request), context)
+
+    async def ReadResource(self, request: ReadResource.Request,  # type: ignore[override]
+                           context: Any) -> ReadResource.Response:
+        return await _call_async(self._prepare_read(request), context)
+
+    async def PlanResourceChange(self, request: PlanResourceChange.Request,  # type: ignore[override]
+                                 context: Any) -> PlanResourceChange.Response:
+        return await _call_async(self._prepare_plan(request), context)
+
+    async def ApplyResourceChange(self, request: ApplyResourceChange.Request,  # type: ignore[override]
+                                  context: Any) -> ApplyResourceChange.Response:
+        return await _call_async(self._prepare_apply(request), context)
+
+    async def ImportResourceState(self, request: ImportResourceState.Request,  # type: ignore[override]
+                                  context: Any) -> ImportResourceState.Response:
+        return await _call_async(self._prepare_import(request), context)
+
+    async def ReadDataSource(self, request: ReadDataSource.Request,  # type: ignore[override]
+                             context: Any) -> ReadDataSource.Response:
+        return await _call_async(self._prepare_read_data(request), context)
+
+    async def Stop(self, request: Stop.Request, context: Any) -> Stop.Response:  # type: ignore[override]
+        if self.server:
+            import asyncio
+            # stopping waits for in-flight RPCs, this one included, so it can't be awaited here
+            asyncio.ensure_future(self.server.stop(0))
+        return Stop.Response()
@@ -0,0 +1,286 @@
+"""
+Declarative schema of provider configuration, resources and data sources:
+
+    class Server(schema.Resource):
+        type_name = 'example_server'
+
+        name = schema.Attribute(cty.String, required=True)
+        address = schema.Attribute(cty.String, computed=True)
+        disk = schema.NestedBlock(Disk, schema.Nesting.LIST, max_items=4)
+
+        def read(self, state, context):
+            state['address'] = lookup(state['name'])
+            return state
+
+Schema protobuf messages are generated from classes once and cached on them. Resources and data sources also
+handle their RPCs, provider instantiates each of them once and dispatches requests by `type_name`.
+
+Providers with many types declare them with `Lazy` (or `entry_points`), so their modules are imported
+only when requested.
+"""
+import importlib
+import sys
+import threading
+from typing import Any, Iterable, Iterator, List, Optional, Set, Type, Union, TYPE_CHECKING
+
+from terraform_plugin import codec, cty, lazy
+from terraform_plugin.proto.tfplugin54_pb2 import Diagnostic, Schema
+
+if TYPE_CHECKING:
+    from terraform_plugin.provider import ProviderBase
+
+Nesting = Schema.NestedBlock.NestingMode
+
+
+class Attribute:
+    def __init__(self, type: cty.Type, description: str = '', required: bool = False, optional: bool = False,
+                 computed: bool = False, sensitive: bool = False, requires_replace: bool = False, name: str = None):
+        """
+        :param requires_replace: changing the attribute replaces the resource, see `diff.requires_replace`
+        :param name: name in Terraform, defaults to name of the class attribute
+        """
+        if required and (optional or computed):
+            raise ValueError('required attribute cannot be optional or computed')
+        if not (required or optional or computed):
+            raise ValueError('attribute must be required, optional or computed')
+        self.type = type
+        self.description = description
+        self.required = required
+        self.optional = optional
+        self.computed = computed
+        self.sensitive = sensitive
+        self.requires_replace = requires_replace
+        self.name = name or ''
+
+    def __set_name__(self, owner, name):
+        if not self.name:
+            self.name = name
+
+    def to_proto(self) -> Schema.Attribute:
+        return Schema.Attribute(
+            name=self.name,
+            type=bytes(self.type),
+            description=self.description,
+            required=self.required,
+            optional=self.optional,
+            computed=self.computed,
+            sensitive=self.sensitive,
+        )
+
+
+class NestedBlock:
+    def __init__(self, block: Type['Block'], nesting: Nesting = Nesting.LIST, min_items: int = 0, max_items: int = 0,
+                 requires_replace: bool = False, name: str = None):
+        self.block = block
+        self.nesting = nesting
+        self.min_items = min_items
+        self.max_items = max_items
+        self.requires_replace = requires_replace
+        self.name = name or ''
+
+    def __set_name__(self, owner, name):
+        if not self.name:
+            self.name = name
+
+    def to_proto(self) -> Schema.NestedBlock:
+        return Schema.NestedBlock(
+            type_name=self.name,
+            block=self.block.to_proto(),
+            nesting=self.nesting,
+            min_items=self.min_items,
+            max_items=self.max_items,
+        )
+
+
+class Block:
+    """
+    Attributes and nested blocks are declared as class attributes, including ones inherited from base classes.
+    """
+    version = 0
+    # cached per class by `to_proto`, `get_codec` and `get_lazy_codec`
+    _proto: Schema.Block
+    _codec: codec.BlockCodec
+    _lazy_codec: lazy.LazyCodec
+
+    @classmethod
+    def fields(cls) -> Iterator[Union[Attribute, NestedBlock]]:
+        seen: Set[str] = set()
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, (Attribute, NestedBlock)) and name not in seen:
+                    seen.add(name)
+                    yield getattr(cls, name)
+
+    @classmethod
+    def to_proto(cls) -> Schema.Block:
+        # not inherited by subclasses
+        proto = cls.__dict__.get('_proto')
+        if proto is None:
+            fields = list(cls.fields())
+            proto = Schema.Block(
+                attributes=[field.to_proto() for field in fields if isinstance(field, Attribute)],
+                block_types=[field.to_proto() for field in fields if isinstance(field, NestedBlock)],
+            )
+            cls._proto = proto
+        return proto
+
+    @classmethod
+    def to_schema(cls) -> Schema:
+        return Schema(version=cls.version, block=cls.to_proto())
+
+    @classmethod
+    def get_codec(cls) -> codec.BlockCodec:
+        block_codec = cls.__dict__.get('_codec')
+        if block_codec is None:
+            block_codec = cls._codec = codec.BlockCodec(cls.to_proto())
+        return block_codec
+
+    @classmethod
+    def mark_unknown(cls, value: Any) -> Any:
+        """
+        Sets null computed attributes of `value` and its nested blocks to `codec.Unknown`, as planned on create.
+        """
+        if value is None or value is codec.Unknown:
+            return value
+        for field in cls.fields():
+            if isinstance(field, Attribute):
+                if field.computed and value.get(field.name) is None:
+                    value[field.name] = codec.Unknown
+                continue
+            nested = value.get(field.name)
+            if nested is None or nested is codec.Unknown:
+                continue
+            if field.nesting in (Nesting.SINGLE, Nesting.GROUP):
+                field.block.mark_unknown(nested)
+            else:
+                for element in (nested.values() if field.nesting == Nesting.MAP else nested):
+                    field.block.mark_unknown(element)
+        return value
+
+    @classmethod
+    def get_lazy_codec(cls) -> lazy.LazyCodec:
+        lazy_codec = cls.__dict__.get('_lazy_codec')
+        if lazy_codec is None:
+            lazy_codec = cls._lazy_codec = lazy.LazyCodec(cls.to_proto(), cls.get_codec())
+        return lazy_codec
+
+
+class Resource(Block):
+    """
+    Values passed to and returned from handlers are decoded and encoded with `get_codec()`, `None` is null.
+    Handlers not overridden keep values Terraform sent, `apply` and `import_state` must be implemented to support
+    creating and importing resources. Handlers of `AsyncProviderBase` resources are coroutines.
+    """
+    type_name = ''
+    # `plan` and `apply` aren't called when state Terraform sent doesn't change, planned state is the same bytes
+    skip_unchanged = True
+    # `read`, `plan` and `apply` get `lazy.LazyMap` views decoding values they access, returned unmodified views
+    # are encoded as bytes Terraform sent
+    lazy_state = False
+
+    def __init__(self, provider: 'ProviderBase' = None):
+        self.provider = provider
+
+    def validate(self, config: Any, context: Any) -> Iterable[Diagnostic]:
+        return ()
+
+    def upgrade(self, version: int, state: Any, context: Any) -> Any:
+        """
+        :param version: schema version `state` was stored with
+        """
+        return state
+
+    def read(self, state: Any, context: Any) -> Any:
+        return state
+
+    def plan(self, prior_state: Any, proposed_state: Any, config: Any, context: Any) -> Any:
+        """
+        :param prior_state: `None` when creating the resource
+        :param proposed_state: `None` when destroying the resource
+        :return: planned state, computed attributes not known until apply are `codec.Unknown`
+        """
+        if prior_state is None:
+            return self.mark_unknown(proposed_state)
+        return proposed_state
+
+    def apply(self, prior_state: Any, planned_state: Any, config: Any, context: Any) -> Any:
+        """
+        :param prior_state: `None` when creating the resource
+        :param planned_state: `None` when destroying the resource
+        :return: new state, `None` when the resource was destroyed
+        """
+        raise NotImplementedError()
+
+    def import_state(self, id: str, context: Any) -> Iterable[Any]:
+        """
+        :return: states of imported resources, Terraform reads them afterwards
+        """
+        raise NotImplementedError()
+
+
+class DataSource(Block):
+    """
+    See `Resource`, `read` must be implemented.
+    """
+    type_name = ''
+
+    def __init__(self, provider: 'ProviderBase' = None):
+        self.provider = provider
+
+    def validate(self, config: Any, context: Any) -> Iterable[Diagnostic]:
+        return ()
+
+    def read(self, config: Any, context: Any) -> Any:
+        raise NotImplementedError()
+
+
+class Lazy:
+    """
+    Resource or data source imported on first use:
+
+        resources = (schema.Lazy('example_server', 'example.server:Server'),)
+    """
+
+    def __init__(self, type_name: str, path: str):
+        """
+        :param path: `module:qualified.name` of the class
+        """
+        self.type_name = type_name
+        self.path = path
+        self.module_name, _, self.qualname = path.partition(':')
+        if not self.module_name or not self.qualname:
+            raise ValueError(f'invalid import path {path!r} of {type_name}, expected module:name')
+        self._block: Optional[Type[Union[Resource, DataSource]]] = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.type_name!r}, {self.path!r})'
+
+    def load(self) -> Type[Union[Resource, DataSource]]:
+        block = self._block
+        if block is None:
+            with self._lock:
+                block = self._block
+                if block is None:
+                    loaded: Any = importlib.import_module(self.module_name)
+                    for name in self.qualname.split('.'):
+                        loaded = getattr(loaded, name)
+                    if loaded.type_name != self.type_name:
+                        raise ValueError(f'{self!r} loaded {loaded.type_name}')
+                    block = self._block = loaded
+        return block
+
+
+def entry_points(group: str) -> List[Lazy]:
+    """
+    :return: types registered in entry point `group` of installed distributions, named by their `type_name`
+    """
+    if sys.version_info >= (3, 8):
+        from importlib import metadata
+        installed: Any = metadata.entry_points()
+        # selecting entry points by group was added in Python 3.10
+        found = installed.select(group=group) if hasattr(installed, 'select') else installed.get(group, ())
+        return [Lazy(entry_point.name, entry_point.value) for entry_point in found]
+    import pkg_resources
+    return [Lazy(entry_point.name, f'{entry_point.module_name}:{".".join(entry_point.attrs)}')
+            for entry_point in pkg_resources.iter_entry_points(group)]
@@ -0,0 +1,98 @@
+"""
+On-disk cache of serialized `GetProviderSchema.Response`, so every provider process spawned by Terraform
+doesn't build the same schema again.
+
+Entries are keyed by a fingerprint of source files (path, size and modification time) of packages defining
+the schema, `terraform_plugin` itself and versions of libraries serializing it, changing any of them results
+in a new entry.
+"""
+import hashlib
+import importlib.util
+import logging
+import platform
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Set
+
+from google import protobuf
+
+from terraform_plugin import cache
+
+log = logging.getLogger(__name__)
+
+
+def _source_files(module_name: str) -> Iterator[Path]:
+    """
+    :return: source files of top-level package of `module_name` without importing it
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        if module.__spec__ is None:
+            # scripts executed directly have no spec to look the package up by
+            path = getattr(module, '__file__', None)
+            if path:
+                yield Path(path)
+            return
+        # `__main__` of `python -m`
+        module_name = module.__spec__.name
+
+    try:
+        spec = importlib.util.find_spec(module_name.partition('.')[0])
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None:
+        raise ValueError(f'cannot find module {module_name}')
+    if spec.submodule_search_locations:
+        for location in spec.submodule_search_locations:
+            yield from sorted(path for path in Path(location).rglob('*.py') if '__pycache__' not in path.parts)
+    elif spec.origin and spec.has_location:
+        yield Path(spec.origin)
+
+
+def get_fingerprint(name: str, module_names: Iterable[str]) -> str:
+    """
+    :param name: identifies provider within its modules, eg. qualified class name
+    :param module_names: modules defining the schema
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{name}\0{platform.python_version()}\0{protobuf.__version__}\0'.encode())
+    files: Set[Path] = set()
+    for module_name in sorted({*module_names, __name__}):
+        for path in _source_files(module_name):
+            if path in files:
+                continue
+            files.add(path)
+            # the same check Python does to validate bytecode caches, without reading the sources
+            info = path.stat()
+            digest.update(f'{path}\0{info.st_size}\0{info.st_mtime_ns}\0'.encode())
+    return digest.hexdigest()
+
+
+def _get_path(fingerprint: str) -> Optional[Path]:
+    directory = cache.get_cache_dir('schema')
+    return directory and directory / f'{fingerprint}.pb'
+
+
+def load(fingerprint: str) -> Optional[bytes]:
+    path = _get_path(fingerprint)
+    if path is None:
+        return None
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        log.warning(f'failed to read cached schema {path}: {e}')
+        return None
+
+
+def store(fingerprint: str, data: bytes):
+    path = _get_path(fingerprint)
+    if path is None:
+        return
+    try:
+        cache.atomic_write(path, data)
+    except OSError as e:
+        log.warning(f'failed to cache schema at {path}: {e}')
+    else:
+        log.debug(f'cached schema at {path}')
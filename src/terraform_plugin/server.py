@@ -1,60 +1,261 @@
 import base64
+import json
 import logging
 import os
-import random
+import shutil
+import socket
 import sys
+import tempfile
 import time
-from concurrent import futures
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+# imported before anything heavy to timestamp the end of interpreter startup
+from terraform_plugin import timing
 
 import grpc
 
-from terraform_plugin.proto import tfplugin51_pb2_grpc
-from terraform_plugin.crypto import get_server_credentials
-from terraform_plugin.provider import ProviderBase
-from terraform_plugin import constants
+from terraform_plugin.provider import AsyncProviderBase, ProviderBase
+from terraform_plugin import constants, executor, workers
 
 log = logging.getLogger(__name__)
 
 
-# https://github.com/hashicorp/terraform/blob/7816e61614095355c140344f048bb8c323a04066/plugin/serve.go
-def serve(provider: ProviderBase):
-    proto_type = 'grpc'
-    port = random.randint(49152, 61000)
-    listener_addr_network = 'tcp'
-    listener_addr_string = f'127.0.0.1:{port}'
+def get_provider_address(executable: str = None) -> str:
+    """
+    Derives provider address from the executable name, eg. `terraform-provider-example` becomes `example`,
+    which Terraform resolves as `registry.terraform.io/hashicorp/example`.
+    """
+    name = Path(executable or sys.argv[0]).name
+    if name.startswith(constants.ProviderExecutablePrefix):
+        name = name[len(constants.ProviderExecutablePrefix):]
+    return name.split('_')[0]
+
+
+def format_reattach_providers(provider_address: str, network: str, address: str) -> str:
+    """
+    https://github.com/hashicorp/terraform/blob/v0.13.0/command/meta_providers.go#L376-L395
+
+    `Test` prevents Terraform from killing the process after each command.
+    """
+    return json.dumps({
+        provider_address: {
+            'Protocol': 'grpc',
+            'ProtocolVersion': constants.get_protocol_version(),
+            'Pid': os.getpid(),
+            'Test': True,
+            'Addr': {
+                'Network': network,
+                'String': address,
+            },
+        },
+    })
+
+
+def _add_port(server: grpc.Server, address: str, credentials: Optional[grpc.ServerCredentials]) -> int:
+    if credentials:
+        port = server.add_secure_port(address, credentials)
+    else:
+        port = server.add_insecure_port(address)
+    # older gRPC versions report failure by returning 0 instead of raising
+    if not port:
+        raise RuntimeError(f'failed to bind to {address}')
+    return port
+
 
+def add_listener(
+        server: grpc.Server,
+        credentials: Optional[grpc.ServerCredentials] = None,
+        network: str = None,
+) -> Tuple[str, str, Optional[str]]:
+    """
+    https://github.com/hashicorp/go-plugin/blob/v1.3.0/server.go#L400-L448
+
+    Listens on a Unix socket in a private directory when supported, otherwise on a TCP port assigned by the kernel,
+    so concurrently starting providers never collide.
+
+    :param network: `unix` or `tcp`, picked automatically by default
+    :return: network and address for the handshake, directory to remove after the server stops
+    """
+    if network in (None, 'unix') and hasattr(socket, 'AF_UNIX'):
+        directory = tempfile.mkdtemp(prefix='plugin', dir=os.getenv(constants.UnixSocketDirKey))
+        path = os.path.join(directory, 'plugin.sock')
+        try:
+            _add_port(server, f'unix:{path}', credentials)
+            return 'unix', path, directory
+        except RuntimeError as e:
+            shutil.rmtree(directory, ignore_errors=True)
+            if network:
+                raise
+            log.debug(f'falling back to TCP: {e}')
+
+    port = _add_port(server, '127.0.0.1:0', credentials)
+    return 'tcp', f'127.0.0.1:{port}', None
+
+
+def get_credentials(daemon: bool = False) -> Tuple[Optional[grpc.ServerCredentials], str]:
+    """
+    :return: server credentials and base64 encoded certificate for the handshake, both empty when TLS is not used
+    """
+    if daemon or not os.getenv(constants.PluginCertKey):
+        # go-plugin reattach does not support TLS
+        return None, ''
+
+    # `cryptography` is slow to import, load it only when Terraform asks for TLS
+    from terraform_plugin.crypto import get_server_credentials
     server_credentials, server_certificate_bytes = get_server_credentials()
+    timing.mark('credentials')
+
     certificate = base64.b64encode(server_certificate_bytes).decode('utf8')
     log.debug(f'Client Certificate: {os.getenv(constants.PluginCertKey)!r}')
     log.debug(f'Server Certificate: {certificate}')
-    certificate = certificate.rstrip('=')
+    return server_credentials, certificate.rstrip('=')
 
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
 
-    tfplugin51_pb2_grpc.add_ProviderServicer_to_server(provider, server)
-    provider.bind(server)
+def announce(
+        network: str,
+        address: str,
+        certificate: str = '',
+        daemon: bool = False,
+        provider_address: str = None,
+):
+    """
+    Outputs go-plugin handshake line or, in daemon mode, `TF_REATTACH_PROVIDERS` descriptor.
+    """
+    proto_type = 'grpc'
+    if daemon:
+        reattach = format_reattach_providers(provider_address or get_provider_address(), network, address)
+        log.info(f'Provider started, to attach Terraform set {constants.ReattachProvidersKey} environment variable')
+        print(f"export {constants.ReattachProvidersKey}='{reattach}'")
+    else:
+        pieces = [
+            constants.CoreProtocolVersion,
+            constants.get_protocol_version(),
+            network,
+            address,
+            proto_type,
+        ]
+        if certificate:
+            pieces.append(certificate)
+        print('|'.join(map(str, pieces)))
+    sys.stdout.flush()
+    timing.mark('handshake')
 
-    pieces = [
-        constants.CoreProtocolVersion,
-        constants.get_protocol_version(),
-        listener_addr_network,
-        listener_addr_string,
-        proto_type,
-    ]
 
-    if server_credentials:
-        server.add_secure_port(listener_addr_string, server_credentials)
-        pieces.append(certificate)
-    else:
-        server.add_insecure_port(listener_addr_string)
+# https://github.com/hashicorp/terraform/blob/7816e61614095355c140344f048bb8c323a04066/plugin/serve.go
+def serve(
+        provider: ProviderBase,
+        daemon: bool = None,
+        provider_address: str = None,
+        network: str = None,
+        max_workers: int = None,
+        adaptive: bool = None,
+        processes: int = None,
+):
+    """
+    :param provider: `AsyncProviderBase` instances are served from an asyncio event loop,
+        without `adaptive` thread pool and worker `processes`
+    :param daemon: keep serving many Terraform invocations from a single process, Terraform attaches to it
+        through `TF_REATTACH_PROVIDERS` printed on startup instead of spawning the provider.
+        Defaults to `TF_PLUGIN_DAEMON` environment variable.
+    :param provider_address: key of `TF_REATTACH_PROVIDERS`, derived from executable name by default
+    :param network: `unix` or `tcp`, Unix socket is preferred by default
+    :param max_workers: size of the thread pool, defaults to `TF_PLUGIN_MAX_WORKERS` or Terraform's parallelism
+    :param adaptive: grow and shrink the thread pool up to `max_workers` by observed queueing delay,
+        defaults to `TF_PLUGIN_ADAPTIVE_WORKERS` environment variable
+    :param processes: number of worker processes for CPU-bound RPCs, see `terraform_plugin.workers`,
+        defaults to `TF_PLUGIN_PROCESSES` environment variable, `auto` uses one per CPU
+    """
+    timing.start()
+    timing.mark('imported')
+    if daemon is None:
+        daemon = constants.is_daemon()
+
+    if isinstance(provider, AsyncProviderBase):
+        if adaptive or processes and processes > 1:
+            raise ValueError('adaptive thread pool and worker processes are not supported by AsyncProviderBase')
+        if constants.is_enabled(constants.AdaptiveWorkersKey) or os.getenv(constants.ProcessesKey):
+            log.warning(f'{constants.AdaptiveWorkersKey} and {constants.ProcessesKey} are ignored by AsyncProviderBase')
+        import asyncio
+        try:
+            asyncio.run(serve_async(provider, daemon, provider_address, network, max_workers))
+        except KeyboardInterrupt:
+            pass
+        return
+
+    served: Union[ProviderBase, workers.MultiProcessProvider] = provider
+    processes = workers.get_processes(processes)
+    if processes > 1:
+        served = workers.MultiProcessProvider(provider, processes)
+
+    server_credentials, certificate = get_credentials(daemon)
+
+    pool = executor.create_executor(max_workers, adaptive)
+    server = grpc.server(pool, interceptors=(
+        *timing.get_interceptors(),
+        executor.QueueWaitInterceptor(),
+    ))
+    timing.mark('server_created')
+
+    served.add_to_server(server)
+    if not daemon:
+        # Stop must not shut down a process shared between Terraform invocations
+        served.bind(server)
+
+    listener_addr_network, listener_addr_string, socket_dir = add_listener(server, server_credentials, network)
+    timing.mark('port_bound')
 
     server.start()
 
-    # Output information
-    print('|'.join(map(str, pieces)))
-    sys.stdout.flush()
+    announce(listener_addr_network, listener_addr_string, certificate, daemon, provider_address)
     try:
         while True:
             time.sleep(constants.ONE_DAY_IN_SECONDS)
     except KeyboardInterrupt:
         server.stop(0.2)
+    finally:
+        log.debug(f'worker pool: {pool.stats}')
+        if socket_dir:
+            shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+async def serve_async(
+        provider: AsyncProviderBase,
+        daemon: bool = False,
+        provider_address: str = None,
+        network: str = None,
+        max_workers: int = None,
+):
+    """
+    Serves coroutine RPC handlers of `AsyncProviderBase` with `grpc.aio`, which requires grpcio 1.32+.
+    """
+    try:
+        from grpc import aio
+    except ImportError as e:
+        raise RuntimeError('AsyncProviderBase requires grpcio>=1.32 with grpc.aio support') from e
+
+    server_credentials, certificate = get_credentials(daemon)
+
+    server = aio.server(
+        # runs RPC handlers left synchronous by the provider
+        migration_thread_pool=executor.create_executor(max_workers),
+        interceptors=timing.get_interceptors(aio=True),
+    )
+    timing.mark('server_created')
+
+    provider.add_to_server(server)
+    if not daemon:
+        provider.bind(server)
+
+    listener_addr_network, listener_addr_string, socket_dir = add_listener(server, server_credentials, network)
+    timing.mark('port_bound')
+
+    await server.start()
+
+    announce(listener_addr_network, listener_addr_string, certificate, daemon, provider_address)
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(0.2)
+        if socket_dir:
+            shutil.rmtree(socket_dir, ignore_errors=True)
@@ -0,0 +1,206 @@
+"""
+Copy-on-write state, modifying a copy never modifies values it was created from:
+
+    planned = state.merge(prior_state, proposed_state)
+    planned['rule'][3]['port'] = 443  # copies `planned['rule']` and `planned['rule'][3]`, nothing else
+
+Nested values are shared with the source and copied one level at a time when accessed, so the cost scales
+with the number of modified paths instead of the size of the state. `CowDict` and `CowList` are `dict` and `list`
+subclasses, they are encoded and compared like the plain ones.
+"""
+from typing import Any, Iterable, Mapping, Optional, Union
+
+
+def cow(value: Any) -> Any:
+    """
+    :return: copy-on-write copy of `dict` or `list`, other values as they are
+    """
+    return _adopt(None, value)
+
+
+def _share(value: Any):
+    """
+    Makes nested values of copy-on-write `value` shared, after copying it both copies them before modifying.
+    """
+    if type(value) is CowDict or type(value) is CowList:
+        value._token = object()
+
+
+def _adopt(owner: Optional[object], value: Any) -> Any:
+    """
+    :param owner: token of the container `value` is read from
+    :return: `value` when it was copied by the container already, otherwise its copy
+    """
+    cls = type(value)
+    if cls is CowDict or cls is CowList:
+        if owner is not None and value._owner is owner:
+            return value
+    elif cls is not dict and cls is not list:
+        return value
+    copy: Union[CowDict, CowList] = CowDict(value) if cls is dict or cls is CowDict else CowList(value)
+    copy._owner = owner
+    return copy
+
+
+class CowDict(dict):
+    # `_token` identifies nested values copied by this dict, they hold it in `_owner`
+    __slots__ = ('_owner', '_token')
+
+    def __init__(self, *args, **kwargs):
+        if args and type(args[0]) is CowDict:
+            _share(args[0])
+            # storage is copied directly, nested values stay shared
+            args = (dict.items(args[0]),)
+        dict.__init__(self, *args, **kwargs)
+        self._owner = None
+        self._token = object()
+
+    def _own(self):
+        token = self._token
+        for key, value in dict.items(self):
+            copy = _adopt(token, value)
+            if copy is not value:
+                dict.__setitem__(self, key, copy)
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        copy = _adopt(self._token, value)
+        if copy is not value:
+            dict.__setitem__(self, key, copy)
+        return copy
+
+    def __iter__(self):
+        # not inherited, so `dict(value)` and `{**value}` read values with `__getitem__` instead of the storage
+        return dict.__iter__(self)
+
+    def copy(self):
+        return CowDict(self)
+
+    __copy__ = copy
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        return merge(self, other)
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        return merge(other, self)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+
+    def pop(self, key, *default):
+        return cow(dict.pop(self, key, *default))
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        return key, cow(value)
+
+    def values(self):
+        self._own()
+        return dict.values(self)
+
+    def items(self):
+        self._own()
+        return dict.items(self)
+
+    def __reduce__(self):
+        _share(self)
+        return self.__class__, (dict(dict.items(self)),)
+
+
+class CowList(list):
+    __slots__ = ('_owner', '_token')
+
+    def __init__(self, values: Iterable = ()):
+        if isinstance(values, CowList):
+            _share(values)
+            values = list.__getitem__(values, slice(None))
+        list.__init__(self, values)
+        self._owner = None
+        self._token = object()
+
+    def _own(self):
+        token = self._token
+        for i, value in enumerate(list.__iter__(self)):
+            copy = _adopt(token, value)
+            if copy is not value:
+                list.__setitem__(self, i, copy)
+
+    def __getitem__(self, index):
+        if type(index) is slice:
+            _share(self)
+            return CowList(list.__getitem__(self, index))
+        value = list.__getitem__(self, index)
+        copy = _adopt(self._token, value)
+        if copy is not value:
+            list.__setitem__(self, index, copy)
+        return copy
+
+    def __iter__(self):
+        self._own()
+        return list.__iter__(self)
+
+    def __reversed__(self):
+        self._own()
+        return list.__reversed__(self)
+
+    def pop(self, index=-1):
+        return cow(list.pop(self, index))
+
+    def copy(self):
+        return CowList(self)
+
+    __copy__ = copy
+
+    def __add__(self, other):
+        if not isinstance(other, list):
+            return NotImplemented
+        result = CowList(self)
+        result.extend(other)
+        return result
+
+    def __radd__(self, other):
+        if not isinstance(other, list):
+            return NotImplemented
+        result = CowList(other)
+        result.extend(self)
+        return result
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def extend(self, values: Iterable):
+        if isinstance(values, CowList):
+            # storage is read directly, nested values become shared
+            _share(values)
+            values = list.__getitem__(values, slice(None))
+        list.extend(self, values)
+
+    def __reduce__(self):
+        _share(self)
+        return self.__class__, (list.__getitem__(self, slice(None)),)
+
+
+def merge(base: Optional[Mapping], *updates: Optional[Mapping]) -> CowDict:
+    """
+    :return: copy of `base` (`None` is empty) with keys of `updates` (`None` skipped) replaced,
+     sharing nested values with all of them
+    """
+    merged = CowDict(base or ())
+    for update in updates:
+        if update is not None:
+            _share(update)
+            dict.update(merged, dict.items(update) if isinstance(update, CowDict) else update)
+    return merged
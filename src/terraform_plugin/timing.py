@@ -0,0 +1,166 @@
+"""
+Opt-in startup phase timings enabled by pointing `TF_PLUGIN_TIMING_FILE` at a file.
+
+Every provider process appends a single JSON line to it, so timings of all processes spawned during
+a Terraform run can be aggregated with `python -m terraform_plugin.timing FILE`.
+Phases are recorded in seconds since the process was started (or forked).
+"""
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+from terraform_plugin import constants
+
+# read again by `start()`, processes forked by the zygote get their environment after the fork
+_path = os.getenv(constants.TimingFileKey)
+_lock = threading.Lock()
+_phases: Dict[str, float] = {}
+_written = False
+
+
+def _process_started() -> Optional[float]:
+    """
+    :return: `time.monotonic()`-like timestamp of process start, only available on Linux
+    """
+    try:
+        with open('/proc/self/stat') as f:
+            # process name may contain spaces, fields after it are numbered from 3
+            fields = f.read().rpartition(')')[2].split()
+        start_ticks = int(fields[22 - 3])
+        elapsed = time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf('SC_CLK_TCK')
+    except (AttributeError, OSError, ValueError, IndexError):
+        return None
+    return time.monotonic() - elapsed
+
+
+_process_start = _process_started()
+if _process_start is None:
+    _started = time.monotonic()
+    _phases['startup'] = 0.0
+else:
+    _started = _process_start
+    # interpreter start up to the moment `terraform_plugin.timing` got imported
+    _phases['startup'] = time.monotonic() - _started
+
+
+def _forked():
+    global _started, _lock, _written
+    _started = time.monotonic()
+    _lock = threading.Lock()
+    _phases.clear()
+    _phases['startup'] = 0.0
+    _written = False
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forked)  # type: ignore[call-arg]
+
+
+def start():
+    """
+    Reads `TF_PLUGIN_TIMING_FILE` of the process about to serve.
+    """
+    global _path
+    _path = os.getenv(constants.TimingFileKey)
+
+
+def enabled() -> bool:
+    return bool(_path)
+
+
+def mark(phase: str):
+    if _path:
+        _phases.setdefault(phase, time.monotonic() - _started)
+
+
+def flush():
+    """
+    Appends the record once, later calls are no-ops.
+    """
+    global _written
+    if not _path:
+        return
+    with _lock:
+        if _written:
+            return
+        _written = True
+        record = dict(
+            pid=os.getpid(),
+            ppid=os.getppid(),
+            argv=sys.argv,
+            time=time.time(),
+            phases=_phases,
+        )
+        line = (json.dumps(record) + '\n').encode()
+        # a single O_APPEND write keeps lines of concurrent processes intact
+        fd = os.open(_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+
+if __name__ != '__main__':
+    atexit.register(flush)
+
+
+def _on_rpc():
+    if not _written:
+        mark('first_rpc')
+        flush()
+
+
+def get_interceptors(aio: bool = False):
+    """
+    :param aio: return interceptors for `grpc.aio` server
+    :return: gRPC server interceptors completing the record on first RPC
+    """
+    if not _path:
+        return ()
+
+    import grpc
+
+    if aio:
+        from grpc import aio as grpc_aio
+
+        class AsyncFirstRPCInterceptor(grpc_aio.ServerInterceptor):
+            async def intercept_service(self, continuation, handler_call_details):
+                _on_rpc()
+                return await continuation(handler_call_details)
+
+        return AsyncFirstRPCInterceptor(),
+
+    class FirstRPCInterceptor(grpc.ServerInterceptor):
+        def intercept_service(self, continuation, handler_call_details):
+            _on_rpc()
+            return continuation(handler_call_details)
+
+    return FirstRPCInterceptor(),
+
+
+def summarize(path: str):
+    import statistics
+
+    samples: Dict[str, list] = {}
+    count = 0
+    with open(path) as f:
+        for line in f:
+            count += 1
+            for phase, value in json.loads(line)['phases'].items():
+                samples.setdefault(phase, []).append(value * 1000)
+
+    print(f'{count} processes')
+    print(f'{"phase":<16} {"count":>6} {"median ms":>10} {"max ms":>10}')
+    for phase, values in sorted(samples.items(), key=lambda item: statistics.median(item[1])):
+        print(f'{phase:<16} {len(values):>6} {statistics.median(values):>10.1f} {max(values):>10.1f}')
+
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else _path
+    if not path:
+        sys.exit(f'usage: python -m terraform_plugin.timing FILE, defaults to {constants.TimingFileKey}')
+    summarize(path)
@@ -0,0 +1,209 @@
+"""
+Pre-forked worker processes running CPU-bound RPCs past the GIL.
+
+Terraform multiplexes all RPCs over a single connection, so instead of sharing the listener
+the gRPC server in the main process passes serialized requests to an idle worker and its serialized
+response back, without parsing either of them.
+"""
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import traceback
+from typing import Any, Optional, Tuple
+
+import grpc
+
+from terraform_plugin import constants
+from terraform_plugin.proto import tfplugin54_pb2
+from terraform_plugin.provider import SERVICE_NAME, ProviderBase
+
+log = logging.getLogger(__name__)
+
+DISPATCHED_METHODS = (
+    'ValidateResourceTypeConfig',
+    'ValidateDataSourceConfig',
+    'UpgradeResourceState',
+    'ReadResource',
+    'PlanResourceChange',
+    'ApplyResourceChange',
+    'ImportResourceState',
+    'ReadDataSource',
+)
+
+
+def get_processes(processes: int = None) -> int:
+    if processes:
+        return processes
+    value = os.getenv(constants.ProcessesKey)
+    if not value:
+        return 1
+    if value == 'auto':
+        return os.cpu_count() or 1
+    return int(value)
+
+
+class WorkerError(Exception):
+    pass
+
+
+class WorkerContext:
+    """
+    Stand-in for gRPC context inside worker processes, status set on it is applied to the real one.
+    """
+
+    def __init__(self):
+        self.code: Optional[grpc.StatusCode] = None
+        self.details: Optional[str] = None
+
+    def set_code(self, code: grpc.StatusCode):
+        self.code = code
+
+    def set_details(self, details: str):
+        self.details = details
+
+    def abort(self, code: grpc.StatusCode, details: str):
+        self.code, self.details = code, details
+        raise WorkerError(details)
+
+    def invocation_metadata(self):
+        return ()
+
+    def is_active(self):
+        return True
+
+
+def _work(provider: ProviderBase, conn):
+    while True:
+        try:
+            method, data = conn.recv_bytes(), conn.recv_bytes()
+        except EOFError:
+            return
+        method = method.decode()
+        context = WorkerContext()
+        try:
+            request = getattr(tfplugin54_pb2, method).Request.FromString(data)
+            result = getattr(provider, method)(request, context).SerializeToString()
+        except Exception:
+            result = None
+            if context.code is None:
+                context.code = grpc.StatusCode.UNKNOWN
+            if context.details is None:
+                context.details = traceback.format_exc()
+        conn.send((result, context.code and context.code.name, context.details))
+
+
+class Worker:
+    def __init__(self, provider: ProviderBase, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_work, args=(provider, child_conn), name='ProviderWorker', daemon=True)
+        self.process.start()
+        child_conn.close()
+        # generation of `Configure` request applied in this worker
+        self.configured = 0
+        # set when the process can't be talked to anymore
+        self.broken = False
+
+    def call(self, method: str, data: bytes) -> Tuple[Optional[bytes], Optional[str], Optional[str]]:
+        """
+        :return: serialized response or `None` on failure, name of status code and details set by the handler
+        """
+        try:
+            self.conn.send_bytes(method.encode())
+            self.conn.send_bytes(data)
+            return self.conn.recv()
+        except (EOFError, OSError) as e:
+            self.broken = True
+            self.process.join(1)
+            raise WorkerError(f'worker process {self.process.pid} exited with {self.process.exitcode}') from e
+
+    def close(self):
+        self.conn.close()
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(1)
+
+
+class MultiProcessProvider:
+    """
+    Serves `DISPATCHED_METHODS` of `provider` from `processes` forked copies of it, other RPCs run in the main process.
+
+    `Configure` runs in the main process and is replayed in every worker before it handles its next request,
+    so each of them holds the same provider state.
+    """
+
+    def __init__(self, provider: ProviderBase, processes: int):
+        self.provider = provider
+        # workers must be forked before gRPC starts its threads
+        self._context = multiprocessing.get_context('fork' if hasattr(os, 'fork') else 'spawn')
+        self.workers = [Worker(provider, self._context) for _ in range(processes)]
+        self.idle: 'queue.Queue[Worker]' = queue.Queue()
+        for worker in self.workers:
+            self.idle.put(worker)
+
+        self._lock = threading.Lock()
+        self._configure_request: Optional[bytes] = None
+        self._configured = 0
+        log.info(f'started {processes} worker processes')
+
+    def bind(self, server: grpc.Server = None):
+        self.provider.bind(server)
+
+    def call(self, method: str, data: bytes, context: Any) -> Optional[bytes]:
+        worker: Worker = self.idle.get()
+        try:
+            with self._lock:
+                configured, configure_request = self._configured, self._configure_request
+            if worker.configured != configured and configure_request is not None:
+                result, code, details = worker.call('Configure', configure_request)
+                if result is None:
+                    raise WorkerError(f'Configure failed in worker process {worker.process.pid}: {details}')
+                worker.configured = configured
+            result, code, details = worker.call(method, data)
+        finally:
+            if worker.broken:
+                worker = self._replace(worker)
+            self.idle.put(worker)
+
+        if code is not None:
+            if result is None:
+                context.abort(grpc.StatusCode[code], details)
+            context.set_code(grpc.StatusCode[code])
+            context.set_details(details)
+        return result
+
+    def _replace(self, worker: Worker) -> Worker:
+        """
+        :return: new worker in place of the exited one, `Configure` is replayed in it before its first request
+        """
+        log.warning(f'replacing worker process {worker.process.pid} exited with {worker.process.exitcode}')
+        worker.close()
+        replacement = Worker(self.provider, self._context)
+        with self._lock:
+            self.workers[self.workers.index(worker)] = replacement
+        return replacement
+
+    def Configure(self, data: bytes, context: Any) -> bytes:
+        response = self.provider.Configure(tfplugin54_pb2.Configure.Request.FromString(data), context)
+        with self._lock:
+            self._configure_request = data
+            self._configured += 1
+        return response.SerializeToString()
+
+    def _dispatch(self, method: str):
+        def handler(data: bytes, context: Any) -> Optional[bytes]:
+            return self.call(method, data, context)
+
+        return handler
+
+    def add_to_server(self, server: grpc.Server):
+        # without (de)serializers handlers receive and return raw bytes
+        handlers = {
+            method: grpc.unary_unary_rpc_method_handler(self._dispatch(method))
+            for method in DISPATCHED_METHODS
+        }
+        handlers['Configure'] = grpc.unary_unary_rpc_method_handler(self.Configure)
+        server.add_generic_rpc_handlers((grpc.method_handlers_generic_handler(SERVICE_NAME, handlers),))
+        # remaining methods are looked up by gRPC in the next handlers
+        self.provider.add_to_server(server)
@@ -0,0 +1,248 @@
+"""
+Fork-server keeping a warm interpreter with provider code imported, executables launched by Terraform
+connect to it and hand over their stdio, a forked child then performs go-plugin handshake on their behalf.
+
+This module must import only standard library modules, it is loaded by the shim on every Terraform spawn.
+
+    $ python -m terraform_plugin.zygote terraform_provider_example:ExampleProvider --socket /tmp/example.sock
+    $ TF_PLUGIN_ZYGOTE_SOCKET=/tmp/example.sock terraform apply
+"""
+import argparse
+import array
+import gc
+import importlib
+import json
+import logging
+import os
+import signal
+import socket
+import struct
+import sys
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+from terraform_plugin import constants
+
+log = logging.getLogger(__name__)
+
+PRELOAD_MODULES = (
+    'grpc',
+    'msgpack',
+    'cryptography.x509',
+    'cryptography.hazmat.backends',
+    'cryptography.hazmat.primitives.asymmetric.ec',
+    'terraform_plugin.proto.tfplugin54_pb2',
+    'terraform_plugin.proto.tfplugin54_pb2_grpc',
+    'terraform_plugin.crypto',
+    'terraform_plugin.server',
+)
+STDIO_FDS = (0, 1, 2)
+_header = struct.Struct('!I')
+
+
+def resolve(path: str):
+    """
+    Resolves `package.module:attribute` import path.
+    """
+    module_name, _, attribute = path.partition(':')
+    obj = importlib.import_module(module_name)
+    for name in filter(None, attribute.split('.')):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _send(sock: socket.socket, payload: dict, fds=STDIO_FDS):
+    data = json.dumps(payload).encode()
+    sock.sendmsg(
+        [_header.pack(len(data)), data],
+        [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array('i', fds).tobytes())],
+    )
+
+
+def _receive(sock: socket.socket) -> Tuple[dict, List[int]]:
+    fds = array.array('i')
+    msg, ancdata, flags, addr = sock.recvmsg(65536, socket.CMSG_LEN(len(STDIO_FDS) * fds.itemsize))
+    for level, kind, cmsg_data in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(cmsg_data[:len(cmsg_data) - (len(cmsg_data) % fds.itemsize)])
+
+    size, = _header.unpack_from(msg)
+    data = bytearray(msg[_header.size:])
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError('shim disconnected during handshake')
+        data += chunk
+    return json.loads(data.decode()), list(fds)
+
+
+def launch(socket_path: str = None) -> Optional[int]:
+    """
+    Asks a running zygote to serve the provider for this process.
+
+    :return: exit code of the forked provider or `None` when zygote is not configured or not running
+    """
+    socket_path = socket_path or os.getenv(constants.ZygoteSocketKey)
+    if not socket_path:
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError as e:
+        log.debug(f'zygote at {socket_path} is not available: {e}')
+        sock.close()
+        return None
+
+    with sock:
+        _send(sock, dict(
+            argv=sys.argv,
+            env=dict(os.environ),
+            cwd=os.getcwd(),
+        ))
+        # the child keeps the connection open for its lifetime, closing the shim terminates it
+        status = sock.recv(1)
+    if not status:
+        log.warning('provider process exited without reporting its status')
+        return 1
+    return status[0]
+
+
+def _watch_shim(conn: socket.socket):
+    while conn.recv(1):
+        pass
+    # interrupts serve() in the main thread, so it stops the server and cleans up after itself
+    os.kill(os.getpid(), signal.SIGINT)
+    time.sleep(5)
+    os._exit(0)
+
+
+def _run_child(conn: socket.socket, payload: dict, fds: List[int], factory: Callable, identity=None):
+    gc.enable()
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+    for target, fd in zip(STDIO_FDS, fds):
+        os.dup2(fd, target)
+        os.close(fd)
+
+    os.environ.clear()
+    os.environ.update(payload['env'])
+
+    from terraform_plugin import crypto
+    # after the environment is replaced, so identities generated later use the provider's key algorithm
+    crypto.reset_identity_pool([identity] if identity else [])
+    os.chdir(payload['cwd'])
+    sys.argv = payload['argv']
+
+    threading.Thread(target=_watch_shim, args=(conn,), daemon=True).start()
+
+    from terraform_plugin import server
+    server.serve(factory())
+
+
+def _fork(conn: socket.socket, listener: socket.socket, factory: Callable):
+    from terraform_plugin import crypto
+
+    payload, fds = _receive(conn)
+    # every child gets its own pre-generated identity, the pool refills in background
+    env = payload['env']
+    identity = None
+    if env.get(constants.PluginCertKey):
+        identity = crypto.take_pooled_identity(env.get(constants.KeyAlgorithmKey))
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    with crypto.fork_lock():
+        pid = os.fork()
+    if pid:
+        log.debug(f'forked provider process {pid}')
+        conn.close()
+        for fd in fds:
+            os.close(fd)
+        return
+
+    code = 1
+    try:
+        listener.close()
+        _run_child(conn, payload, fds, factory, identity)
+        code = 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        log.exception('provider process failed')
+    finally:
+        try:
+            sys.stdout.flush()
+            conn.send(bytes([code & 0xff]))
+        finally:
+            os._exit(code)
+
+
+def preload(factory_path: str, identity_pool: int = 0) -> Callable:
+    gc.disable()
+    for name in PRELOAD_MODULES:
+        importlib.import_module(name)
+    factory = resolve(factory_path)
+
+    if identity_pool:
+        from terraform_plugin import crypto
+        crypto.start_identity_pool(identity_pool)
+
+    # move everything imported so far out of reach of the collector, so children don't copy-on-write it
+    gc.freeze()
+    gc.enable()
+    return factory
+
+
+def serve(factory_path: str, socket_path: str, identity_pool: int = 2):
+    """
+    :param identity_pool: number of TLS identities generated ahead of time, 0 disables the pool
+    """
+    factory = preload(factory_path, identity_pool)
+    # children are never waited for, let the kernel reap them
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        listener.bind(socket_path)
+    finally:
+        os.umask(old_umask)
+    listener.listen(64)
+    log.info(f'zygote for {factory_path} listening on {socket_path}, set {constants.ZygoteSocketKey} to use it')
+
+    try:
+        while True:
+            conn, _ = listener.accept()
+            try:
+                _fork(conn, listener, factory)
+            except Exception:
+                log.exception('failed to fork provider process')
+                conn.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        os.unlink(socket_path)
+
+
+def _main():
+    parser = argparse.ArgumentParser(prog='python -m terraform_plugin.zygote')
+    parser.add_argument('factory', help='provider class or factory, eg. terraform_provider_example:ExampleProvider')
+    parser.add_argument('--socket', default=os.getenv(constants.ZygoteSocketKey), required=False)
+    parser.add_argument('--identity-pool', type=int, default=2,
+                        help='number of TLS identities generated ahead of time, 0 disables it')
+    args = parser.parse_args()
+    if not args.socket:
+        parser.error(f'--socket or {constants.ZygoteSocketKey} is required')
+
+    logging.basicConfig(level='INFO')
+    serve(args.factory, args.socket, args.identity_pool)
+
+
+if __name__ == '__main__':
+    _main()
@@ -1,22 +1,8 @@
-import json
 import logging
 import sys
-from copy import deepcopy
 from typing import Any
 
-import msgpack
-
-from terraform_plugin import provider, server
-from terraform_plugin.proto.tfplugin51_pb2 import (
-    GetProviderSchema,
-    Schema,
-    ReadDataSource,
-    DynamicValue,
-    ApplyResourceChange,
-    PlanResourceChange,
-    ReadResource,
-    UpgradeResourceState,
-)
+from terraform_plugin import cty, provider, schema, server
 
 log = logging.getLogger(__name__)
 
@@ -24,151 +10,65 @@ data_source_key = 'example_example'
 resource_key = 'example_example'
 
 
-class ExampleProvider(provider.ProviderBase):
+class ComputedString(schema.Block):
+    computed_string = schema.Attribute(cty.String, computed=True)
+
+
+class ComputedAttributes(ComputedString):
+    computed_int = schema.Attribute(cty.Number, computed=True)
+    computed_float = schema.Attribute(cty.Number, computed=True)
+    computed_true = schema.Attribute(cty.Bool, computed=True)
+    computed_false = schema.Attribute(cty.Bool, computed=True)
+    computed_map = schema.Attribute(cty.Map(cty.String), computed=True)
+    computed_list = schema.Attribute(cty.List(cty.String), computed=True)
+    computed_set = schema.Attribute(cty.Set(cty.String), computed=True)
+
+
+class ExampleResource(schema.Resource):
+    type_name = resource_key
+
+    input = schema.Attribute(cty.String, required=True)
+    output = schema.Attribute(cty.String, computed=True)
+
+    def read(self, state: Any, context: Any) -> Any:
+        state['output'] = 'outputted: ' + state['input']
+        return state
+
+    def plan(self, prior_state: Any, proposed_state: Any, config: Any, context: Any) -> Any:
+        if proposed_state is not None:
+            proposed_state['output'] = 'outputted: ' + proposed_state['input']
+        return proposed_state
+
+    def apply(self, prior_state: Any, planned_state: Any, config: Any, context: Any) -> Any:
+        return planned_state
+
+    def import_state(self, id: str, context: Any) -> Any:
+        return [{'input': id, 'output': 'outputted: ' + id}]
+
+
+class ExampleDataSource(ComputedAttributes, schema.DataSource):
     """
     Test schema types defined in https://www.terraform.io/docs/extend/schemas/schema-types.html
     Test nested schema types defined in https://github.com/hashicorp/terraform/blob/88e76fa9ef219d28bd626da2756ebb483daa8756/configs/configschema/schema.go#L82-L130
     """
+    type_name = data_source_key
 
-    def GetSchema(self, request: GetProviderSchema.Request, context: Any) -> GetProviderSchema.Response:
-        log.debug(f'{self.__class__.__name__}.GetSchema(request={request!r}, context={context!r})')
-        computed_string = [
-            Schema.Attribute(
-                name='computed_string',
-                type=b'"string"',
-                computed=True,
-            )
-        ]
-        computed_attributes = [
-            *computed_string,
-            Schema.Attribute(
-                name='computed_int',
-                type=b'"number"',
-                computed=True,
-            ),
-            Schema.Attribute(
-                name='computed_float',
-                type=b'"number"',
-                computed=True,
-            ),
-            Schema.Attribute(
-                name='computed_true',
-                type=b'"bool"',
-                computed=True,
-            ),
-            Schema.Attribute(
-                name='computed_false',
-                type=b'"bool"',
-                computed=True,
-            ),
-            Schema.Attribute(
-                name='computed_map',
-                type=json.dumps(["map", "string"]).encode(),
-                computed=True,
-            ),
-            Schema.Attribute(
-                name='computed_list',
-                type=json.dumps(["list", "string"]).encode(),
-                computed=True,
-            ),
-            Schema.Attribute(
-                name='computed_set',
-                type=json.dumps(["set", "string"]).encode(),
-                computed=True,
-            ),
-        ]
-        response = GetProviderSchema.Response(
-            provider=Schema(
-                block=Schema.Block(
-                    attributes=[
-                    ]
-                ),
-            ),
-            resource_schemas={
-                resource_key: Schema(
-                    block=Schema.Block(
-                        attributes=[
-                            Schema.Attribute(
-                                name='input',
-                                type=b'"string"',
-                                required=True,
-                            ),
-                            Schema.Attribute(
-                                name='output',
-                                type=b'"string"',
-                                computed=True,
-                            ),
-                        ]
-                    )
-                ),
-            },
-            data_source_schemas={
-                data_source_key: Schema(
-                    block=Schema.Block(
-                        attributes=[
-                            Schema.Attribute(
-                                name='input',
-                                type=b'"string"',
-                                required=True,
-                            ),
-                            Schema.Attribute(
-                                name='output',
-                                type=b'"string"',
-                                computed=True,
-                            ),
-                            *computed_attributes,
-                        ],
-                        block_types=[
-                            Schema.NestedBlock(
-                                type_name='nested_single',
-                                nesting=Schema.NestedBlock.NestingMode.SINGLE,
-                                block=Schema.Block(
-                                    attributes=computed_string,
-                                )
-                            ),
-                            Schema.NestedBlock(
-                                type_name='nested_list',
-                                nesting=Schema.NestedBlock.NestingMode.LIST,
-                                block=Schema.Block(
-                                    attributes=computed_string,
-                                )
-                            ),
-                            Schema.NestedBlock(
-                                type_name='nested_set',
-                                nesting=Schema.NestedBlock.NestingMode.SET,
-                                block=Schema.Block(
-                                    attributes=computed_string,
-                                )
-                            ),
-                            Schema.NestedBlock(
-                                type_name='nested_map',
-                                nesting=Schema.NestedBlock.NestingMode.MAP,
-                                block=Schema.Block(
-                                    attributes=computed_string,
-                                )
-                            ),
-                            Schema.NestedBlock(
-                                type_name='nested_group',
-                                nesting=Schema.NestedBlock.NestingMode.GROUP,
-                                block=Schema.Block(
-                                    attributes=computed_string,
-                                )
-                            ),
-                        ]
-                    )
-                )
-            }
-        )
-        return response
+    input = schema.Attribute(cty.String, required=True)
+    output = schema.Attribute(cty.String, computed=True)
+
+    nested_single = schema.NestedBlock(ComputedString, schema.Nesting.SINGLE)
+    nested_list = schema.NestedBlock(ComputedString, schema.Nesting.LIST)
+    nested_set = schema.NestedBlock(ComputedString, schema.Nesting.SET)
+    nested_map = schema.NestedBlock(ComputedString, schema.Nesting.MAP)
+    nested_group = schema.NestedBlock(ComputedString, schema.Nesting.GROUP)
 
-    def ReadDataSource(self, request: ReadDataSource.Request, context: Any) -> ReadDataSource.Response:
-        assert request.type_name == data_source_key
-        data = msgpack.loads(request.config.msgpack, encoding='utf-8')
+    def read(self, config: Any, context: Any) -> Any:
         computed_string = {
             'computed_string': 'computed_string_value',
         }
-        data.update({
-            'output': data['input'],
+        # attributes and blocks left out are encoded as nulls or empty collections
+        config.update({
+            'output': config['input'],
             **computed_string,
             'computed_int': 123,
             'computed_float': 123.456,
@@ -179,8 +79,6 @@ class ExampleProvider(provider.ProviderBase):
             },
             'computed_list': ['val1', 'val2', 'val3'],
             'computed_set': ['entry1', 'entry2', 'entry3'],
-        })
-        data.update({
             'nested_single': computed_string,
             'nested_group': computed_string,
             'nested_list': [computed_string],
@@ -189,72 +87,12 @@ class ExampleProvider(provider.ProviderBase):
                 'key1': computed_string,
             }
         })
-        msgpack_bytes = msgpack.packb(data, use_bin_type=True)
-        value = DynamicValue(
-            msgpack=msgpack_bytes
-        )
-        response = ReadDataSource.Response(
-            state=value
-        )
-        return response
-
-    def ReadResource(self, request: ReadResource.Request, context: Any) -> ReadResource.Response:
-        assert request.type_name == resource_key
-        old_state = msgpack.loads(request.current_state.msgpack, encoding='utf-8') or {}
-
-        new_state = deepcopy(old_state)
-        new_state['output'] = 'outputted: ' + new_state.get('input', '<MISSING>')
-        return ReadResource.Response(
-            new_state=DynamicValue(
-                msgpack=msgpack.packb(new_state, use_bin_type=True)
-            )
-        )
-
-    def PlanResourceChange(self, request: PlanResourceChange.Request, context: Any) -> PlanResourceChange.Response:
-        assert request.type_name == resource_key
-        old_state = msgpack.loads(request.prior_state.msgpack, encoding='utf-8') or {}
-        proposed_state = msgpack.loads(request.proposed_new_state.msgpack, encoding='utf-8') or {}
-
-        new_state = deepcopy(old_state)
-        new_state.update(deepcopy(proposed_state))
-        new_state['output'] = 'outputted: ' + new_state['input']
-        return PlanResourceChange.Response(
-            planned_state=DynamicValue(
-                msgpack=msgpack.packb(new_state, use_bin_type=True)
-            )
-        )
+        return config
 
-    def ApplyResourceChange(self, request: ApplyResourceChange.Request, context: Any) -> ApplyResourceChange.Response:
-        assert request.type_name == resource_key
 
-        old_state = msgpack.loads(request.prior_state.msgpack, encoding='utf-8') or {}
-        planned_state = msgpack.loads(request.planned_state.msgpack, encoding='utf-8') or {}
-
-        new_state = deepcopy(old_state)
-        new_state.update(deepcopy(planned_state))
-        new_state['output'] = 'outputted: ' + new_state['input']
-        return PlanResourceChange.Response(
-            planned_state=DynamicValue(
-                msgpack=msgpack.packb(new_state, use_bin_type=True)
-            )
-        )
-
-    def UpgradeResourceState(self, request: UpgradeResourceState.Request,
-                             context: Any) -> UpgradeResourceState.Response:
-        assert request.type_name == resource_key
-
-        old_state = json.loads(request.raw_state.json)
-
-        new_state = deepcopy(old_state)
-
-        # # this will trigger permanently changed plan
-        # new_state['output'] = 'upgraded: ' + new_state['input']
-
-        return UpgradeResourceState.Response(
-            upgraded_state=DynamicValue(
-                msgpack=msgpack.packb(new_state, use_bin_type=True)
-            )
-        )
+class ExampleProvider(provider.ProviderBase):
+    resources = (ExampleResource,)
+    data_sources = (ExampleDataSource,)
 
 
 if __name__ == '__main__':